@@ -0,0 +1,3 @@
+"""Benchmarks of RxPY. Run ``python -m benchmarks --help`` for the
+suite runner, or a single module such as ``python -m
+benchmarks.priorityqueue`` for the standalone comparisons."""
@@ -0,0 +1,191 @@
+"""Creation, subscription and subject benchmarks."""
+import random
+
+import rx
+from rx import operators as ops
+from rx.core import Observable
+from rx.disposable import CompositeDisposable, Disposable
+from rx.subjects import Subject, BehaviorSubject, ReplaySubject
+
+from .suite import timed
+
+
+def noop(*_):
+    pass
+
+
+@timed('create', unit='ns/op')
+def of(n):
+    def round_():
+        for _ in range(n):
+            rx.of(1, 2, 3)
+    return round_
+
+
+@timed('create', unit='ns/op')
+def from_iterable(n):
+    values = list(range(10))
+
+    def round_():
+        for _ in range(n):
+            rx.from_(values)
+    return round_
+
+
+@timed('create', unit='ns/op')
+def create(n):
+    def subscribe(observer, scheduler=None):
+        observer.on_completed()
+
+    def round_():
+        for _ in range(n):
+            rx.create(subscribe)
+    return round_
+
+
+@timed('create', unit='ns/op')
+def pipe(n):
+    source = rx.never()
+
+    def round_():
+        for _ in range(n):
+            source.pipe(ops.map(noop), ops.filter(noop), ops.take(1))
+    return round_
+
+
+@timed('subscribe', unit='ns/op')
+def never(n):
+    source = rx.never()
+
+    def round_():
+        for _ in range(n):
+            source.subscribe_(noop).dispose()
+    return round_
+
+
+@timed('subscribe', unit='ns/op')
+def empty(n):
+    source = rx.empty()
+
+    def round_():
+        for _ in range(n):
+            source.subscribe_(noop)
+    return round_
+
+
+@timed('subscribe', unit='ns/op')
+def observer(n):
+    source = rx.of(1)
+
+    def round_():
+        for _ in range(n):
+            source.subscribe(noop)
+    return round_
+
+
+@timed('subscribe', unit='ns/op')
+def pipeline(n):
+    source = rx.never().pipe(ops.map(noop), ops.filter(noop), ops.scan(noop), ops.take(1))
+
+    def round_():
+        for _ in range(n):
+            source.subscribe_(noop).dispose()
+    return round_
+
+
+@timed('subscribe', unit='ns/op')
+def subject(n):
+    source = Subject()
+
+    def round_():
+        for _ in range(n):
+            source.subscribe_(noop).dispose()
+    return round_
+
+
+@timed('source')
+def from_list(n):
+    source = rx.from_(list(range(n)))
+
+    def round_():
+        source.subscribe_(noop)
+    return round_
+
+
+@timed('source', name='range')
+def range_(n):
+    source = rx.range(0, n)
+
+    def round_():
+        source.subscribe_(noop)
+    return round_
+
+
+@timed('source')
+def create_loop(n):
+    def subscribe(observer, scheduler=None):
+        on_next = observer.on_next
+        for i in range(n):
+            on_next(i)
+        observer.on_completed()
+
+    source = Observable(subscribe)
+
+    def round_():
+        source.subscribe_(noop)
+    return round_
+
+
+def subject_fan_out(subject_type, observers, n):
+    subject = subject_type()
+    for _ in range(observers):
+        subject.subscribe_(noop)
+    on_next = subject.on_next
+
+    def round_():
+        for i in range(n):
+            on_next(i)
+    return round_
+
+
+@timed('subject', name='on_next_1')
+def subject_on_next_1(n):
+    return subject_fan_out(Subject, 1, n)
+
+
+@timed('subject', name='on_next_10')
+def subject_on_next_10(n):
+    return subject_fan_out(Subject, 10, n)
+
+
+@timed('subject', name='behavior_on_next_1')
+def behavior_subject_on_next(n):
+    return subject_fan_out(lambda: BehaviorSubject(0), 1, n)
+
+
+@timed('subject', name='replay_on_next_1')
+def replay_subject_on_next(n):
+    return subject_fan_out(lambda: ReplaySubject(100), 1, n)
+
+
+@timed('subject', name='replay_window_on_next_1')
+def replay_subject_window_on_next(n):
+    return subject_fan_out(lambda: ReplaySubject(1000, window=60.0), 1, n)
+
+
+@timed('disposable', unit='ns/op')
+def composite_add_remove(n):
+    """Adds n disposables to a group and removes them again in random
+    order, as inner subscriptions of flat_map complete."""
+
+    items = [Disposable() for _ in range(n)]
+    removals = items[:]
+    random.Random(42).shuffle(removals)
+
+    def round_():
+        group = CompositeDisposable()
+        for item in items:
+            group.add(item)
+        for item in removals:
+            group.remove(item)
+    return round_
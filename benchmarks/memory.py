@@ -0,0 +1,70 @@
+"""Memory held by live subscriptions, measured with tracemalloc."""
+import gc
+import tracemalloc
+
+import rx
+from rx import operators as ops
+from rx.subjects import Subject
+
+from .suite import measured
+
+SUBSCRIPTIONS = 1000
+
+
+def noop(*_):
+    pass
+
+
+def bytes_per_subscription(subscribe):
+    """Returns the memory allocated by subscribe and still held while
+    the subscriptions are alive, divided by their number."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        subscriptions = [subscribe() for _ in range(SUBSCRIPTIONS)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    for subscription in subscriptions:
+        subscription.dispose()
+    return size / SUBSCRIPTIONS
+
+
+@measured('memory', unit='bytes')
+def never():
+    source = rx.never()
+    return bytes_per_subscription(lambda: source.subscribe_(noop))
+
+
+@measured('memory', unit='bytes')
+def subject():
+    source = Subject()
+    return bytes_per_subscription(lambda: source.subscribe_(noop))
+
+
+@measured('memory', unit='bytes')
+def pipeline():
+    source = Subject().pipe(ops.map(noop), ops.filter(noop), ops.scan(noop), ops.distinct_until_changed())
+    return bytes_per_subscription(lambda: source.subscribe_(noop))
+
+
+@measured('memory', unit='bytes')
+def merge():
+    source = rx.merge(Subject(), Subject(), Subject())
+    return bytes_per_subscription(lambda: source.subscribe_(noop))
+
+
+@measured('memory', unit='bytes')
+def combine_latest():
+    source = rx.combine_latest(Subject(), Subject())
+    return bytes_per_subscription(lambda: source.subscribe_(noop))
+
+
+@measured('memory', unit='bytes')
+def interval():
+    source = rx.interval(3600.0)
+    return bytes_per_subscription(lambda: source.subscribe_(noop))
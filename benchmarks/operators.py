@@ -0,0 +1,142 @@
+"""Per-element throughput of the most used operators.
+
+Every benchmark subscribes a synchronous source of ``n`` integers
+through a single operator, so the numbers include the cost of the
+source and of one subscription per round.
+"""
+import rx
+from rx import operators as ops
+from rx.internal.basic import identity
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+from .suite import timed
+
+
+def noop(*_):
+    pass
+
+
+def add(acc, x):
+    return acc + x
+
+
+# Operator factories by benchmark name, called with the number of
+# elements and the list of elements.
+OPERATORS = [
+    ('map', lambda n, data: ops.map(lambda x: x + 1)),
+    ('filter', lambda n, data: ops.filter(lambda x: x & 1)),
+    ('scan', lambda n, data: ops.scan(add, 0)),
+    ('reduce', lambda n, data: ops.reduce(add, 0)),
+    ('take', lambda n, data: ops.take(n)),
+    ('skip', lambda n, data: ops.skip(n // 2)),
+    ('take_while', lambda n, data: ops.take_while(lambda x: True)),
+    ('skip_while', lambda n, data: ops.skip_while(lambda x: x < n // 2)),
+    ('distinct', lambda n, data: ops.distinct(lambda x: x % 1000)),
+    ('distinct_until_changed', lambda n, data: ops.distinct_until_changed(lambda x: x // 4)),
+    ('pairwise', lambda n, data: ops.pairwise()),
+    ('start_with', lambda n, data: ops.start_with(-1)),
+    ('do_action', lambda n, data: ops.do_action(noop)),
+    ('materialize', lambda n, data: ops.materialize()),
+    ('default_if_empty', lambda n, data: ops.default_if_empty(0)),
+    ('element_at', lambda n, data: ops.element_at(n - 1)),
+    ('first', lambda n, data: ops.first(lambda x: x == n - 1)),
+    ('last', lambda n, data: ops.last()),
+    ('count', lambda n, data: ops.count()),
+    ('sum', lambda n, data: ops.sum()),
+    ('average', lambda n, data: ops.average()),
+    ('min', lambda n, data: ops.min()),
+    ('max', lambda n, data: ops.max()),
+    ('to_iterable', lambda n, data: ops.to_iterable()),
+    ('statistics', lambda n, data: ops.statistics()),
+    ('buffer_with_count', lambda n, data: ops.buffer_with_count(100)),
+    ('window_with_count', lambda n, data: rx.pipe(ops.window_with_count(100), ops.merge_all())),
+    ('group_by', lambda n, data: rx.pipe(ops.group_by(lambda x: x % 10), ops.merge_all())),
+    ('flat_map', lambda n, data: ops.flat_map(rx.return_value)),
+    ('merge', lambda n, data: ops.merge(rx.from_(data))),
+    ('concat', lambda n, data: ops.concat(rx.from_(data))),
+    ('zip', lambda n, data: ops.zip(rx.from_(data))),
+    ('combine_latest', lambda n, data: ops.combine_latest(rx.from_(data))),
+    ('with_latest_from', lambda n, data: ops.with_latest_from(rx.return_value(0))),
+    ('catch', lambda n, data: ops.catch(rx.empty())),
+    ('retry', lambda n, data: ops.retry(2)),
+    ('sequence_equal', lambda n, data: ops.sequence_equal(rx.from_(data))),
+    ('map_filter_scan', lambda n, data: rx.pipe(ops.map(lambda x: x + 1), ops.filter(lambda x: x & 1),
+                                                ops.scan(add, 0))),
+]
+
+
+def register(name, factory):
+    @timed('operator', name=name)
+    def bench(n):
+        data = list(range(n))
+        source = rx.from_(data).pipe(factory(n, data))
+
+        def round_():
+            source.subscribe_(noop)
+        return round_
+
+
+for _name, _factory in OPERATORS:
+    register(_name, _factory)
+
+
+
+WIDTH = 1000
+
+
+@timed('operator', name='combine_latest_wide')
+def combine_latest_wide(n):
+    """Updates spread over 1000 subjects combined with combine_latest."""
+
+    subjects = [Subject() for _ in range(WIDTH)]
+
+    def round_():
+        disposable = rx.combine_latest(*subjects).subscribe_(noop)
+        for i in range(n):
+            subjects[i % WIDTH].on_next(i)
+        disposable.dispose()
+    return round_
+
+
+@timed('operator', name='combine_latest_keyed_wide')
+def combine_latest_keyed_wide(n):
+    """Updates spread over 1000 keyed subjects combined with
+    combine_latest_keyed."""
+
+    subjects = [Subject() for _ in range(WIDTH)]
+    source = rx.from_(list(enumerate(subjects))).pipe(ops.combine_latest_keyed())
+
+    def round_():
+        disposable = source.subscribe_(noop)
+        for i in range(n):
+            subjects[i % WIDTH].on_next(i)
+        disposable.dispose()
+    return round_
+
+
+def join_pairs(n, operator):
+    """Joins two subjects of n distinct keys. The window never expires,
+    so it grows to n elements on each side."""
+
+    orders, fills = Subject(), Subject()
+
+    def round_():
+        disposable = orders.pipe(operator(fills)).subscribe_(noop)
+        for i in range(n):
+            orders.on_next(i)
+            fills.on_next(i)
+        disposable.dispose()
+    return round_
+
+
+@timed('operator', name='join', elements=2000)
+def join(n):
+    return join_pairs(n, lambda right: rx.pipe(
+        ops.join(right, lambda _: rx.never(), lambda _: rx.never()),
+        ops.filter(lambda pair: pair[0] == pair[1])))
+
+
+@timed('operator', name='join_on', elements=2000)
+def join_on(n):
+    return join_pairs(n, lambda right: ops.join_on(right, identity, identity, 3600, scheduler=TestScheduler()))
@@ -0,0 +1,60 @@
+"""Micro-benchmark comparing the scheduler priority queues.
+
+Usage:
+    python -m benchmarks.priorityqueue [size]
+"""
+import sys
+import random
+from timeit import default_timer
+
+from rx.internal.priorityqueue import PriorityQueue, IndexedPriorityQueue
+
+
+class Item:
+    __slots__ = ('duetime',)
+
+    def __init__(self, duetime):
+        self.duetime = duetime
+
+    def __lt__(self, other):
+        return self.duetime < other.duetime
+
+    def __eq__(self, other):
+        return self.duetime == other.duetime
+
+
+def bench_enqueue_dequeue(queue_type, items):
+    queue = queue_type()
+    start = default_timer()
+    for item in items:
+        queue.enqueue(item)
+    while queue:
+        queue.dequeue()
+    return default_timer() - start
+
+
+def bench_remove(queue_type, items, removals):
+    queue = queue_type()
+    for item in items:
+        queue.enqueue(item)
+
+    start = default_timer()
+    for item in removals:
+        queue.remove(item)
+    return default_timer() - start
+
+
+def main(size=100000):
+    rnd = random.Random(42)
+    items = [Item(rnd.random()) for _ in range(size)]
+    removals = rnd.sample(items, min(size, 1000))
+
+    print("%-22s %14s %14s" % ("queue", "enqueue+dequeue", "remove x%d" % len(removals)))
+    for queue_type in (PriorityQueue, IndexedPriorityQueue):
+        elapsed = bench_enqueue_dequeue(queue_type, items)
+        removed = bench_remove(queue_type, items, removals)
+        print("%-22s %14.4fs %14.4fs" % (queue_type.__name__, elapsed, removed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
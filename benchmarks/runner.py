@@ -0,0 +1,129 @@
+"""Command line runner of the benchmark suite.
+
+Usage:
+    python -m benchmarks [pattern ...] [--repeat N] [--scale F]
+                         [--json FILE] [--compare FILE] [--threshold F]
+                         [--list]
+
+Examples:
+    Save a baseline before upgrading and compare against it afterwards.
+    The exit status is 1 if any benchmark regressed by more than the
+    threshold.
+
+    $ python -m benchmarks --json baseline.json
+    $ python -m benchmarks --compare baseline.json --json current.json
+
+    Only run the operator and subject benchmarks.
+
+    $ python -m benchmarks operator. subject.
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from . import suite
+
+# Importing the modules registers their benchmarks
+from . import core, operators, schedulers, memory  # noqa: F401 pylint: disable=unused-import
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        from importlib.metadata import version
+        rx_version = version('Rx')
+    except Exception:  # pylint: disable=broad-except
+        rx_version = None
+
+    return OrderedDict([
+        ('rx', rx_version),
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('platform', platform.platform()),
+        ('processor', platform.processor()),
+        ('date', datetime.datetime.now(datetime.timezone.utc).isoformat()),
+    ])
+
+
+def run(benchmarks: List[suite.Benchmark], repeat: int, scale: float, out=sys.stdout) -> Dict[str, Any]:
+    results = OrderedDict()
+    for bench in benchmarks:
+        results[bench.name] = result = bench.run(repeat, scale)
+        print('%-40s %14.2f %s' % (bench.name, result['value'], result['unit']), file=out)
+    return OrderedDict([('environment', environment()), ('results', results)])
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float, patterns: List[str] = (),
+            out=sys.stdout) -> List[str]:
+    """Prints the change of every benchmark relative to the baseline
+    and returns the names of the benchmarks that got slower, or bigger,
+    by more than the threshold. Baseline entries not matching the
+    patterns are left out."""
+
+    regressions = []
+    old_results = baseline['results']
+
+    print('\n%-40s %14s %14s %9s' % ('benchmark', 'baseline', 'current', 'change'), file=out)
+    for name, result in report['results'].items():
+        old = old_results.get(name)
+        if old is None:
+            print('%-40s %14s %14.2f %9s' % (name, '-', result['value'], 'new'), file=out)
+            continue
+
+        change = result['value'] / old['value'] - 1 if old['value'] else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = ' REGRESSION'
+        elif change < -threshold:
+            flag = ' improved'
+        print('%-40s %14.2f %14.2f %+8.1f%%%s' % (name, old['value'], result['value'], change * 100, flag), file=out)
+
+    missing = [name for name in old_results if name not in report['results']
+               and (not patterns or any(pattern in name for pattern in patterns))]
+    for name in missing:
+        print('%-40s %14.2f %14s %9s' % (name, old_results[name]['value'], '-', 'missing'), file=out)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Runs the RxPY benchmark suite.')
+    parser.add_argument('patterns', nargs='*',
+                        help='Only run benchmarks whose name contains one of the patterns.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of measurements per benchmark (default: 5).')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Factor applied to the number of elements of timed benchmarks (default: 1).')
+    parser.add_argument('--json', metavar='FILE',
+                        help='Write the results to FILE as JSON.')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='Compare the results against a baseline written by --json.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Relative change counted as a regression (default: 0.1).')
+    parser.add_argument('--list', action='store_true',
+                        help='List the benchmarks and exit.')
+    args = parser.parse_args(argv)
+
+    benchmarks = suite.select(args.patterns)
+    if args.list:
+        for bench in benchmarks:
+            print('%-40s %s' % (bench.name, bench.unit))
+        return 0
+
+    report = run(benchmarks, args.repeat, args.scale)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold, args.patterns)
+        if regressions:
+            print('\n%d benchmark(s) regressed by more than %.0f%%' % (len(regressions), args.threshold * 100))
+            return 1
+    return 0
@@ -0,0 +1,129 @@
+"""Scheduler dispatch latency and timer accuracy.
+
+Dispatch latency is the time from scheduling an action until it starts
+running, measured one action at a time so that queueing behind other
+actions is not included. Timer lateness is how long after its due time
+a delayed action starts running.
+"""
+import asyncio
+import statistics
+import threading
+from timeit import default_timer
+
+from rx.concurrency import (CurrentThreadScheduler, EventLoopScheduler, ImmediateScheduler, NewThreadScheduler,
+                            ThreadPoolScheduler, timeout_scheduler)
+from rx.concurrency.mainloopscheduler import AsyncIOScheduler
+
+from .suite import measured
+
+DISPATCHES = 200
+TIMERS = 20
+
+
+def immediate():
+    return ImmediateScheduler(), None
+
+
+def current_thread():
+    return CurrentThreadScheduler(), None
+
+
+def timeout():
+    return timeout_scheduler, None
+
+
+def new_thread():
+    return NewThreadScheduler(), None
+
+
+def thread_pool():
+    scheduler = ThreadPoolScheduler(4)
+    return scheduler, scheduler.shutdown
+
+
+def event_loop():
+    scheduler = EventLoopScheduler()
+    return scheduler, scheduler.dispose
+
+
+def asyncio_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def close():
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    return AsyncIOScheduler(loop, threadsafe=True), close
+
+
+SCHEDULERS = [
+    ('immediate', immediate),
+    ('current_thread', current_thread),
+    ('timeout', timeout),
+    ('new_thread', new_thread),
+    ('thread_pool', thread_pool),
+    ('event_loop', event_loop),
+    ('asyncio', asyncio_loop),
+]
+
+# Schedulers that run delayed actions on their own, the immediate and
+# trampoline schedulers block the caller instead.
+TIMER_SCHEDULERS = ('timeout', 'new_thread', 'thread_pool', 'event_loop', 'asyncio')
+
+
+def dispatch_latency(factory):
+    scheduler, close = factory()
+    done = threading.Event()
+    latencies = []
+
+    def action(_, scheduled):
+        latencies.append(default_timer() - scheduled)
+        done.set()
+
+    try:
+        for _ in range(DISPATCHES):
+            done.clear()
+            scheduler.schedule(action, default_timer())
+            if not done.wait(5):
+                raise RuntimeError('Action was not dispatched within 5 seconds')
+    finally:
+        if close:
+            close()
+    return statistics.median(latencies) * 1e6
+
+
+def timer_lateness(factory):
+    scheduler, close = factory()
+    done = threading.Event()
+    lateness = []
+    lock = threading.Lock()
+
+    def action(_, due):
+        now = default_timer()
+        with lock:
+            lateness.append(now - due)
+            if len(lateness) == TIMERS:
+                done.set()
+
+    try:
+        for i in range(TIMERS):
+            delay = 0.001 * (i + 1)
+            scheduler.schedule_relative(delay, action, default_timer() + delay)
+        if not done.wait(5):
+            raise RuntimeError('Timers did not fire within 5 seconds')
+    finally:
+        if close:
+            close()
+    return statistics.median(lateness) * 1e6
+
+
+def register(name, factory):
+    measured('dispatch', unit='us', name=name)(lambda: dispatch_latency(factory))
+    if name in TIMER_SCHEDULERS:
+        measured('timer', unit='us late', name=name)(lambda: timer_lateness(factory))
+
+
+for _name, _factory in SCHEDULERS:
+    register(_name, _factory)
@@ -0,0 +1,87 @@
+"""Registry of the benchmarks run by ``python -m benchmarks``.
+
+There are two kinds of benchmarks:
+
+* Timed benchmarks are factories returning a function that performs
+  one round of work on ``elements`` elements. The runner times the
+  function with timeit and reports the best round as nanoseconds per
+  element.
+* Measured benchmarks are functions that measure something other than
+  their own run time, such as timer lateness or memory, and return the
+  value in their unit. The runner reports the median of the repeats.
+
+Lower is better for every unit.
+"""
+import statistics
+import timeit
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+#: Number of elements pushed through an observable by a timed round
+ELEMENTS = 10000
+
+registry: Dict[str, 'Benchmark'] = OrderedDict()
+
+
+class Benchmark:
+    __slots__ = ('name', 'group', 'func', 'unit', 'elements', 'timed')
+
+    def __init__(self, name: str, group: str, func: Callable, unit: str, elements: int, timed: bool) -> None:
+        self.name = name
+        self.group = group
+        self.func = func
+        self.unit = unit
+        self.elements = elements
+        self.timed = timed
+
+    def run(self, repeat: int, scale: float = 1.0) -> Dict[str, Any]:
+        if self.timed:
+            elements = max(1, int(self.elements * scale))
+            round_ = self.func(elements)
+            timer = timeit.Timer(round_)
+            number, _ = timer.autorange()
+            times = [elapsed / number / elements * 1e9 for elapsed in timer.repeat(repeat, number)]
+            value = min(times)
+        else:
+            times = [self.func() for _ in range(repeat)]
+            value = statistics.median(times)
+
+        return OrderedDict([
+            ('group', self.group),
+            ('unit', self.unit),
+            ('value', value),
+            ('min', min(times)),
+            ('max', max(times)),
+            ('repeat', repeat),
+        ])
+
+
+def timed(group: str, name: Optional[str] = None, elements: int = ELEMENTS, unit: str = 'ns/element'
+          ) -> Callable[[Callable], Callable]:
+    """Registers a timed benchmark. The decorated factory is called
+    with the number of elements and returns the function to time."""
+
+    def register(factory: Callable[[int], Callable[[], Any]]) -> Callable:
+        key = '%s.%s' % (group, name or factory.__name__)
+        registry[key] = Benchmark(key, group, factory, unit, elements, True)
+        return factory
+    return register
+
+
+def measured(group: str, unit: str, name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Registers a measured benchmark. The decorated function returns
+    the measured value in the given unit."""
+
+    def register(func: Callable[[], float]) -> Callable:
+        key = '%s.%s' % (group, name or func.__name__)
+        registry[key] = Benchmark(key, group, func, unit, 1, False)
+        return func
+    return register
+
+
+def select(patterns: List[str]) -> List[Benchmark]:
+    """Returns the benchmarks whose name contains any of the patterns,
+    or all benchmarks if no pattern is given."""
+
+    return [bench for name, bench in registry.items()
+            if not patterns or any(pattern in name for pattern in patterns)]
@@ -1,66 +1,31 @@
-import rx
-asyncio = rx.config['asyncio']
-
-from rx.concurrency import AsyncIOScheduler
-from rx.core import Observable
-from rx.internal import extensionmethod
-
-
-@extensionmethod(ObservableBase)
-def to_async_generator(self, future_ctor=None, sentinel=None):
-    future_ctor = future_ctor or rx.config.get("Future")
-    if not future_ctor:
-        raise Exception('Future type not provided nor in rx.config.Future')
-
-    loop = asyncio.get_event_loop()
-    future = [future_ctor()]
-    notifications = []
-
-    def feeder():
-        if not len(notifications) or future[0].done():
-            return
+import asyncio
 
-        notification = notifications.pop(0)
-
-        if notification.kind == "E":
-            future[0].set_exception(notification.exception)
-        elif notification.kind == "C":
-            future[0].set_exception(StopIteration(sentinel))
-        else:
-            future[0].set_result(notification.value)
-
-    def on_next(value):
-        """Takes on_next values and appends them to the notification queue"""
-
-        notifications.append(value)
-        loop.call_soon(feeder)
-
-    self.materialize().subscribe(on_next)
+import rx
+from rx import operators as ops
+from rx.concurrency.mainloopscheduler import AsyncIOScheduler
 
-    @asyncio.coroutine
-    def gen():
-        """Generator producing futures"""
 
-        loop.call_soon(feeder)
-        future[0] = future_ctor()
+async def ticks():
+    """Async generator producing a value every 100 ms."""
 
-        return future[0]
-    return gen
+    for i in range(5):
+        await asyncio.sleep(0.1)
+        yield i
 
 
-@asyncio.coroutine
-def go():
+async def go():
     scheduler = AsyncIOScheduler()
 
-    xs = Observable.from_([x for x in range(10)], scheduler=scheduler)
-    gen = xs.to_async_generator()
+    # Observable to async iterator
+    async for x in rx.from_(range(10)):
+        print(x)
 
-    # Wish we could write something like:
-    # ys = (x for x in yield from gen())
-    while True:
-        x = yield from gen()
-        if x is None:
-            break
+    # Async iterable to observable and back again. The generator is only
+    # advanced when the async for loop asks for the next element.
+    xs = rx.from_async_iterable(ticks(), scheduler=scheduler).pipe(
+        ops.map(lambda x: x * 10)
+    )
+    async for x in xs:
         print(x)
 
 
@@ -68,5 +33,6 @@ def main():
     loop = asyncio.get_event_loop()
     loop.run_until_complete(go())
 
+
 if __name__ == '__main__':
     main()
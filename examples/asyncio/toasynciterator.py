@@ -1,55 +1,13 @@
-import rx
-
-from rx.concurrency import AsyncIOScheduler
-from rx.core import Observable
-from rx.internal import extensionmethod
-
-asyncio = rx.config['asyncio']
-future_ctor = rx.config.get("Future") or asyncio.Future
-
-
-@extensionmethod(ObservableBase)
-async def __aiter__(self):
-    source = self
-
-    class AIterator:
-        def __init__(self):
-            self.notifications = []
-            self.future = future_ctor()
-
-            source.materialize().subscribe(self.on_next)
+import asyncio
 
-        def feeder(self):
-            if not self.notifications or self.future.done():
-                return
-
-            notification = self.notifications.pop(0)
-            dispatch = {
-                'N': lambda: self.future.set_result(notification.value),
-                'E': lambda: self.future.set_exception(notification.exception),
-                'C': lambda: self.future.set_exception(StopAsyncIteration)
-            }
-
-            dispatch[notification.kind]()
-
-        def on_next(self, notification):
-            self.notifications.append(notification)
-            self.feeder()
-
-        async def __anext__(self):
-            self.feeder()
-
-            value = await self.future
-            self.future = future_ctor()
-            return value
-
-    return AIterator()
+import rx
+from rx.concurrency.mainloopscheduler import AsyncIOScheduler
 
 
 async def go():
     scheduler = AsyncIOScheduler()
 
-    async for x in Observable.range(0, 10, scheduler=scheduler):
+    async for x in rx.range(0, 10, scheduler=scheduler):
         print("got %s" % x)
 
 
@@ -1,7 +1,7 @@
 # pylint: disable=too-many-lines,redefined-outer-name,redefined-builtin
 
 from asyncio.futures import Future as _Future
-from typing import Iterable, Callable, Any, Optional, Union
+from typing import AsyncIterable, Iterable, Callable, Any, Optional, Union
 
 from .core import Observable, abc, typing, pipe
 
@@ -229,6 +229,29 @@ def from_callback(func: Callable, mapper: typing.Mapper = None) -> Callable[[],
     return _from_callback(func, mapper)
 
 
+def from_async_iterable(aiterable: AsyncIterable, scheduler: typing.Scheduler = None) -> Observable:
+    """Converts an asynchronous iterable to an observable sequence.
+
+    The next element is only pulled once the observer has handled the
+    previous one, so a slow observer throttles the producer.
+
+    Example:
+        >>> rx.from_async_iterable(agen(), scheduler=AsyncIOScheduler())
+
+    Args:
+        aiterable: An asynchronous iterable, e.g. an async generator.
+        scheduler: [Optional] An AsyncIOScheduler whose event loop runs
+            the iteration. Defaults to the running event loop, so it is
+            required when subscribing outside of a running loop.
+
+    Returns:
+        The observable sequence whose elements are pulled from the
+        given asynchronous iterable.
+    """
+    from .core.observable.fromasynciterable import _from_async_iterable
+    return _from_async_iterable(aiterable, scheduler)
+
+
 def from_future(future: _Future) -> Observable:
     """Converts a Future to an Observable sequence
 
@@ -762,7 +785,7 @@ def with_latest_from(*sources: Observable) -> Observable:
     return _with_latest_from(*sources)
 
 
-def zip(*args: Observable) -> Observable:
+def zip(*args: Observable, max_buffer: Optional[int] = None, overflow: str = 'error') -> Observable:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever all of the
     observable sequences have produced an element at a corresponding
@@ -770,13 +793,21 @@ def zip(*args: Observable) -> Observable:
 
     Example:
         >>> res = rx.zip(obs1, obs2)
+        >>> res = rx.zip(obs1, obs2, max_buffer=100, overflow='drop_oldest')
 
     Args:
         args: Observable sources to zip.
+        max_buffer: [Optional] Maximum number of elements buffered per
+            source while waiting for the other sources. Unbounded if
+            not given.
+        overflow: [Optional] What to do with an element of a source
+            whose buffer is full. One of 'drop_newest', 'drop_oldest'
+            or 'error' to terminate with a BufferOverflowException.
+            Defaults to 'error'.
 
     Returns:
         An observable sequence containing the result of combining
         elements of the sources as a tuple.
     """
     from .core.observable.zip import _zip
-    return _zip(*args)
+    return _zip(*args, max_buffer=max_buffer, overflow=overflow)
@@ -2,11 +2,12 @@
 import time
 import logging
 import threading
-from typing import Dict
-from datetime import timedelta
+from collections import deque
+from typing import Deque, Optional
 
 from rx.core import typing
-from rx.internal import PriorityQueue
+from rx.disposable import Disposable
+from rx.internal import IndexedPriorityQueue
 
 from .schedulerbase import SchedulerBase
 from .scheduleditem import ScheduledItem
@@ -15,20 +16,60 @@ log = logging.getLogger('Rx')
 
 
 class Trampoline(object):
-    @classmethod
-    def run(cls, queue: PriorityQueue) -> None:
-        while queue:
-            item = queue.dequeue()
-            if not item.is_cancelled():
-                diff = item.duetime - item.scheduler.now
-                while diff > timedelta(0):
-                    seconds = diff.seconds + diff.microseconds / 1E6 + diff.days * 86400
-                    log.warning("Do not schedule blocking work!")
-                    time.sleep(seconds)
-                    diff = item.duetime - item.scheduler.now
+    """Work queue of a single thread.
 
+    Immediate items are kept in a FIFO deque and run before any delayed
+    item that is not due yet. Delayed items are kept in a priority
+    queue that is only created once the first delayed item is
+    scheduled, and a due delayed item runs before the next immediate
+    item so that immediate work cannot starve it.
+    """
+
+    def __init__(self) -> None:
+        self.immediate: Deque[ScheduledItem] = deque()
+        self.delayed: Optional[IndexedPriorityQueue] = None
+
+    def enqueue(self, item: ScheduledItem) -> None:
+        if item.duetime is None:
+            self.immediate.append(item)
+        else:
+            if self.delayed is None:
+                self.delayed = IndexedPriorityQueue(4)
+            self.delayed.enqueue(item)
+
+    def remove(self, item: ScheduledItem) -> None:
+        if self.delayed is not None:
+            self.delayed.remove(item)
+
+    def run(self) -> None:
+        immediate = self.immediate
+        while True:
+            delayed = self.delayed
+            if immediate and not (delayed and self._is_due(delayed.peek())):
+                item = immediate.popleft()
                 if not item.is_cancelled():
                     item.invoke()
+            elif delayed:
+                item = delayed.dequeue()
+                if not item.is_cancelled():
+                    seconds = item.scheduler._seconds_until(item.duetime)
+                    while seconds > 0:
+                        log.warning("Do not schedule blocking work!")
+                        time.sleep(seconds)
+                        seconds = item.scheduler._seconds_until(item.duetime)
+
+                    if not item.is_cancelled():
+                        item.invoke()
+            else:
+                break
+
+    @staticmethod
+    def _is_due(item: ScheduledItem) -> bool:
+        return item.scheduler._seconds_until(item.duetime) <= 0
+
+
+class _TrampolineLocal(threading.local):
+    trampoline: Optional[Trampoline] = None
 
 
 class CurrentThreadScheduler(SchedulerBase):
@@ -38,42 +79,34 @@ class CurrentThreadScheduler(SchedulerBase):
     waiting.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, monotonic: bool = False) -> None:
         """Creates a scheduler that schedules work as soon as possible
-        on the current thread."""
+        on the current thread.
 
-        self.queues: Dict[int, PriorityQueue] = dict()
-        self.lock = threading.RLock()
+        Args:
+            monotonic: [Optional] Keep due times of delayed work on the
+                monotonic clock instead of the wall clock.
+        """
+
+        self._local = _TrampolineLocal()
+        self.is_monotonic = monotonic
 
     def schedule(self, action: typing.ScheduledAction, state: typing.TState = None) -> typing.Disposable:
         """Schedules an action to be executed."""
 
-        #log.debug("CurrentThreadScheduler.schedule(state=%s)", state)
-        return self.schedule_relative(timedelta(0), action, state)
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, None)
+        return self._schedule_item(si)
 
     def schedule_relative(self, duetime: typing.RelativeTime, action: typing.ScheduledAction,
                           state: typing.TState = None) -> typing.Disposable:
         """Schedules an action to be executed after duetime."""
 
-        duetime = self.to_timedelta(duetime)
-
-        dt = self.now + SchedulerBase.to_timedelta(SchedulerBase.normalize(duetime))
-        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, dt)
+        duetime = SchedulerBase.normalize(self.to_timedelta(duetime))
+        if not duetime:
+            return self.schedule(action, state)
 
-        queue = self.queue
-        if queue is None:
-            queue = PriorityQueue(4)
-            queue.enqueue(si)
-
-            self.queue = queue
-            try:
-                Trampoline.run(queue)
-            finally:
-                self.queue = None
-        else:
-            queue.enqueue(si)
-
-        return si.disposable
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, self._clock_relative(duetime))
+        return self._schedule_item(si)
 
     def schedule_absolute(self, duetime: typing.AbsoluteTime, action: typing.ScheduledAction,
                           state: typing.TState = None) -> typing.Disposable:
@@ -82,19 +115,33 @@ class CurrentThreadScheduler(SchedulerBase):
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now, action, state=state)
 
-    def _get_queue(self) -> PriorityQueue:
-        ident = threading.current_thread().ident
+    def _schedule_item(self, item: ScheduledItem) -> typing.Disposable:
+        local = self._local
+        trampoline = local.trampoline
+        if trampoline is None:
+            trampoline = Trampoline()
+            trampoline.enqueue(item)
 
-        with self.lock:
-            return self.queues.get(ident)
+            local.trampoline = trampoline
+            try:
+                trampoline.run()
+            finally:
+                local.trampoline = None
+        else:
+            trampoline.enqueue(item)
 
-    def _set_queue(self, queue: PriorityQueue):
-        ident = threading.current_thread().ident
+        if item.duetime is None:
+            return item.disposable
 
-        with self.lock:
-            self.queues[ident] = queue
+        def dispose() -> None:
+            item.cancel()
+            # The queue does not lock, so the item is only removed when
+            # disposed on the thread owning the trampoline. Elsewhere it
+            # is dropped once it reaches the head of the queue.
+            if local.trampoline is trampoline:
+                trampoline.remove(item)
 
-    queue = property(_get_queue, _set_queue)
+        return Disposable(dispose)
 
     def schedule_required(self) -> bool:
         """Test if scheduling is required.
@@ -104,7 +151,7 @@ class CurrentThreadScheduler(SchedulerBase):
         False; otherwise, if the trampoline is not active, then it
         returns True.
         """
-        return self.queue is None
+        return self._local.trampoline is None
 
     def ensure_trampoline(self, action):
         """Method for testing the CurrentThreadScheduler."""
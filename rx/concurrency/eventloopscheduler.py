@@ -1,26 +1,82 @@
 import logging
 import threading
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 from rx.disposable import Disposable
 from rx.core import typing
 from rx.concurrency import ScheduledItem
 from rx.internal.exceptions import DisposedException
-from rx.internal.priorityqueue import PriorityQueue
+from rx.internal.priorityqueue import IndexedPriorityQueue
 
 from .schedulerbase import SchedulerBase
 
 log = logging.getLogger('Rx')
 
 
+class EventLoopMetrics:
+    """Statistics collected by an event loop scheduler each time its
+    loop wakes up to run due items.
+
+    The lag of an item is the time between its due time and the moment
+    the loop picked it up.
+    """
+
+    __slots__ = ('wakeups', 'items', 'max_batch', 'last_lag', 'max_lag', 'total_lag')
+
+    def __init__(self) -> None:
+        self.wakeups = 0
+        self.items = 0
+        self.max_batch = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    @property
+    def items_per_wakeup(self) -> float:
+        """Average number of items run per wake-up."""
+
+        return self.items / self.wakeups if self.wakeups else 0.0
+
+    @property
+    def mean_lag(self) -> float:
+        """Average lag in seconds of the earliest item of each
+        wake-up."""
+
+        return self.total_lag / self.wakeups if self.wakeups else 0.0
+
+    def record(self, scheduler: SchedulerBase, ready: List[ScheduledItem]) -> None:
+        lag = max(0.0, -scheduler._seconds_until(min(item.duetime for item in ready)))
+
+        self.wakeups += 1
+        self.items += len(ready)
+        self.max_batch = max(self.max_batch, len(ready))
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.total_lag += lag
+
+
 class EventLoopScheduler(SchedulerBase, typing.Disposable):
     """Creates an object that schedules units of work on a designated
     thread."""
 
-    def __init__(self, thread_factory=None, exit_if_empty=False) -> None:
+    def __init__(self, thread_factory=None, exit_if_empty=False, monotonic=False, metrics=False) -> None:
+        """Creates an event loop scheduler.
+
+        Args:
+            thread_factory: [Optional] Factory creating the thread
+                running the event loop.
+            exit_if_empty: [Optional] Exit the thread when there is no
+                more work scheduled.
+            monotonic: [Optional] Keep due times on the monotonic clock
+                instead of the wall clock.
+            metrics: [Optional] Collect loop statistics in the metrics
+                attribute of the scheduler.
+        """
+
         super(EventLoopScheduler, self).__init__()
         self.is_disposed = False
+        self.is_monotonic = monotonic
 
         def default_factory(target):
             t = threading.Thread(target=target)
@@ -30,11 +86,10 @@ class EventLoopScheduler(SchedulerBase, typing.Disposable):
         self.lock = threading.RLock()
         self.thread_factory = thread_factory or default_factory
         self.thread: Optional[threading.Thread] = None
-        self.timer: Optional[threading.Timer] = None
         self.condition = threading.Condition(self.lock)
-        self.queue = PriorityQueue()
+        self.queue = IndexedPriorityQueue()
         self.ready_list: List[ScheduledItem] = []
-        self.next_item = None
+        self.metrics: Optional[EventLoopMetrics] = EventLoopMetrics() if metrics else None
 
         self.exit_if_empty = exit_if_empty
 
@@ -44,7 +99,7 @@ class EventLoopScheduler(SchedulerBase, typing.Disposable):
         if self.is_disposed:
             raise DisposedException()
 
-        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, self.now)
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, self._clock())
 
         with self.condition:
             self.ready_list.append(si)
@@ -57,28 +112,36 @@ class EventLoopScheduler(SchedulerBase, typing.Disposable):
                           state: typing.TState = None) -> typing.Disposable:
         """Schedules an action to be executed after duetime."""
 
-        dt: datetime = self.now + self.to_timedelta(duetime)
-        return self.schedule_absolute(dt, action, state)
+        return self._schedule_at(self._clock_relative(duetime), action, state)
 
     def schedule_absolute(self, duetime: typing.AbsoluteTime, action: typing.ScheduledAction,
                           state: typing.TState = None) -> typing.Disposable:
         """Schedules an action to be executed at duetime."""
 
+        return self._schedule_at(self._clock_absolute(duetime), action, state)
+
+    def _schedule_at(self, duetime: Union[datetime, float], action: typing.ScheduledAction,
+                     state: typing.TState = None) -> typing.Disposable:
         if self.is_disposed:
             raise DisposedException()
 
-        dt = self.to_datetime(duetime)
-        si: ScheduledItem[typing.TState]= ScheduledItem(self, state, action, dt)
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, duetime)
 
         with self.condition:
-            if dt < self.now:
+            if duetime < self._clock():
                 self.ready_list.append(si)
             else:
                 self.queue.enqueue(si)
             self.condition.notify()  # signal that a new item is available
             self.ensure_thread()
 
-        return Disposable(si.cancel)
+        def dispose() -> None:
+            si.cancel()
+            with self.condition:
+                if self.queue.remove(si):
+                    self.condition.notify()
+
+        return Disposable(dispose)
 
     def schedule_periodic(self, period: typing.RelativeTime, action: typing.ScheduledPeriodicAction, state: Any = None
                          ) -> typing.Disposable:
@@ -115,42 +178,40 @@ class EventLoopScheduler(SchedulerBase, typing.Disposable):
 
     def run(self) -> None:
         """Event loop scheduled on the designated event loop thread.
-        The loop is suspended/resumed using the event which gets set by
-        calls to Schedule, the next item timer, or calls to dispose."""
+        The loop waits on the condition until the earliest delayed item
+        is due, or until it is notified by calls to schedule or
+        dispose. All items that are due when the loop wakes up are run
+        as one batch."""
 
+        queue = self.queue
         while True:
-            ready: List[ScheduledItem] = []
-
             with self.condition:
+                while True:
+                    # The condition could have been notified by a call to
+                    # dispose. This takes priority over anything else. We
+                    # quit the loop immediately. Subsequent calls to
+                    # schedule won't ever create a new thread.
+                    if self.is_disposed:
+                        return
 
-                # The event could have been set by a call to dispose. This
-                # takes priority over anything else. We quit the loop
-                # immediately. Subsequent calls to Schedule won't ever create a
-                # new thread.
-                if self.is_disposed:
-                    return
-
-                while self.queue and self.queue.peek().duetime <= self.now:
-                    item = self.queue.dequeue()
-                    self.ready_list.append(item)
-
-                if self.queue:
-                    _next = self.queue.peek()
-                    if self.next_item is None or _next != self.next_item:
-                        self.next_item = _next
-                        due = _next.duetime - self.now
-                        seconds = due.total_seconds()
+                    while queue and self._seconds_until(queue.peek().duetime) <= 0:
+                        self.ready_list.append(queue.dequeue())
+
+                    if self.ready_list:
+                        break
+
+                    if queue:
+                        seconds = self._seconds_until(queue.peek().duetime)
                         log.debug("timeout: %s", seconds)
+                        self.condition.wait(seconds)
+                    else:
+                        self.condition.wait()
 
-                        self.timer = threading.Timer(seconds, self.tick, args=[_next])
-                        self.timer.setDaemon(True)
-                        self.timer.start()
+                ready = self.ready_list
+                self.ready_list = []
 
-                if self.ready_list:
-                    ready = self.ready_list[:]
-                    self.ready_list = []
-                else:
-                    self.condition.wait()
+                if self.metrics is not None:
+                    self.metrics.record(self, ready)
 
             for item in ready:
                 if not item.is_cancelled():
@@ -158,29 +219,27 @@ class EventLoopScheduler(SchedulerBase, typing.Disposable):
 
             if self.exit_if_empty:
                 with self.condition:
-                    if not self.ready_list and not self.queue:
+                    if not self.ready_list and not queue:
                         self.thread = None
                         return
 
+    @property
+    def queue_length(self) -> int:
+        """Number of items waiting to be run, including delayed items
+        that are not due yet."""
+
+        with self.condition:
+            return len(self.ready_list) + len(self.queue)
+
     def dispose(self) -> None:
         """Ends the thread associated with this scheduler. All
         remaining work in the scheduler queue is abandoned.
         """
 
         with self.condition:
-            if self.timer:
-                self.timer.cancel()
-
             if not self.is_disposed:
                 self.is_disposed = True
+                self.condition.notify()
 
-    def tick(self, item) -> None:
-        with self.condition:
-
-            if not self.is_disposed:
-                if self.queue.remove(item):
-                    self.ready_list.append(item)
-
-            self.condition.notify()  # signal that a new item is available
 
 event_loop_scheduler = EventLoopScheduler()
@@ -12,7 +12,7 @@ def default_sub_comparer(x, y):
 
 class ScheduledItem(Generic[typing.TState]):  # pylint: disable=unsubscriptable-object
     def __init__(self, scheduler: SchedulerBase, state: Optional[typing.TState], action: typing.ScheduledAction,
-                 duetime: typing.AbsoluteTime):
+                 duetime: Optional[typing.AbsoluteTime]):
         self.scheduler = scheduler
         self.state = state
         self.action = action
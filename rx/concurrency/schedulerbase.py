@@ -1,5 +1,6 @@
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Union
 
 from rx.core import typing
 from rx.core.typing import ScheduledAction, ScheduledPeriodicAction, TState
@@ -10,8 +11,15 @@ from rx.internal.basic import default_now
 class SchedulerBase(typing.Scheduler):
     """Provides a set of static properties to access commonly used
     schedulers.
+
+    Schedulers supporting the monotonic time mode keep due times as
+    float seconds of the `monotonic` clock when `is_monotonic` is set.
+    Absolute due times are then converted to relative ones when they
+    are scheduled, so timers are not affected by wall-clock jumps.
     """
 
+    is_monotonic = False
+
     def invoke_action(self, action: ScheduledAction, state: TState = None) -> typing.Disposable:
         ret = action(self, state)
         if isinstance(ret, typing.Disposable):
@@ -70,6 +78,44 @@ class SchedulerBase(typing.Scheduler):
 
         return default_now()
 
+    @property
+    def monotonic(self) -> float:
+        """Returns the value of a clock that cannot go backwards, in
+        seconds. Only differences between values are meaningful.
+        """
+
+        return time.monotonic()
+
+    def _clock(self) -> Union[datetime, float]:
+        """Returns the current time in the internal time representation
+        of the scheduler."""
+
+        return self.monotonic if self.is_monotonic else self.now
+
+    def _clock_relative(self, duetime: typing.RelativeTime) -> Union[datetime, float]:
+        """Converts a relative due time to the internal time
+        representation of the scheduler."""
+
+        if self.is_monotonic:
+            return self.monotonic + self.to_seconds(duetime)
+        return self.now + self.to_timedelta(duetime)
+
+    def _clock_absolute(self, duetime: typing.AbsoluteTime) -> Union[datetime, float]:
+        """Converts an absolute due time to the internal time
+        representation of the scheduler."""
+
+        if self.is_monotonic:
+            return self.monotonic + self.to_seconds(self.to_datetime(duetime) - self.now)
+        return self.to_datetime(duetime)
+
+    def _seconds_until(self, duetime: Union[datetime, float]) -> float:
+        """Returns the number of seconds until the given due time in
+        the internal time representation of the scheduler."""
+
+        if self.is_monotonic:
+            return duetime - self.monotonic
+        return (duetime - self.now).total_seconds()
+
     @classmethod
     def to_seconds(cls, timespan: typing.AbsoluteOrRelativeTime) -> float:
         """Converts time value to seconds"""
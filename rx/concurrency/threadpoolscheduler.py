@@ -1,30 +1,91 @@
+import logging
 from concurrent.futures import ThreadPoolExecutor
 
-from .newthreadscheduler import NewThreadScheduler
+from .timeoutscheduler import TimeoutScheduler, TimeoutItem
 
+log = logging.getLogger('Rx')
 
-class ThreadPoolScheduler(NewThreadScheduler):
-    """A scheduler that schedules work via the thread pool."""
 
-    class ThreadPoolThread:
-        """Wraps a concurrent future as a thread."""
+class ThreadPoolScheduler(TimeoutScheduler):
+    """A scheduler that schedules work via the thread pool.
 
-        def __init__(self, executor, run):
-            self.run = run
-            self.future = None
-            self.executor = executor
+    Immediate actions are submitted straight to the pool. Delayed
+    actions wait in the timer heap shared by all delayed actions of the
+    scheduler and are submitted once they are due.
+    """
 
-        def start(self):
-            self.future = self.executor.submit(self.run)
+    def __init__(self, max_workers=None):
+        """Creates a thread pool scheduler.
 
-        def cancel(self):
-            self.future.cancel()
+        Args:
+            max_workers: [Optional] Maximum number of threads of the
+                pool. Defaults to the default of
+                concurrent.futures.ThreadPoolExecutor.
+        """
 
-    def __init__(self, max_workers=None):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        super().__init__(max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ThreadPoolScheduler")
+
+        self._queued = 0
+        self._active = 0
+        self._rejected = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of actions submitted to the pool that have not
+        started running yet."""
+
+        return self._queued
+
+    @property
+    def delayed_count(self) -> int:
+        """Number of delayed actions waiting to become due."""
+
+        with self.lock:
+            return len(self.heap) - self.cancelled_count
+
+    @property
+    def active_workers(self) -> int:
+        """Number of actions currently running on a worker."""
+
+        return self._active
+
+    @property
+    def rejected_count(self) -> int:
+        """Number of actions the pool refused to run since it was shut
+        down."""
+
+        return self._rejected
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the pool. Actions that become due afterwards are
+        rejected.
+
+        Args:
+            wait: [Optional] Wait for running actions to finish.
+        """
+
+        self.executor.shutdown(wait=wait)
+
+    def _submit(self, item: TimeoutItem) -> None:
+        with self.lock:
+            self._queued += 1
 
-        def thread_factory(target, *args):
-            return self.ThreadPoolThread(self.executor, target)
+        try:
+            self.executor.submit(self._invoke, item)
+        except RuntimeError:
+            with self.lock:
+                self._queued -= 1
+                self._rejected += 1
+            log.debug("ThreadPoolScheduler: rejected action after shutdown")
 
-        super().__init__(thread_factory)
+    def _invoke(self, item: TimeoutItem) -> None:
+        with self.lock:
+            self._queued -= 1
+            self._active += 1
 
+        try:
+            item.invoke()
+        finally:
+            with self.lock:
+                self._active -= 1
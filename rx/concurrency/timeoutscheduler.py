@@ -1,53 +1,125 @@
-from threading import Timer
-from datetime import timedelta
+import heapq
+import logging
+import threading
+from collections import deque
+from time import monotonic
+from typing import Any, Deque, List, Optional, Tuple
 
 from rx.core import typing
-from rx.disposable import SingleAssignmentDisposable, CompositeDisposable, Disposable
+from rx.disposable import SingleAssignmentDisposable
 
 from .schedulerbase import SchedulerBase
 
+log = logging.getLogger('Rx')
 
-class TimeoutScheduler(SchedulerBase):
-    """A scheduler that schedules work via a timed callback based upon platform."""
+# Seconds an idle worker thread waits for work before it exits
+WORKER_IDLE_TIMEOUT = 10.0
 
-    def schedule(self, action: typing.ScheduledAction, state: typing.TState = None):
-        """Schedules an action to be executed."""
 
-        sad = SingleAssignmentDisposable()
+class TimeoutItem(typing.Disposable):
+    """Action scheduled on a timeout scheduler. Disposing the item
+    cancels it in O(1) by marking it, the timer thread drops cancelled
+    items lazily. An item is queued while it is a live entry of the
+    timer heap."""
+
+    __slots__ = ('scheduler', 'action', 'state', 'duetime', 'is_cancelled', 'is_queued', 'disposable')
+
+    def __init__(self, scheduler: 'TimeoutScheduler', action: typing.ScheduledAction, state: Any,
+                 duetime: Optional[float]) -> None:
+        self.scheduler = scheduler
+        self.action = action
+        self.state = state
+        self.duetime = duetime
+        self.is_cancelled = False
+        self.is_queued = duetime is not None
+        self.disposable = SingleAssignmentDisposable()
+
+    def invoke(self) -> None:
+        if self.is_cancelled:
+            return
+
+        try:
+            self.disposable.disposable = self.scheduler.invoke_action(self.action, self.state)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Unhandled exception in scheduled action")
 
-        def interval():
-            sad.disposable = self.invoke_action(action, state)
+    def dispose(self) -> None:
+        if not self.is_cancelled:
+            self.is_cancelled = True
+            if self.is_queued:
+                self.scheduler._cancel(self)
+        self.disposable.dispose()
 
-        timer = Timer(0, interval)
-        timer.setDaemon(True)
-        timer.start()
 
-        def dispose():
-            timer.cancel()
-        return CompositeDisposable(sad, Disposable(dispose))
+class TimeoutScheduler(SchedulerBase):
+    """A scheduler that schedules work via a timed callback based upon platform.
+
+    All timed actions share a single timer thread that keeps them in a
+    heap ordered by due time. Due actions are handed to a pool of daemon
+    worker threads, so running actions never keep the interpreter from
+    exiting. Idle workers are reused and exit after a while without
+    work. Cancelled actions stay in the heap until they are due or
+    until the heap is compacted.
+
+    Due times are converted to relative seconds when scheduled and the
+    timer thread waits on the monotonic clock, so the scheduler always
+    runs in monotonic time mode."""
+
+    is_monotonic = True
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Creates a timeout scheduler.
+
+        Args:
+            max_workers: [Optional] Maximum number of worker threads
+                running due actions. By default a new worker is started
+                whenever a due action finds no idle worker, so blocking
+                actions never delay other actions. With a bound, due
+                actions wait until a worker is free, and actions that
+                block can delay every action due after them.
+        """
+
+        self.max_workers = max_workers
+
+        self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
+        self.heap: List[Tuple[float, int, TimeoutItem]] = []
+        self.count = 0
+        self.cancelled_count = 0
+        self.thread: Optional[threading.Thread] = None
+
+        self.work = threading.Condition(self.lock)
+        self.queue: Deque[TimeoutItem] = deque()
+        self.workers = 0
+        self.idle = 0
+
+    def schedule(self, action: typing.ScheduledAction, state: typing.TState = None):
+        """Schedules an action to be executed."""
+
+        item = TimeoutItem(self, action, state, None)
+        self._submit(item)
+        return item
 
     def schedule_relative(self, duetime, action: typing.ScheduledAction, state: typing.TState = None):
         """Schedules an action to be executed after duetime."""
 
-        scheduler = self
-        timespan = self.to_timedelta(duetime)
-        if timespan == timedelta(0):
-            return scheduler.schedule(action, state)
-
-        sad = SingleAssignmentDisposable()
+        seconds = self.to_seconds(duetime)
+        if seconds <= 0:
+            return self.schedule(action, state)
 
-        def interval():
-            sad.disposable = self.invoke_action(action, state)
+        item = TimeoutItem(self, action, state, monotonic() + seconds)
 
-        seconds = timespan.total_seconds()
-        timer = Timer(seconds, interval)
-        timer.setDaemon(True)
-        timer.start()
+        with self.condition:
+            heapq.heappush(self.heap, (item.duetime, self.count, item))
+            self.count += 1
 
-        def dispose():
-            timer.cancel()
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="TimeoutScheduler", daemon=True)
+                self.thread.start()
+            elif self.heap[0][2] is item:
+                self.condition.notify()
 
-        return CompositeDisposable(sad, Disposable(dispose))
+        return item
 
     def schedule_absolute(self, duetime, action: typing.ScheduledAction, state: typing.TState = None):
         """Schedules an action to be executed after duetime."""
@@ -55,5 +127,95 @@ class TimeoutScheduler(SchedulerBase):
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now, action, state)
 
+    def run(self) -> None:
+        """Timer loop running on the timer thread. Waits until the
+        earliest item is due and hands all due items to the
+        workers."""
+
+        heap = self.heap
+        while True:
+            due: List[TimeoutItem] = []
+
+            with self.condition:
+                while not due:
+                    while heap and not heap[0][2].is_queued:
+                        heapq.heappop(heap)
+                        self.cancelled_count -= 1
+
+                    if not heap:
+                        self.condition.wait()
+                        continue
+
+                    timeout = heap[0][0] - monotonic()
+                    if timeout > 0:
+                        self.condition.wait(timeout)
+                        continue
+
+                    now = monotonic()
+                    while heap and heap[0][0] <= now:
+                        item = heapq.heappop(heap)[2]
+                        if item.is_queued:
+                            item.is_queued = False
+                            if not item.is_cancelled:
+                                due.append(item)
+                        else:
+                            self.cancelled_count -= 1
+
+            for item in due:
+                self._submit(item)
+
+    def _submit(self, item: TimeoutItem) -> None:
+        with self.lock:
+            self.queue.append(item)
+            if len(self.queue) <= self.idle:
+                self.work.notify()
+                return
+
+            if self.max_workers is not None and self.workers >= self.max_workers:
+                return
+            self.workers += 1
+
+        try:
+            threading.Thread(target=self._work, name="TimeoutScheduler-worker", daemon=True).start()
+        except RuntimeError:
+            # No new threads can be started during interpreter shutdown
+            with self.lock:
+                self.workers -= 1
+            log.debug("TimeoutScheduler: dropped action after shutdown")
+
+    def _work(self) -> None:
+        """Worker loop running due actions until it has been idle for
+        WORKER_IDLE_TIMEOUT seconds."""
+
+        queue = self.queue
+        while True:
+            with self.lock:
+                while not queue:
+                    self.idle += 1
+                    notified = self.work.wait(WORKER_IDLE_TIMEOUT)
+                    self.idle -= 1
+                    if not notified and not queue:
+                        self.workers -= 1
+                        return
+                item = queue.popleft()
+
+            item.invoke()
+
+    def _cancel(self, item: TimeoutItem) -> None:
+        """Called when a queued item is cancelled. The item is left in
+        the heap, which is compacted once more than half of it consists
+        of cancelled items."""
+
+        with self.lock:
+            if not item.is_queued:
+                return
+
+            item.is_queued = False
+            self.cancelled_count += 1
+            if self.cancelled_count > 64 and self.cancelled_count * 2 > len(self.heap):
+                self.heap[:] = [entry for entry in self.heap if entry[2].is_queued]
+                heapq.heapify(self.heap)
+                self.cancelled_count = 0
+
 
 timeout_scheduler = TimeoutScheduler()
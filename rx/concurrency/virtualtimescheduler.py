@@ -2,8 +2,9 @@ import logging
 from datetime import datetime
 from typing import Optional, Any
 
-from rx.internal import PriorityQueue, ArgumentOutOfRangeException
+from rx.internal import IndexedPriorityQueue, ArgumentOutOfRangeException
 from rx.core import typing
+from rx.disposable import Disposable
 
 from .schedulerbase import SchedulerBase
 from .scheduleditem import ScheduledItem
@@ -28,7 +29,7 @@ class VirtualTimeScheduler(SchedulerBase):
         self.clock = initial_clock
 
         self.is_enabled = False
-        self.queue = PriorityQueue(1024)
+        self.queue = IndexedPriorityQueue(1024)
 
         super().__init__()
 
@@ -38,6 +39,14 @@ class VirtualTimeScheduler(SchedulerBase):
 
         return self.to_datetime(self.clock)
 
+    @property
+    def monotonic(self) -> float:
+        """Gets the schedulers virtual clock value in seconds. Virtual
+        time never goes backwards, so the monotonic clock of a virtual
+        time scheduler is its own clock."""
+
+        return self.to_seconds(self.clock)
+
     def schedule(self, action, state=None):
         """Schedules an action to be executed."""
 
@@ -66,7 +75,12 @@ class VirtualTimeScheduler(SchedulerBase):
 
         si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, duetime)
         self.queue.enqueue(si)
-        return si.disposable
+
+        def dispose() -> None:
+            si.cancel()
+            self.queue.remove(si)
+
+        return Disposable(dispose)
 
     def start(self) -> None:
         """Starts the virtual time scheduler."""
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 class Disposable(ABC):
     """Disposable abstract base class. Untyped."""
 
+    __slots__ = ()
+
     @abstractmethod
     def dispose(self):
         raise NotImplementedError
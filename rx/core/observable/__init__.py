@@ -1,3 +1,4 @@
 from .observable import Observable
 from .connectableobservable import ConnectableObservable
 from .groupedobservable import GroupedObservable
+from .fusedobservable import FusedObservable
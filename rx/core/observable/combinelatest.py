@@ -1,4 +1,5 @@
-from typing import Any, Callable, Iterable, Union, List, cast
+import threading
+from typing import Any, List
 
 from rx.core import Observable, typing
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
@@ -17,49 +18,53 @@ def _combine_latest(*sources: Observable) -> Observable:
         elements of the sources into a tuple.
     """
 
-    parent = sources[0]
-
     def subscribe(observer: typing.Observer, scheduler: typing.Scheduler = None):
         n = len(sources)
+        values: List[Any] = [None] * n
         has_value = [False] * n
-        has_value_all = [False]
         is_done = [False] * n
-        values = [None] * n
-
-        def _next(i):
-            has_value[i] = True
-
-            if has_value_all[0] or all(has_value):
-                res = tuple(values)
-                observer.on_next(res)
-
-            elif all([x for j, x in enumerate(is_done) if j != i]):
-                observer.on_completed()
-
-            has_value_all[0] = all(has_value)
+        lock = threading.RLock()
 
-        def done(i):
-            is_done[i] = True
-            if all(is_done):
-                observer.on_completed()
-
-        subscriptions = [None] * n
+        # Number of sources that have produced a value and of sources
+        # that have completed, so that an element does not need a scan
+        # over all sources.
+        value_count = 0
+        done_count = 0
 
         def func(i):
-            subscriptions[i] = SingleAssignmentDisposable()
+            subscription = SingleAssignmentDisposable()
 
             def on_next(x):
-                with parent.lock:
+                nonlocal value_count
+
+                with lock:
                     values[i] = x
-                    _next(i)
+                    if not has_value[i]:
+                        has_value[i] = True
+                        value_count += 1
+
+                    if value_count == n:
+                        observer.on_next(tuple(values))
+                    elif done_count == n - 1 and not is_done[i]:
+                        observer.on_completed()
+
+            def on_error(error):
+                with lock:
+                    observer.on_error(error)
 
             def on_completed():
-                with parent.lock:
-                    done(i)
+                nonlocal done_count
+
+                with lock:
+                    if not is_done[i]:
+                        is_done[i] = True
+                        done_count += 1
+                    if done_count == n:
+                        observer.on_completed()
 
-            subscriptions[i].disposable = sources[i].subscribe_(on_next, observer.on_error, on_completed, scheduler)
+            subscription.disposable = sources[i].subscribe_(on_next, on_error, on_completed, scheduler)
+            return subscription
 
-        for idx in range(n):
-            func(idx)
+        subscriptions = [func(idx) for idx in range(n)]
         return CompositeDisposable(subscriptions)
     return Observable(subscribe)
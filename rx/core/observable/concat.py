@@ -8,10 +8,9 @@ from rx.concurrency import current_thread_scheduler
 
 def _concat_with_iterable(sources: Iterable[Observable]) -> Observable:
 
-    sources_ = iter(sources)
-
     def subscribe(observer, scheduler=None):
         scheduler = scheduler or current_thread_scheduler
+        sources_ = iter(sources)
 
         subscription = SerialDisposable()
         cancelable = SerialDisposable()
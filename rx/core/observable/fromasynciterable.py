@@ -0,0 +1,76 @@
+import asyncio
+from typing import AsyncIterable
+
+from rx.core import Observable, typing
+from rx.disposable import Disposable
+from rx.internal.exceptions import InvalidOperationException
+
+
+def _from_async_iterable(aiterable: AsyncIterable, scheduler: typing.Scheduler = None) -> Observable:
+    """Converts an asynchronous iterable to an observable sequence.
+
+    The iterable is consumed by a task on the event loop of the
+    scheduler. The next element is only pulled once the observer has
+    returned from handling the previous one, so a slow observer
+    throttles the producer. Disposing the subscription cancels the
+    task.
+
+    Args:
+        aiterable: An asynchronous iterable, e.g. an async generator.
+        scheduler: [Optional] An AsyncIOScheduler whose event loop runs
+            the iteration. Defaults to the running event loop, so it is
+            required when subscribing outside of a running loop.
+
+    Returns:
+        The observable sequence whose elements are pulled from the
+        given asynchronous iterable.
+    """
+
+    def subscribe(observer: typing.Observer, scheduler_: typing.Scheduler = None) -> typing.Disposable:
+        _scheduler = scheduler or scheduler_
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        loop = getattr(_scheduler, 'loop', None) or running
+        if loop is None:
+            raise InvalidOperationException("from_async_iterable requires an AsyncIOScheduler "
+                                            "when subscribed outside of a running event loop")
+        disposed = False
+
+        async def pump() -> None:
+            iterator = aiterable.__aiter__()
+            while not disposed:
+                try:
+                    value = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as ex:  # pylint: disable=broad-except
+                    observer.on_error(ex)
+                    return
+
+                try:
+                    observer.on_next(value)
+                except Exception as ex:  # pylint: disable=broad-except
+                    observer.on_error(ex)
+                    return
+
+            if not disposed:
+                observer.on_completed()
+
+        if running is loop:
+            task = loop.create_task(pump())
+        else:
+            task = asyncio.run_coroutine_threadsafe(pump(), loop)
+
+        def dispose() -> None:
+            nonlocal disposed
+            disposed = True
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(task.cancel)
+
+        return Disposable(dispose)
+    return Observable(subscribe)
@@ -1,9 +1,14 @@
+from collections.abc import Collection
+from itertools import islice
 from typing import Iterable, Any
 
 from rx.core import Observable, typing
 from rx.concurrency import current_thread_scheduler
 from rx.disposable import CompositeDisposable, Disposable
 
+# Number of elements emitted per chunk to observers supporting batches
+BATCH_SIZE = 1024
+
 
 def from_iterable(iterable: Iterable, scheduler: typing.Scheduler = None) -> Observable:
     """Converts an iterable to an observable sequence.
@@ -17,21 +22,36 @@ def from_iterable(iterable: Iterable, scheduler: typing.Scheduler = None) -> Obs
 
     Returns:
         The observable sequence whose elements are pulled from the
-        given iterable sequence.
+        given iterable sequence. If the iterable is a collection, such
+        as a list or a range, observers supporting batches receive the
+        elements in chunks of up to `BATCH_SIZE` elements. Other
+        iterables, such as generators, are pulled one element at a
+        time, so no element is pulled before it is needed.
     """
 
     def subscribe(observer: typing.Observer, scheduler_: typing.Scheduler = None) -> typing.Disposable:
         _scheduler = scheduler or scheduler_ or current_thread_scheduler
         iterator = iter(iterable)
         disposed = False
+        # Only collections are batched, pulling ahead from a generator
+        # would run its side effects early or block on a lazy source.
+        batched = getattr(observer, "supports_batch", False) and isinstance(iterable, Collection)
 
         def action(_: typing.Scheduler, __: Any = None) -> None:
             nonlocal disposed
 
             try:
-                while not disposed:
-                    value = next(iterator)
-                    observer.on_next(value)
+                if batched:
+                    while not disposed:
+                        values = list(islice(iterator, BATCH_SIZE))
+                        if values:
+                            observer.on_next_batch(values)
+                        if len(values) < BATCH_SIZE:
+                            raise StopIteration
+                else:
+                    while not disposed:
+                        value = next(iterator)
+                        observer.on_next(value)
             except StopIteration:
                 observer.on_completed()
             except Exception as error:  # pylint: disable=broad-except
@@ -0,0 +1,141 @@
+from typing import Any, Callable, Sequence, Tuple
+
+from .. import typing
+from .observable import Observable
+
+
+class Drop:
+    """Sentinel returned by a fused stage to drop the current
+    element."""
+
+    def __repr__(self):
+        return 'Drop'
+
+
+DROP = Drop()
+
+Step = Callable[[Any], Any]
+Stage = Callable[[Callable[[], None]], Step]
+
+
+class FusedObservable(Observable):
+    """Represents a run of synchronous operators fused into a single
+    observer.
+
+    Each stage is a factory that is called once per subscription with a
+    `complete` callback and returns a step function. A step maps an
+    element to the element passed on to the next step, or returns
+    `DROP` to filter it out. A step may call `complete` to terminate
+    the sequence once the current element has been handled.
+
+    If the downstream observer supports batches, chunks received from
+    the source are run through all steps in a single call and the
+    surviving elements are forwarded as one chunk.
+    """
+
+    def __init__(self, source: Observable, stages: Tuple[Stage, ...]) -> None:
+        self.source = source
+        self.stages = stages
+
+        super().__init__()
+
+    def _subscribe_core(self, observer: typing.Observer, scheduler: typing.Scheduler = None) -> typing.Disposable:
+        stopped = False
+        completing = False
+
+        def complete() -> None:
+            nonlocal completing
+            completing = True
+
+        steps = [stage(complete) for stage in self.stages]
+
+        def on_next(value: Any) -> None:
+            nonlocal stopped
+
+            if stopped:
+                return
+
+            try:
+                for step in steps:
+                    value = step(value)
+                    if value is DROP:
+                        break
+            except Exception as err:  # pylint: disable=broad-except
+                stopped = True
+                observer.on_error(err)
+                return
+
+            if value is not DROP:
+                observer.on_next(value)
+
+            if completing:
+                stopped = True
+                observer.on_completed()
+
+        def on_next_batch(values: Sequence[Any]) -> None:
+            nonlocal stopped
+
+            if stopped:
+                return
+
+            results = []
+            append = results.append
+            try:
+                for value in values:
+                    for step in steps:
+                        value = step(value)
+                        if value is DROP:
+                            break
+                    else:
+                        append(value)
+
+                    if completing:
+                        break
+            except Exception as err:  # pylint: disable=broad-except
+                stopped = True
+                if results:
+                    observer.on_next_batch(results)
+                observer.on_error(err)
+                return
+
+            if results:
+                observer.on_next_batch(results)
+
+            if completing:
+                stopped = True
+                observer.on_completed()
+
+        def on_error(error: Exception) -> None:
+            nonlocal stopped
+
+            if not stopped:
+                stopped = True
+                observer.on_error(error)
+
+        def on_completed() -> None:
+            nonlocal stopped
+
+            if not stopped:
+                stopped = True
+                observer.on_completed()
+
+        batched = on_next_batch if getattr(observer, "supports_batch", False) else None
+        return self.source.subscribe_(on_next, on_error, on_completed, scheduler, batched)
+
+
+def fuse(source: Observable, stage: Stage) -> Observable:
+    """Appends a stage to the fused run of the source, or starts a new
+    run if the source is not fused.
+
+    Args:
+        source: The source observable.
+        stage: Factory creating the per subscription step function.
+
+    Returns:
+        A fused observable sequence running all stages in a single
+        observer.
+    """
+
+    if isinstance(source, FusedObservable):
+        return FusedObservable(source.source, source.stages + (stage,))
+    return FusedObservable(source, (stage,))
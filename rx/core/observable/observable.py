@@ -1,6 +1,6 @@
 # By design, pylint: disable=C0302
 import threading
-from typing import Any, Callable, Optional, Union, cast
+from typing import Any, AsyncIterator, Callable, Optional, Union, cast
 
 from rx.disposable import Disposable
 from rx.concurrency import current_thread_scheduler
@@ -8,6 +8,9 @@ from rx.concurrency import current_thread_scheduler
 from ..observer import AutoDetachObserver
 from .. import typing, abc
 
+# Guards the lazy creation of observable locks
+_lock_guard = threading.Lock()
+
 
 class Observable(typing.Observable):
     """Observable base class.
@@ -15,6 +18,8 @@ class Observable(typing.Observable):
     Represents a push-style collection and contains all operators as
     methods to allow classic Rx chaining of operators."""
 
+    _lock: Optional[threading.RLock] = None
+
     def __init__(self, subscribe: Callable[[typing.Observer, Optional[typing.Scheduler]], typing.Disposable] = None) -> None:
         """Creates an observable sequence object from the specified
         subscription function.
@@ -23,11 +28,30 @@ class Observable(typing.Observable):
             subscribe: Subscribe method implementation.
         """
 
-        self.lock = threading.RLock()
         self._subscribe = subscribe
 
         super().__init__()
 
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock used by operators synchronizing on this observable.
+
+        The lock is created on first use, so observables whose
+        operators never synchronize do not allocate one.
+        """
+
+        lock = self._lock
+        if lock is None:
+            with _lock_guard:
+                if self._lock is None:
+                    self._lock = threading.RLock()
+                lock = self._lock
+        return lock
+
+    @lock.setter
+    def lock(self, value: threading.RLock) -> None:
+        self._lock = value
+
     def _subscribe_core(self, observer: typing.Observer, scheduler: typing.Scheduler = None):
         return self._subscribe(observer, scheduler) if self._subscribe else Disposable()
 
@@ -43,6 +67,21 @@ class Observable(typing.Observable):
         from ..operators.tofuture import _to_future
         return iter(self.pipe(_to_future()))
 
+    def __aiter__(self) -> AsyncIterator:
+        """Iterates the elements of the observable asynchronously.
+
+        Example:
+            >>> async for value in xs:
+            >>>     print(value)
+
+        Returns:
+            An asynchronous iterator yielding the elements of the
+            observable sequence. The observable is subscribed when
+            iteration starts and disposed when iteration stops.
+        """
+        from ..operators.toasynciterable import _to_async_iterable
+        return _to_async_iterable()(self)
+
     def __add__(self, other):
         """Pythonic version of concat.
 
@@ -135,22 +174,29 @@ class Observable(typing.Observable):
             to the observable sequence.
         """
 
+        on_next_batch = None
         if observer:
             if isinstance(observer, typing.Observer) or hasattr(observer, "on_next"):
                 on_next = cast(typing.Observer, observer).on_next
                 on_error = cast(typing.Observer, observer).on_error
                 on_completed = cast(typing.Observer, observer).on_completed
+                if getattr(observer, "supports_batch", False):
+                    on_next_batch = cast(typing.Observer, observer).on_next_batch
             else:
                 on_next = observer
 
-        return self.subscribe_(on_next, on_error, on_completed, scheduler)
+        subscription = self.subscribe_(on_next, on_error, on_completed, scheduler, on_next_batch)
+
+        # Hide the identity of the auto detach observer
+        return Disposable(subscription.dispose)
 
 
     def subscribe_(self,
                    on_next: typing.OnNext = None,
                    on_error: typing.OnError = None,
                    on_completed: typing.OnCompleted = None,
-                   scheduler: typing.Scheduler = None
+                   scheduler: typing.Scheduler = None,
+                   on_next_batch: typing.OnNextBatch = None
                   ) -> typing.Disposable:
         """Subscribe callbacks to the observable sequence.
 
@@ -167,13 +213,17 @@ class Observable(typing.Observable):
             on_completed: Action to invoke upon graceful termination of
                 the observable sequence.
             scheduler: The scheduler to use for this subscription.
+            on_next_batch: [Optional] Action to invoke for a chunk of
+                elements. If given, producers may emit chunks instead
+                of single elements.
 
         Returns:
             Disposable object representing an observer's subscription
-            to the observable sequence.
+            to the observable sequence. The disposable is not wrapped to
+            hide its identity, use subscribe() for that.
         """
 
-        auto_detach_observer = AutoDetachObserver(on_next, on_error, on_completed)
+        auto_detach_observer = AutoDetachObserver(on_next, on_error, on_completed, on_next_batch)
 
         def fix_subscriber(subscriber):
             """Fixes subscriber to make sure it returns a Disposable instead
@@ -205,8 +255,7 @@ class Observable(typing.Observable):
         else:
             set_disposable()
 
-        # Hide the identity of the auto detach observer
-        return Disposable(auto_detach_observer.dispose)
+        return auto_detach_observer
 
 
     def pipe(self, *operators: Callable[['ObservableBase'], 'ObservableBase']) -> 'ObservableBase':
@@ -3,6 +3,8 @@ from rx.core import Observable
 from rx.concurrency import current_thread_scheduler
 from rx.disposable import MultipleAssignmentDisposable
 
+from .fromiterable import BATCH_SIZE
+
 
 def _range(start: int, stop: int = None, step: int = None, scheduler: typing.Scheduler = None) -> Observable:
     """Generates an observable sequence of integral numbers within a
@@ -21,7 +23,9 @@ def _range(start: int, stop: int = None, step: int = None, scheduler: typing.Sch
 
     Returns:
         An observable sequence that contains a range of sequential
-        integral numbers.
+        integral numbers. Observers supporting batches receive the
+        numbers in chunks of up to `BATCH_SIZE` elements per scheduled
+        action.
     """
 
     if step is None and stop is None:
@@ -44,6 +48,17 @@ def _range(start: int, stop: int = None, step: int = None, scheduler: typing.Sch
             except StopIteration:
                 observer.on_completed()
 
-        sd.disposable = _scheduler.schedule(action, iter(range_t))
+        def action_batch(scheduler, start):
+            values = range_t[start:start + BATCH_SIZE]
+            if values:
+                observer.on_next_batch(values)
+                sd.disposable = _scheduler.schedule(action_batch, state=start + BATCH_SIZE)
+            else:
+                observer.on_completed()
+
+        if getattr(observer, "supports_batch", False):
+            sd.disposable = _scheduler.schedule(action_batch, 0)
+        else:
+            sd.disposable = _scheduler.schedule(action, iter(range_t))
         return sd
     return Observable(subscribe)
@@ -20,27 +20,32 @@ def observable_timer_date(duetime, scheduler: typing.Scheduler = None):
 def observable_timer_duetime_and_period(duetime, period, scheduler: typing.Scheduler = None) -> Observable:
     def subscribe(observer, scheduler_=None):
         _scheduler = scheduler or scheduler_ or timeout_scheduler
-        nonlocal duetime
 
-        if not isinstance(duetime, datetime):
-            duetime = _scheduler.now + _scheduler.to_timedelta(duetime)
+        # Keep due times on the monotonic clock of the scheduler, so
+        # the period is not affected by wall-clock jumps.
+        if isinstance(duetime, datetime):
+            delay = _scheduler.to_seconds(duetime - _scheduler.now)
+        else:
+            delay = _scheduler.to_seconds(duetime)
 
-        p = _scheduler.normalize(period)
+        p = _scheduler.to_seconds(_scheduler.normalize(period))
         mad = MultipleAssignmentDisposable()
-        dt = [duetime]
-        count = [0]
+        due = _scheduler.monotonic + delay
+        count = 0
 
         def action(scheduler, state):
+            nonlocal due, count
+
             if p > 0:
-                now = scheduler.now
-                dt[0] = dt[0] + scheduler.to_timedelta(p)
-                if dt[0] <= now:
-                    dt[0] = now + scheduler.to_timedelta(p)
-
-            observer.on_next(count[0])
-            count[0] += 1
-            mad.disposable = scheduler.schedule_absolute(dt[0], action)
-        mad.disposable = _scheduler.schedule_absolute(dt[0], action)
+                now = _scheduler.monotonic
+                due = due + p
+                if due <= now:
+                    due = now + p
+
+            observer.on_next(count)
+            count += 1
+            mad.disposable = scheduler.schedule_relative(due - _scheduler.monotonic, action)
+        mad.disposable = _scheduler.schedule_relative(due - _scheduler.monotonic, action)
         return mad
     return Observable(subscribe)
 
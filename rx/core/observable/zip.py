@@ -1,11 +1,20 @@
+import threading
+from collections import deque
+from typing import Any, Deque, List, Optional
+
 from rx import from_future
 from rx.core import Observable, typing
+from rx.core.observer.observeonobserver import DROP_NEWEST, DROP_OLDEST, ERROR
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+from rx.internal.exceptions import BufferOverflowException
 from rx.internal.utils import is_future
 
 # pylint: disable=redefined-builtin
 
-def _zip(*args: Observable) -> Observable:
+ZIP_OVERFLOW_STRATEGIES = (DROP_NEWEST, DROP_OLDEST, ERROR)
+
+
+def _zip(*args: Observable, max_buffer: Optional[int] = None, overflow: str = ERROR) -> Observable:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever all of the
     observable sequences have produced an element at a corresponding
@@ -16,51 +25,82 @@ def _zip(*args: Observable) -> Observable:
 
     Args:
         args: Observable sources to zip.
+        max_buffer: [Optional] Maximum number of elements buffered per
+            source while waiting for the other sources.
+        overflow: [Optional] What to do with an element that does not
+            fit into a full buffer. One of 'drop_newest', 'drop_oldest'
+            or 'error'.
 
     Returns:
         An observable sequence containing the result of combining
         elements of the sources as tuple.
     """
 
+    if overflow not in ZIP_OVERFLOW_STRATEGIES:
+        raise ValueError("Unknown overflow strategy: %r" % overflow)
+    if max_buffer is not None and max_buffer < 1:
+        raise ValueError("max_buffer must be at least 1.")
+
     sources = list(args)
 
     def subscribe(observer: typing.Observer, scheduler: typing.Scheduler = None):
         n = len(sources)
-        queues = [[] for _ in range(n)]
-        is_done = [False] * n
-
-        def next(i):
-            if all([len(q) for q in queues]):
-                try:
-                    queued_values = [x.pop(0) for x in queues]
-                    res = tuple(queued_values)
-                except Exception as ex:  # pylint: disable=broad-except
-                    observer.on_error(ex)
-                    return
-
-                observer.on_next(res)
-            elif all([x for j, x in enumerate(is_done) if j != i]):
-                observer.on_completed()
-
-        def done(i):
-            is_done[i] = True
-            if all(is_done):
-                observer.on_completed()
+        maxlen = max_buffer if overflow == DROP_OLDEST else None
+        queues: List[Deque[Any]] = [deque(maxlen=maxlen) for _ in range(n)]
+        lock = threading.RLock()
 
-        subscriptions = [None]*n
+        # Number of non-empty queues and of completed sources, so that
+        # an element does not need a scan over all sources.
+        ready = 0
+        done_count = 0
+        is_done = [False] * n
 
         def func(i):
             source = sources[i]
+            queue = queues[i]
             sad = SingleAssignmentDisposable()
             source = from_future(source) if is_future(source) else source
 
             def on_next(x):
-                queues[i].append(x)
-                next(i)
+                nonlocal ready
+
+                with lock:
+                    if not queue:
+                        ready += 1
+                    elif max_buffer is not None and len(queue) >= max_buffer and overflow != DROP_OLDEST:
+                        if overflow == ERROR:
+                            observer.on_error(BufferOverflowException(
+                                "zip buffer of source %d exceeded %d elements" % (i, max_buffer)))
+                        return
+                    queue.append(x)
+
+                    if ready == n:
+                        values = []
+                        for q in queues:
+                            values.append(q.popleft())
+                            if not q:
+                                ready -= 1
+                        observer.on_next(tuple(values))
+                    elif done_count == n - 1 and not is_done[i]:
+                        observer.on_completed()
+
+            def on_error(error):
+                with lock:
+                    observer.on_error(error)
+
+            def on_completed():
+                nonlocal done_count
+
+                with lock:
+                    if not is_done[i]:
+                        is_done[i] = True
+                        done_count += 1
+                    if done_count == n:
+                        observer.on_completed()
+
+            sad.disposable = source.subscribe_(on_next, on_error, on_completed, scheduler)
+            return sad
 
-            sad.disposable = source.subscribe_(on_next, observer.on_error, lambda: done(i), scheduler)
-            subscriptions[i] = sad
-        for idx in range(n):
-            func(idx)
+        subscriptions = [func(idx) for idx in range(n)]
         return CompositeDisposable(subscriptions)
     return Observable(subscribe)
@@ -1,5 +1,6 @@
 from .observerbase import ObserverBase
 from .anonymousobserver import AnonymousObserver
 from .scheduledobserver import ScheduledObserver
-from .observeonobserver import ObserveOnObserver
+from .observeonobserver import ObserveOnObserver, BufferCounters
 from .autodetachobserver import AutoDetachObserver
+from .serializedobserver import SerializedObserver
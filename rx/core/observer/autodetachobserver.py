@@ -1,17 +1,22 @@
-from typing import Any
+from typing import Any, Sequence
 
 from rx.internal import noop, default_error
 from rx.disposable import SingleAssignmentDisposable
 
-from ..typing import Observer
+from ..typing import Observer, Disposable
 
 
-class AutoDetachObserver(Observer):
+class AutoDetachObserver(Observer, Disposable):
 
-    def __init__(self, on_next=None, on_error=None, on_completed=None):
+    __slots__ = ('_on_next', '_on_error', '_on_completed', '_on_next_batch', '_subscription',
+                 'supports_batch', 'is_stopped')
+
+    def __init__(self, on_next=None, on_error=None, on_completed=None, on_next_batch=None):
         self._on_next = on_next or noop
         self._on_error = on_error or default_error
         self._on_completed = on_completed or noop
+        self._on_next_batch = on_next_batch
+        self.supports_batch = on_next_batch is not None
 
         self._subscription = SingleAssignmentDisposable()
         self.is_stopped = False
@@ -26,6 +31,23 @@ class AutoDetachObserver(Observer):
             self.dispose()
             raise
 
+    def on_next_batch(self, values: Sequence[Any]) -> None:
+        if self.is_stopped:
+            return
+
+        try:
+            if self._on_next_batch:
+                self._on_next_batch(values)
+            else:
+                on_next = self._on_next
+                for value in values:
+                    if self.is_stopped:
+                        break
+                    on_next(value)
+        except Exception:
+            self.dispose()
+            raise
+
     def on_error(self, error) -> None:
         if self.is_stopped:
             return
@@ -1,9 +1,92 @@
-from .scheduledobserver import ScheduledObserver
+import threading
+import weakref
+from typing import Any, Optional
+
+from rx.core import abc
+from rx.internal.exceptions import BufferOverflowException
+
+from .scheduledobserver import ScheduledObserver, OnErrorNotification
+
+BLOCK = 'block'
+DROP_NEWEST = 'drop_newest'
+DROP_OLDEST = 'drop_oldest'
+LATEST_ONLY = 'latest_only'
+ERROR = 'error'
+
+OVERFLOW_STRATEGIES = (BLOCK, DROP_NEWEST, DROP_OLDEST, LATEST_ONLY, ERROR)
+
+
+class BufferCounters:
+    """Counters of the bounded buffers of observe_on. A counters object
+    can be shared by several subscriptions, the counts are then summed
+    over all of them."""
+
+    def __init__(self) -> None:
+        self.dropped = 0
+        self.blocked = 0
+        self.high_water = 0
+        self.observers: weakref.WeakSet = weakref.WeakSet()
+
+    @property
+    def depth(self) -> int:
+        """Number of notifications currently buffered."""
+
+        return sum(len(observer.queue) for observer in list(self.observers))
 
 
 class ObserveOnObserver(ScheduledObserver):
-    def _on_next_core(self, value):
-        super()._on_next_core(value)
+    """Scheduled observer that forwards notifications as soon as they
+    are received.
+
+    If max_buffer is given, at most max_buffer elements are buffered
+    and the overflow strategy decides what happens to an element that
+    does not fit:
+
+    - block: The producer waits until there is room. The producer must
+      not run on the thread of the scheduler.
+    - drop_newest: The new element is dropped.
+    - drop_oldest: The oldest buffered element is dropped.
+    - latest_only: All buffered elements are dropped in favour of the
+      new element.
+    - error: The sequence terminates with a BufferOverflowException
+      after the buffered elements.
+    """
+
+    def __init__(self, scheduler: abc.Scheduler, observer: abc.Observer,
+                 batch_size: Optional[int] = None, time_budget: Optional[float] = None,
+                 max_buffer: Optional[int] = None, overflow: str = BLOCK,
+                 counters: Optional[BufferCounters] = None) -> None:
+        super().__init__(scheduler, observer, batch_size, time_budget)
+
+        if overflow not in OVERFLOW_STRATEGIES:
+            raise ValueError("Unknown overflow strategy: %r" % overflow)
+        if max_buffer is not None and max_buffer < 1:
+            raise ValueError("max_buffer must be at least 1.")
+
+        self.max_buffer = max_buffer
+        self.overflow = overflow
+        self.counters = counters
+
+        if counters is not None:
+            counters.observers.add(self)
+        if max_buffer is not None and overflow == BLOCK:
+            self.space = threading.Condition(self.lock)
+
+    def _on_next_core(self, value: Any) -> None:
+        if self.max_buffer is None:
+            self.queue.append(value)
+        else:
+            self._offer(value)
+        self.ensure_active()
+
+    def _on_next_batch_core(self, values):
+        if self.max_buffer is None:
+            self.queue.extend(values)
+        else:
+            for value in values:
+                if self.is_stopped:
+                    break
+                self._offer(value)
         self.ensure_active()
 
     def _on_error_core(self, error):
@@ -13,3 +96,52 @@ class ObserveOnObserver(ScheduledObserver):
     def _on_completed_core(self):
         super()._on_completed_core()
         self.ensure_active()
+
+    def _offer(self, value: Any) -> None:
+        queue = self.queue
+        counters = self.counters
+
+        with self.lock:
+            if len(queue) >= self.max_buffer:
+                overflow = self.overflow
+                if overflow == BLOCK:
+                    if counters is not None:
+                        counters.blocked += 1
+                    self.ensure_active()
+                    while len(queue) >= self.max_buffer and not self.has_faulted and not self.is_disposed:
+                        self.space.wait()
+                    if self.has_faulted or self.is_disposed:
+                        return
+                else:
+                    if counters is not None:
+                        counters.dropped += 1
+
+                    if overflow == DROP_NEWEST:
+                        return
+                    if overflow == DROP_OLDEST:
+                        try:
+                            queue.popleft()
+                        except IndexError:
+                            pass
+                    elif overflow == LATEST_ONLY:
+                        if counters is not None:
+                            counters.dropped += len(queue) - 1
+                        queue.clear()
+                    else:
+                        self.is_stopped = True
+                        queue.append(OnErrorNotification(BufferOverflowException()))
+                        return
+
+            queue.append(value)
+            if counters is not None and len(queue) > counters.high_water:
+                counters.high_water = len(queue)
+
+    @property
+    def is_disposed(self) -> bool:
+        return self.disposable.is_disposed
+
+    def dispose(self) -> None:
+        super().dispose()
+        if self.space is not None:
+            with self.space:
+                self.space.notify_all()
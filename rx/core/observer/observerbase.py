@@ -1,4 +1,4 @@
-from typing import Callable, Any
+from typing import Callable, Any, Sequence
 from abc import abstractmethod
 
 from ..typing import Observer, Disposable
@@ -22,6 +22,14 @@ class ObserverBase(Observer, Disposable):
     def _on_next_core(self, value: Any) -> None:
         return NotImplemented
 
+    def on_next_batch(self, values: Sequence[Any]) -> None:
+        """Notify the observer of a chunk of new elements in the
+        sequence."""
+        for value in values:
+            if self.is_stopped:
+                break
+            self._on_next_core(value)
+
     def on_error(self, error: Exception) -> None:
         """Notify the observer that an exception has occurred.
 
@@ -1,43 +1,101 @@
 import threading
-from typing import List, Any
+from collections import deque
+from time import monotonic
+from typing import Any, Deque, Optional, Sequence
 
 from rx.core import abc
-from rx.core.typing import Action
 from rx.disposable import SerialDisposable
 
 from .observerbase import ObserverBase
 
+DEFAULT_BATCH_SIZE = 128
+
+
+class OnErrorNotification:
+    """Queued error notification. Elements are queued as they are and
+    completion is queued as the COMPLETED sentinel, so only errors need
+    a wrapper."""
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+class Completed:
+    """Sentinel queued for the completion notification."""
+
+    def __repr__(self):
+        return 'Completed'
+
+
+COMPLETED = Completed()
+
 
 class ScheduledObserver(ObserverBase):
-    def __init__(self, scheduler: abc.Scheduler, observer: abc.Observer) -> None:
+    """Observer that queues notifications and forwards them to the
+    observer on a scheduler.
+
+    Notifications are kept in a deque and drained by a single scheduled
+    run. A run forwards up to batch_size notifications, or as many as
+    fit in time_budget seconds, before it yields and schedules itself
+    again.
+    """
+
+    supports_batch = True
+
+    def __init__(self, scheduler: abc.Scheduler, observer: abc.Observer,
+                 batch_size: Optional[int] = None, time_budget: Optional[float] = None) -> None:
+        """Creates a scheduled observer.
+
+        Args:
+            scheduler: Scheduler to forward the notifications on.
+            observer: Observer receiving the notifications.
+            batch_size: [Optional] Maximum number of notifications
+                forwarded per scheduled run. Defaults to
+                DEFAULT_BATCH_SIZE.
+            time_budget: [Optional] Maximum number of seconds spent
+                forwarding notifications per scheduled run.
+        """
+
         super().__init__()
 
         self.scheduler = scheduler
         self.observer = observer
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self.time_budget = time_budget
 
         self.lock = threading.RLock()
         self.is_acquired = False
         self.has_faulted = False
-        self.queue: List[Action] = []
+        self.queue: Deque[Any] = deque()
         self.disposable = SerialDisposable()
 
-        # Note to self: list append is thread safe
-        # http://effbot.org/pyfaq/what-kinds-of-global-value-mutation-are-thread-safe.htm
+        # Notified whenever a notification is taken off the queue, set
+        # by observers that block producers on a full queue.
+        self.space: Optional[threading.Condition] = None
+
+        # Note to self: deque append and popleft are thread safe, the
+        # lock only guards handing the drain over between threads.
 
     def _on_next_core(self, value: Any) -> None:
-        def action():
-            self.observer.on_next(value)
-        self.queue.append(action)
+        self.queue.append(value)
+
+    def _on_next_batch_core(self, values: Sequence[Any]) -> None:
+        self.queue.extend(values)
 
     def _on_error_core(self, error: Exception) -> None:
-        def action():
-            self.observer.on_error(error)
-        self.queue.append(action)
+        self.queue.append(OnErrorNotification(error))
 
     def _on_completed_core(self) -> None:
-        def action():
-            self.observer.on_completed()
-        self.queue.append(action)
+        self.queue.append(COMPLETED)
+
+    def on_next_batch(self, values: Sequence[Any]) -> None:
+        """Notify the observer of a chunk of new elements in the
+        sequence."""
+
+        if not self.is_stopped:
+            self._on_next_batch_core(values)
 
     def ensure_active(self) -> None:
         is_owner = False
@@ -51,24 +109,46 @@ class ScheduledObserver(ObserverBase):
             self.disposable.disposable = self.scheduler.schedule(self.run)
 
     def run(self, scheduler: abc.Scheduler, state: Any) -> None:
-        parent = self
-
-        with self.lock:
-            if parent.queue:
-                work = parent.queue.pop(0)
-            else:
-                parent.is_acquired = False
-                return
-
-        try:
-            work()
-        except Exception:
-            with self.lock:
-                parent.queue = []
-                parent.has_faulted = True
-            raise
-
-        self.scheduler.schedule(self.run)
+        queue = self.queue
+        observer = self.observer
+        space = self.space
+        deadline = monotonic() + self.time_budget if self.time_budget is not None else None
+
+        count = self.batch_size
+        while count:
+            try:
+                item = queue.popleft()
+            except IndexError:
+                with self.lock:
+                    if not queue:
+                        self.is_acquired = False
+                        return
+                continue
+
+            if space is not None:
+                with space:
+                    space.notify()
+
+            try:
+                if item is COMPLETED:
+                    observer.on_completed()
+                elif item.__class__ is OnErrorNotification:
+                    observer.on_error(item.error)
+                else:
+                    observer.on_next(item)
+            except Exception:
+                with self.lock:
+                    queue.clear()
+                    self.has_faulted = True
+                    if space is not None:
+                        space.notify_all()
+                raise
+
+            count -= 1
+            if deadline is not None and monotonic() >= deadline:
+                break
+
+        self.disposable.disposable = self.scheduler.schedule(self.run)
 
     def dispose(self) -> None:
         super().dispose()
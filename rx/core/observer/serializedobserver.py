@@ -0,0 +1,90 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Optional
+
+from rx.core import typing
+
+from .scheduledobserver import OnErrorNotification, COMPLETED
+
+
+class SerializedObserver(typing.Observer):
+    """Serializes notifications from producers on any number of
+    threads, using the emitter loop pattern.
+
+    Every notification is offered to the queue and the thread that wins
+    the emitter lock drains it, other threads leave right away. No
+    thread ever waits for another one, and the lock is never held
+    while the observer is not being called. If no other thread is
+    emitting and nothing is queued, a notification is forwarded
+    directly without being queued.
+
+    If the observer raises, the emitting thread still delivers the
+    notifications other threads queued in the meantime and then
+    re-raises the first exception, so no notification is left behind
+    in the queue.
+    """
+
+    __slots__ = ('observer', 'queue', 'lock', 'done')
+
+    def __init__(self, observer: typing.Observer) -> None:
+        self.observer = observer
+        self.queue: Deque[Any] = deque()
+        self.lock = threading.Lock()
+        self.done = False
+
+    def on_next(self, value: Any) -> None:
+        if self.done:
+            return
+
+        if not self.queue and self.lock.acquire(False):
+            try:
+                self.observer.on_next(value)
+            finally:
+                self.lock.release()
+                if self.queue:
+                    self._drain()
+        else:
+            self.queue.append(value)
+            self._drain()
+
+    def on_error(self, error: Exception) -> None:
+        self.queue.append(OnErrorNotification(error))
+        self._drain()
+
+    def on_completed(self) -> None:
+        self.queue.append(COMPLETED)
+        self._drain()
+
+    def _drain(self) -> None:
+        queue = self.queue
+        observer = self.observer
+        lock = self.lock
+        error: Optional[Exception] = None
+
+        # The thread holding the lock drains everything it finds. A
+        # producer that fails to get the lock has queued its item before
+        # trying, so the holder sees it when it checks again after
+        # releasing the lock.
+        while queue and lock.acquire(False):
+            try:
+                while queue and not self.done:
+                    item = queue.popleft()
+                    try:
+                        if item is COMPLETED:
+                            self.done = True
+                            observer.on_completed()
+                        elif isinstance(item, OnErrorNotification):
+                            self.done = True
+                            observer.on_error(item.error)
+                        else:
+                            observer.on_next(item)
+                    except Exception as ex:  # pylint: disable=broad-except
+                        error = error or ex
+
+                if self.done:
+                    queue.clear()
+            finally:
+                lock.release()
+
+        if error is not None:
+            raise error
@@ -1,13 +1,9 @@
-from typing import Callable
+import builtins
+from typing import Any, Callable, Sequence
 
 from rx import operators
 from rx.core import Observable
-
-
-class AverageValue(object):
-    def __init__(self, sum, count):
-        self.sum = sum
-        self.count = count
+from rx.internal import SequenceContainsNoElementsError
 
 
 def _average(key_mapper=None) -> Callable[[Observable], Observable]:
@@ -35,19 +31,38 @@ def _average(key_mapper=None) -> Callable[[Observable], Observable]:
                 operators.average()
             )
 
-        def accumulator(prev, cur):
-            return AverageValue(sum=prev.sum+cur, count=prev.count+1)
+        def subscribe(observer, scheduler=None):
+            total = 0
+            count = 0
+
+            def on_next(value: Any) -> None:
+                nonlocal total, count
+
+                try:
+                    total += value
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+                count += 1
+
+            def on_next_batch(values: Sequence[Any]) -> None:
+                nonlocal total, count
+
+                try:
+                    total = builtins.sum(values, total)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+                count += len(values)
 
-        def mapper(s):
-            if s.count == 0:
-                raise Exception('The input sequence was empty')
+            def on_completed() -> None:
+                if not count:
+                    observer.on_error(SequenceContainsNoElementsError('The input sequence was empty'))
+                    return
 
-            return s.sum / float(s.count)
+                observer.on_next(total / float(count))
+                observer.on_completed()
 
-        seed = AverageValue(sum=0, count=0)
-        return source.pipe(
-            operators.scan(accumulator, seed),
-            operators.last(),
-            operators.map(mapper)
-        )
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch)
+        return Observable(subscribe)
     return average
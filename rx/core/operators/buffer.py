@@ -1,33 +1,142 @@
-from typing import Callable
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Sequence
 
 from rx import operators as ops
-from rx.core import Observable, pipe
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, SerialDisposable, SingleAssignmentDisposable
+from rx.internal import noop, BufferPool
+from rx.internal.exceptions import ArgumentOutOfRangeException
 
 
-def _buffer(buffer_openings=None, buffer_closing_mapper=None) -> Callable[[Observable], Observable]:
+def _buffer(buffer_openings=None, buffer_closing_mapper=None, pool: Optional[BufferPool] = None
+            ) -> Callable[[Observable], Observable]:
     """Projects each element of an observable sequence into zero or more
     buffers.
 
     Args:
-        buffer_openings -- Observable sequence whose elements denote the
-            creation of windows.
-        buffer_closing_mapper -- [optional] A function invoked to define
-            the closing of each produced window. If a closing mapper
-            function is specified for the first parameter, this parameter is
-            ignored.
+        buffer_openings: Observable sequence whose elements denote the
+            creation of buffers.
+        buffer_closing_mapper: [optional] A function invoked to define
+            the closing of each produced buffer. If a closing mapper
+            function is specified for the first parameter, this
+            parameter is ignored.
+        pool: [Optional] Pool to take the buffers from.
 
     Returns:
-        A function that takes an observable source and retuerns an
-        observable sequence of windows.
+        A function that takes an observable source and returns an
+        observable sequence of buffers.
     """
 
-    return pipe(
-        ops.window(buffer_openings, buffer_closing_mapper),
-        ops.flat_map(pipe(ops.to_iterable(), ops.map(list)))
-    )
-
-
-def _buffer_with_count(count: int, skip: int = None) -> Callable[[Observable], Observable]:
+    # Make it possible to call buffer with a single unnamed parameter
+    if not isinstance(buffer_openings, typing.Observable) and callable(buffer_openings):
+        buffer_closing_mapper = buffer_openings
+        buffer_openings = None
+
+    acquire = pool.acquire if pool is not None else list
+
+    def buffer(source: Observable) -> Observable:
+        if buffer_openings and not buffer_closing_mapper:
+            return buffer_with_boundaries(source, buffer_openings, acquire)
+
+        if not buffer_openings and buffer_closing_mapper:
+            return buffer_with_closing_mapper(source, buffer_closing_mapper, acquire)
+
+        # Overlapping buffers are rare enough to be left to window
+        return source.pipe(
+            ops.window(buffer_openings, buffer_closing_mapper),
+            ops.flat_map(lambda window: window.pipe(ops.to_iterable(), ops.map(list)))
+        )
+    return buffer
+
+
+def buffer_with_boundaries(source: Observable, boundaries: Observable, acquire: Callable[[], List[Any]]
+                           ) -> Observable:
+    def subscribe(observer, scheduler=None):
+        lock = threading.RLock()
+        buffer = acquire()
+
+        def on_next(value: Any) -> None:
+            with lock:
+                buffer.append(value)
+
+        def on_next_batch(values: Sequence[Any]) -> None:
+            with lock:
+                buffer.extend(values)
+
+        def on_next_boundary(_: Any) -> None:
+            nonlocal buffer
+            with lock:
+                full, buffer = buffer, acquire()
+                observer.on_next(full)
+
+        def on_error(error: Exception) -> None:
+            with lock:
+                observer.on_error(error)
+
+        def on_completed() -> None:
+            with lock:
+                observer.on_next(buffer)
+                observer.on_completed()
+
+        return CompositeDisposable(
+            source.subscribe_(on_next, on_error, on_completed, scheduler, on_next_batch),
+            boundaries.subscribe_(on_next_boundary, on_error, on_completed, scheduler)
+        )
+    return Observable(subscribe)
+
+
+def buffer_with_closing_mapper(source: Observable, closing_mapper: Callable[[], Observable],
+                               acquire: Callable[[], List[Any]]) -> Observable:
+    def subscribe(observer, scheduler=None):
+        lock = threading.RLock()
+        closing = SerialDisposable()
+        buffer = acquire()
+
+        def on_next(value: Any) -> None:
+            with lock:
+                buffer.append(value)
+
+        def on_next_batch(values: Sequence[Any]) -> None:
+            with lock:
+                buffer.extend(values)
+
+        def on_error(error: Exception) -> None:
+            with lock:
+                observer.on_error(error)
+
+        def on_completed() -> None:
+            with lock:
+                observer.on_next(buffer)
+                observer.on_completed()
+
+        def create_closing() -> None:
+            try:
+                closing_observable = closing_mapper()
+            except Exception as error:  # pylint: disable=broad-except
+                on_error(error)
+                return
+
+            def on_completed_closing() -> None:
+                nonlocal buffer
+                with lock:
+                    full, buffer = buffer, acquire()
+                    observer.on_next(full)
+                create_closing()
+
+            m = SingleAssignmentDisposable()
+            closing.disposable = m
+            m.disposable = closing_observable.pipe(ops.take(1)).subscribe_(
+                noop, on_error, on_completed_closing, scheduler)
+
+        subscription = source.subscribe_(on_next, on_error, on_completed, scheduler, on_next_batch)
+        create_closing()
+        return CompositeDisposable(subscription, closing)
+    return Observable(subscribe)
+
+
+def _buffer_with_count(count: int, skip: int = None, pool: Optional[BufferPool] = None
+                       ) -> Callable[[Observable], Observable]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on element count information.
 
@@ -40,23 +149,87 @@ def _buffer_with_count(count: int, skip: int = None) -> Callable[[Observable], O
         skip: [Optional] Number of elements to skip between
             creation of consecutive buffers. If not provided, defaults to
             the count.
+        pool: [Optional] Pool to take the buffers from.
 
     Returns:
         A function that takes an observable source and returns an
         observable sequence of buffers.
     """
 
+    if skip is None:
+        skip = count
+
+    if count <= 0 or skip <= 0:
+        raise ArgumentOutOfRangeException()
+
+    acquire = pool.acquire if pool is not None else list
+
     def buffer_with_count(source: Observable) -> Observable:
-        nonlocal skip
+        if skip == count:
+            return buffer_with_count_adjacent(source, count, acquire)
+
+        def subscribe(observer, scheduler=None):
+            buffers: Deque[List[Any]] = deque()
+            n = 0
+
+            def on_next(value: Any) -> None:
+                nonlocal n
+
+                if n % skip == 0:
+                    buffers.append(acquire())
+                n += 1
 
-        if skip is None:
-            skip = count
+                for buffer in buffers:
+                    buffer.append(value)
 
-        def mapper(value):
-            return value.pipe(ops.to_iterable(), ops.map(list))
+                if buffers and len(buffers[0]) == count:
+                    observer.on_next(buffers.popleft())
 
-        def predicate(value):
-            return len(value) > 0
+            def on_error(error: Exception) -> None:
+                buffers.clear()
+                observer.on_error(error)
 
-        return source.pipe(ops.window_with_count(count, skip), ops.flat_map(mapper), ops.filter(predicate))
+            def on_completed() -> None:
+                while buffers:
+                    observer.on_next(buffers.popleft())
+                observer.on_completed()
+
+            return source.subscribe_(on_next, on_error, on_completed, scheduler)
+        return Observable(subscribe)
     return buffer_with_count
+
+
+def buffer_with_count_adjacent(source: Observable, count: int, acquire: Callable[[], List[Any]]) -> Observable:
+    """Non-overlapping buffers need a single buffer only, and a batch
+    from the source can be split into buffers by slicing."""
+
+    def subscribe(observer, scheduler=None):
+        buffer = acquire()
+
+        def on_next(value: Any) -> None:
+            nonlocal buffer
+
+            buffer.append(value)
+            if len(buffer) == count:
+                full, buffer = buffer, acquire()
+                observer.on_next(full)
+
+        def on_next_batch(values: Sequence[Any]) -> None:
+            nonlocal buffer
+
+            start, end = 0, len(values)
+            while start < end:
+                stop = start + count - len(buffer)
+                buffer.extend(values[start:stop])
+                start = stop
+                if len(buffer) == count:
+                    full, buffer = buffer, acquire()
+                    observer.on_next(full)
+
+        def on_completed() -> None:
+            if buffer:
+                observer.on_next(buffer)
+            observer.on_completed()
+
+        return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch)
+    return Observable(subscribe)
@@ -1,15 +1,86 @@
-from typing import Callable
+import threading
+from collections import deque
+from datetime import timedelta
+from typing import Any, Callable, Deque, List, Optional, Sequence
 
-from rx import operators as ops
-from rx.core import Observable, pipe, typing
+from rx.concurrency import timeout_scheduler
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, SerialDisposable
+from rx.internal import BufferPool
 
 
 def _buffer_with_time(timespan: typing.RelativeTime, timeshift: typing.RelativeTime = None,
-                      scheduler: typing.Scheduler = None) -> Callable[[Observable], Observable]:
+                      scheduler: typing.Scheduler = None, pool: Optional[BufferPool] = None
+                      ) -> Callable[[Observable], Observable]:
     if not timeshift:
         timeshift = timespan
 
-    return pipe(
-        ops.window_with_time(timespan, timeshift, scheduler),
-        ops.flat_map(lambda x: x.pipe(ops.to_iterable()))
-    )
+    if not isinstance(timespan, timedelta):
+        timespan = timedelta(seconds=timespan)
+    if not isinstance(timeshift, timedelta):
+        timeshift = timedelta(seconds=timeshift)
+
+    acquire = pool.acquire if pool is not None else list
+
+    def buffer_with_time(source: Observable) -> Observable:
+        def subscribe(observer, scheduler_=None):
+            _scheduler = scheduler or scheduler_ or timeout_scheduler
+
+            lock = threading.RLock()
+            timer = SerialDisposable()
+            buffers: Deque[List[Any]] = deque([acquire()])
+            next_shift = timeshift
+            next_span = timespan
+            total_time = timedelta(0)
+
+            def create_timer() -> None:
+                nonlocal next_shift, next_span, total_time
+
+                is_span = next_span <= next_shift
+                is_shift = next_shift <= next_span
+
+                new_total_time = next_span if is_span else next_shift
+                ts = new_total_time - total_time
+                total_time = new_total_time
+
+                if is_span:
+                    next_span += timeshift
+                if is_shift:
+                    next_shift += timeshift
+
+                def action(scheduler, state=None):
+                    with lock:
+                        if is_shift:
+                            buffers.append(acquire())
+                        if is_span:
+                            observer.on_next(buffers.popleft())
+                        create_timer()
+
+                timer.disposable = _scheduler.schedule_relative(ts, action)
+
+            def on_next(value: Any) -> None:
+                with lock:
+                    for buffer in buffers:
+                        buffer.append(value)
+
+            def on_next_batch(values: Sequence[Any]) -> None:
+                with lock:
+                    for buffer in buffers:
+                        buffer.extend(values)
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    buffers.clear()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with lock:
+                    while buffers:
+                        observer.on_next(buffers.popleft())
+                    observer.on_completed()
+
+            create_timer()
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler_, on_next_batch)
+            return CompositeDisposable(timer, subscription)
+        return Observable(subscribe)
+    return buffer_with_time
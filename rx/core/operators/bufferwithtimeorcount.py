@@ -1,11 +1,61 @@
-from typing import Callable
+import threading
+from typing import Any, Callable, Optional
 
-from rx import operators as ops
-from rx.core import Observable, pipe
+from rx.concurrency import timeout_scheduler
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, SerialDisposable
+from rx.internal import BufferPool
 
 
-def _buffer_with_time_or_count(timespan, count, scheduler = None) -> Callable[[Observable], Observable]:
-    return pipe(
-        ops.window_with_time_or_count(timespan, count, scheduler),
-        ops.flat_map(lambda x: x.pipe(ops.to_iterable()))
-    )
+def _buffer_with_time_or_count(timespan: typing.RelativeTime, count: int, scheduler: typing.Scheduler = None,
+                               pool: Optional[BufferPool] = None) -> Callable[[Observable], Observable]:
+    acquire = pool.acquire if pool is not None else list
+
+    def buffer_with_time_or_count(source: Observable) -> Observable:
+        def subscribe(observer, scheduler_=None):
+            _scheduler = scheduler or scheduler_ or timeout_scheduler
+
+            lock = threading.RLock()
+            timer = SerialDisposable()
+            buffer = acquire()
+            buffer_id = 0
+
+            def flush() -> None:
+                """Emits the current buffer and restarts the timer. Must
+                be called with the lock held."""
+
+                nonlocal buffer, buffer_id
+
+                buffer_id += 1
+                full, buffer = buffer, acquire()
+                observer.on_next(full)
+                create_timer(buffer_id)
+
+            def create_timer(_id: int) -> None:
+                def action(scheduler, state):
+                    with lock:
+                        if _id == buffer_id:
+                            flush()
+
+                timer.disposable = _scheduler.schedule_relative(timespan, action)
+
+            def on_next(value: Any) -> None:
+                with lock:
+                    buffer.append(value)
+                    if len(buffer) == count:
+                        flush()
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with lock:
+                    observer.on_next(buffer)
+                    observer.on_completed()
+
+            create_timer(0)
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler_)
+            return CompositeDisposable(timer, subscription)
+        return Observable(subscribe)
+    return buffer_with_time_or_count
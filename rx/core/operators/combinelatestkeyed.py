@@ -0,0 +1,97 @@
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable
+
+from rx import from_future
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+from rx.internal.utils import is_future
+
+
+def _combine_latest_keyed() -> Callable[[Observable], Observable]:
+    def combine_latest_keyed(source: Observable) -> Observable:
+        """Combines the latest values of a dynamic set of keyed
+        observable sequences.
+
+        The source emits (key, observable) pairs. Every time one of
+        the inner observables produces an element, the mapping from key
+        to latest value is updated in place and emitted.
+
+        Args:
+            source: Observable sequence of (key, observable) pairs.
+
+        Returns:
+            An observable sequence of read-only views of the mapping
+            from key to latest value.
+        """
+
+        def subscribe(observer: typing.Observer, scheduler: typing.Scheduler = None):
+            group = CompositeDisposable()
+            lock = threading.RLock()
+            values: Dict[Hashable, Any] = {}
+            view = MappingProxyType(values)
+            subscriptions: Dict[Hashable, SingleAssignmentDisposable] = {}
+            is_stopped = False
+
+            def remove(key):
+                subscription = subscriptions.pop(key, None)
+                if subscription is not None:
+                    group.remove(subscription)
+
+            def on_next(pair):
+                key, inner_source = pair
+
+                with lock:
+                    remove(key)
+                    if inner_source is None:
+                        if key in values:
+                            del values[key]
+                            observer.on_next(view)
+                        if is_stopped and not subscriptions:
+                            observer.on_completed()
+                        return
+
+                    subscription = SingleAssignmentDisposable()
+                    subscriptions[key] = subscription
+                    group.add(subscription)
+
+                inner_source = from_future(inner_source) if is_future(inner_source) else inner_source
+
+                def on_next_inner(value):
+                    with lock:
+                        if subscriptions.get(key) is not subscription:
+                            return
+                        values[key] = value
+                        observer.on_next(view)
+
+                def on_error_inner(error):
+                    with lock:
+                        observer.on_error(error)
+
+                def on_completed_inner():
+                    with lock:
+                        if subscriptions.get(key) is not subscription:
+                            return
+                        remove(key)
+                        if is_stopped and not subscriptions:
+                            observer.on_completed()
+
+                subscription.disposable = inner_source.subscribe_(on_next_inner, on_error_inner, on_completed_inner,
+                                                                  scheduler)
+
+            def on_error(error):
+                with lock:
+                    observer.on_error(error)
+
+            def on_completed():
+                nonlocal is_stopped
+
+                with lock:
+                    is_stopped = True
+                    if not subscriptions:
+                        observer.on_completed()
+
+            group.add(source.subscribe_(on_next, on_error, on_completed, scheduler))
+            return group
+        return Observable(subscribe)
+    return combine_latest_keyed
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Any, Callable, Sequence
 from rx.core import Observable, pipe
 from rx.core.typing import Predicate
 
@@ -11,5 +11,35 @@ def _count(predicate: Predicate = None) -> Callable[[Observable], Observable]:
         filtering = ops.filter(predicate)
         return pipe(filtering, ops.count())
 
-    counter = ops.reduce(lambda n, _: n + 1, seed=0)
-    return pipe(counter)
+    def count(source: Observable) -> Observable:
+        """Partially applied count operator.
+
+        Counts the elements of the source. Chunks of elements are
+        counted in a single call.
+
+        Args:
+            source: The source observable to count.
+
+        Returns:
+            An observable sequence containing a single element with the
+            number of elements in the source sequence.
+        """
+
+        def subscribe(observer, scheduler=None):
+            n = 0
+
+            def on_next(_: Any) -> None:
+                nonlocal n
+                n += 1
+
+            def on_next_batch(values: Sequence[Any]) -> None:
+                nonlocal n
+                n += len(values)
+
+            def on_completed() -> None:
+                observer.on_next(n)
+                observer.on_completed()
+
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch)
+        return Observable(subscribe)
+    return count
@@ -1,7 +1,12 @@
-from typing import Callable
-from rx.core import Observable
+import math
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from rx.core import Observable, typing
+from rx.concurrency import timeout_scheduler
 from rx.internal.basic import default_comparer
 
+
 def array_index_of_comparer(array, item, comparer):
     for i, a in enumerate(array):
         if comparer(a, item):
@@ -10,6 +15,9 @@ def array_index_of_comparer(array, item, comparer):
 
 
 class HashSet:
+    """Set of keys compared by a custom comparer. Lookups are linear,
+    so it is only used when a comparer is given."""
+
     def __init__(self, comparer):
         self.comparer = comparer
         self.set = []
@@ -21,8 +29,101 @@ class HashSet:
         return ret_value
 
 
-def _distinct(key_mapper=None, comparer=None) -> Callable[[Observable], Observable]:
-    comparer = comparer or default_comparer
+class KeySet:
+    """Set of keys compared by equality. Hashable keys are kept in a
+    set, unhashable ones fall back to a linear search."""
+
+    def __init__(self):
+        self.set = set()
+        self.unhashable = HashSet(default_comparer)
+
+    def push(self, value):
+        try:
+            if value in self.set:
+                return False
+            self.set.add(value)
+            return True
+        except TypeError:
+            return self.unhashable.push(value)
+
+
+class BoundedKeySet:
+    """Set of keys that forgets the least recently seen key once it
+    holds max_size keys, and forgets keys that have not been seen for
+    ttl. Seeing a key again refreshes it."""
+
+    def __init__(self, max_size: Optional[int], ttl, clock: Callable[[], Any]):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.keys: OrderedDict = OrderedDict()
+
+    def push(self, value):
+        keys = self.keys
+        expires = None
+
+        if self.ttl is not None:
+            now = self.clock()
+            while keys:
+                key, expiry = next(iter(keys.items()))
+                if expiry > now:
+                    break
+                del keys[key]
+            expires = now + self.ttl
+
+        if value in keys:
+            keys[value] = expires
+            keys.move_to_end(value)
+            return False
+
+        keys[value] = expires
+        if self.max_size is not None and len(keys) > self.max_size:
+            keys.popitem(last=False)
+        return True
+
+
+class BloomFilter:
+    """Approximate set of keys in a fixed size bit array. A new key is
+    reported as already seen with a probability of at most
+    false_positive_rate as long as no more than capacity keys have
+    been added. Keys already seen are always recognized."""
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError('false_positive_rate must be between 0 and 1.')
+
+        size = max(8, int(math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)))
+        self.size = size
+        self.hashes = max(1, int(round(size / capacity * math.log(2))))
+        self.bits = bytearray((size + 7) // 8)
+
+    def push(self, value):
+        size = self.size
+        bits = self.bits
+        h1 = hash(value)
+        h2 = hash((value, 0x9e3779b9)) | 1
+
+        seen = True
+        for i in range(self.hashes):
+            index = (h1 + i * h2) % size
+            mask = 1 << (index & 7)
+            if not bits[index >> 3] & mask:
+                seen = False
+                bits[index >> 3] |= mask
+        return not seen
+
+
+def _distinct(key_mapper=None,
+              comparer=None,
+              max_size: Optional[int] = None,
+              ttl: Optional[typing.RelativeTime] = None,
+              false_positive_rate: Optional[float] = None,
+              scheduler: Optional[typing.Scheduler] = None
+              ) -> Callable[[Observable], Observable]:
+    if comparer and (max_size is not None or ttl is not None or false_positive_rate is not None):
+        raise ValueError('A comparer cannot be combined with bounded distinct modes.')
+    if false_positive_rate is not None and ttl is not None:
+        raise ValueError('The approximate distinct mode does not support a ttl.')
 
     def distinct(source: Observable) -> Observable:
         """Returns an observable sequence that contains only distinct
@@ -42,8 +143,17 @@ def _distinct(key_mapper=None, comparer=None) -> Callable[[Observable], Observab
             sequence.
         """
 
-        def subscribe(observer, scheduler=None):
-            hashset = HashSet(comparer)
+        def subscribe(observer, scheduler_=None):
+            if comparer:
+                hashset = HashSet(comparer)
+            elif false_positive_rate is not None:
+                hashset = BloomFilter(max_size or 1000000, false_positive_rate)
+            elif max_size is not None or ttl is not None:
+                _scheduler = scheduler or scheduler_ or timeout_scheduler
+                _ttl = None if ttl is None else _scheduler.to_timedelta(ttl)
+                hashset = BoundedKeySet(max_size, _ttl, lambda: _scheduler.now)
+            else:
+                hashset = KeySet()
 
             def on_next(x):
                 key = x
@@ -55,7 +165,14 @@ def _distinct(key_mapper=None, comparer=None) -> Callable[[Observable], Observab
                         observer.on_error(ex)
                         return
 
-                hashset.push(key) and observer.on_next(x)
-            return source.subscribe_(on_next, observer.on_error,observer.on_completed, scheduler)
+                try:
+                    is_new = hashset.push(key)
+                except Exception as ex:
+                    observer.on_error(ex)
+                    return
+
+                if is_new:
+                    observer.on_next(x)
+            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler_)
         return Observable(subscribe)
     return distinct
@@ -1,7 +1,8 @@
-from typing import Callable
+from typing import Any, Callable
 
 from rx.core import Observable
-from rx.core.typing import Predicate, PredicateIndexed, Scheduler, Observer, Disposable
+from rx.core.observable.fusedobservable import fuse, DROP
+from rx.core.typing import Predicate, PredicateIndexed
 
 
 # pylint: disable=redefined-builtin
@@ -22,19 +23,12 @@ def _filter(predicate: Predicate) -> Callable[[Observable], Observable]:
             A filtered observable sequence.
         """
 
-        def subscribe(observer: Observer, scheduler: Scheduler) -> Disposable:
-            def on_next(value):
-                try:
-                    should_run = predicate(value)
-                except Exception as ex:  # pylint: disable=broad-except
-                    observer.on_error(ex)
-                    return
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
+            def step(value: Any) -> Any:
+                return value if predicate(value) else DROP
+            return step
 
-                if should_run:
-                    observer.on_next(value)
-
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, stage)
     return filter
 
 
@@ -55,22 +49,16 @@ def _filter_indexed(predicate_indexed: PredicateIndexed = None) -> Callable[[Obs
             A filtered observable sequence.
         """
 
-        def subscribe(observer: Observer, scheduler: Scheduler):
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
             count = 0
 
-            def on_next(value):
+            def step(value: Any) -> Any:
                 nonlocal count
-                try:
-                    should_run = predicate_indexed(value, count)
-                except Exception as ex:  # pylint: disable=broad-except
-                    observer.on_error(ex)
-                    return
-                else:
-                    count += 1
-
-                if should_run:
-                    observer.on_next(value)
-
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+
+                should_run = predicate_indexed(value, count)
+                count += 1
+                return value if should_run else DROP
+            return step
+
+        return fuse(source, stage)
     return filter_indexed
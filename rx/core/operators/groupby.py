@@ -1,12 +1,184 @@
-from typing import Callable
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 
-import rx
-from rx import operators as ops
-from rx.core import Observable, GroupedObservable
+from rx.concurrency import timeout_scheduler
+from rx.core import Observable, GroupedObservable, typing
+from rx.disposable import CompositeDisposable, Disposable, RefCountDisposable, SerialDisposable
+from rx.internal.basic import identity
 
 
-def _group_by(key_mapper, element_mapper=None) -> Callable[[Observable], Observable]:
-    def duration_mapper(_):
-        return rx.never()
+class GroupWriter(Observable):
+    """Hot observable receiving the elements of a single group. Unlike
+    a subject it is driven by the group_by operator only, so it keeps
+    no state besides a tuple of observers."""
 
-    return ops.group_by_until(key_mapper, element_mapper, duration_mapper)
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.observers: Tuple[typing.Observer, ...] = ()
+        self.is_stopped = False
+        self.error: Optional[Exception] = None
+
+    def _subscribe_core(self, observer, scheduler=None):
+        with self.lock:
+            if not self.is_stopped:
+                self.observers += (observer,)
+
+                def dispose():
+                    with self.lock:
+                        self.observers = tuple(o for o in self.observers if o is not observer)
+                return Disposable(dispose)
+
+        if self.error is not None:
+            observer.on_error(self.error)
+        else:
+            observer.on_completed()
+        return Disposable()
+
+    def on_next(self, value: Any) -> None:
+        for observer in self.observers:
+            observer.on_next(value)
+
+    def on_error(self, error: Exception) -> None:
+        with self.lock:
+            observers, self.observers = self.observers, ()
+            self.is_stopped = True
+            self.error = error
+        for observer in observers:
+            observer.on_error(error)
+
+    def on_completed(self) -> None:
+        with self.lock:
+            observers, self.observers = self.observers, ()
+            self.is_stopped = True
+        for observer in observers:
+            observer.on_completed()
+
+
+class Group:
+    __slots__ = ('writer', 'last_seen')
+
+    def __init__(self, writer: GroupWriter, last_seen: Any) -> None:
+        self.writer = writer
+        self.last_seen = last_seen
+
+
+def _group_by(key_mapper,
+              element_mapper=None,
+              max_groups: Optional[int] = None,
+              idle_timeout: Optional[typing.RelativeTime] = None,
+              scheduler: Optional[typing.Scheduler] = None
+              ) -> Callable[[Observable], Observable]:
+    element_mapper = element_mapper or identity
+
+    if max_groups is not None and max_groups < 1:
+        raise ValueError('max_groups must be at least 1.')
+
+    def group_by(source: Observable) -> Observable:
+        """Groups the elements of the source by key.
+
+        Groups are kept in least recently used order. If max_groups is
+        set, the least recently used group is completed when a new
+        group would exceed the limit. If idle_timeout is set, groups
+        without elements for that long are completed by a single timer.
+        A group that was completed is reborn as a new group when its
+        key occurs again.
+
+        Args:
+            source: The source observable.
+
+        Returns:
+            A sequence of observable groups.
+        """
+
+        def subscribe(observer, scheduler_=None):
+            _scheduler = scheduler or scheduler_ or timeout_scheduler
+            timeout = None if idle_timeout is None else _scheduler.to_timedelta(idle_timeout)
+
+            groups: OrderedDict = OrderedDict()
+            lock = threading.RLock()
+            group_disposable = CompositeDisposable()
+            ref_count_disposable = RefCountDisposable(group_disposable)
+            timer = SerialDisposable()
+            timer_pending = False
+            group_disposable.add(timer)
+
+            def fail(error: Exception) -> None:
+                with lock:
+                    writers = [group.writer for group in groups.values()]
+                    groups.clear()
+                for writer in writers:
+                    writer.on_error(error)
+                observer.on_error(error)
+
+            def expire(_, __) -> None:
+                nonlocal timer_pending
+
+                expired = []
+                with lock:
+                    now = _scheduler.now
+                    while groups:
+                        key, group = next(iter(groups.items()))
+                        if group.last_seen + timeout > now:
+                            break
+                        del groups[key]
+                        expired.append(group.writer)
+
+                    if groups:
+                        first = next(iter(groups.values()))
+                        timer.disposable = _scheduler.schedule_relative(first.last_seen + timeout - now, expire)
+                    else:
+                        timer_pending = False
+
+                for writer in expired:
+                    writer.on_completed()
+
+            def on_next(x: Any) -> None:
+                nonlocal timer_pending
+
+                try:
+                    key = key_mapper(x)
+                    element = element_mapper(x)
+                except Exception as error:  # pylint: disable=broad-except
+                    fail(error)
+                    return
+
+                evicted = None
+                with lock:
+                    now = _scheduler.now if timeout is not None else None
+                    group = groups.get(key)
+                    if group is None:
+                        group = groups[key] = Group(GroupWriter(), now)
+                        is_new = True
+                        if max_groups is not None and len(groups) > max_groups:
+                            evicted = groups.popitem(last=False)[1].writer
+                    else:
+                        is_new = False
+                        group.last_seen = now
+                        groups.move_to_end(key)
+
+                    if timeout is not None and not timer_pending:
+                        timer_pending = True
+                        timer.disposable = _scheduler.schedule_relative(timeout, expire)
+
+                if evicted is not None:
+                    evicted.on_completed()
+
+                if is_new:
+                    observer.on_next(GroupedObservable(key, group.writer, ref_count_disposable))
+
+                group.writer.on_next(element)
+
+            def on_completed() -> None:
+                with lock:
+                    writers = [group.writer for group in groups.values()]
+                    groups.clear()
+                for writer in writers:
+                    writer.on_completed()
+                observer.on_completed()
+
+            group_disposable.add(source.subscribe_(on_next, fail, on_completed, scheduler_))
+            return ref_count_disposable
+        return Observable(subscribe)
+    return group_by
@@ -0,0 +1,131 @@
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from rx.concurrency import timeout_scheduler
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, SerialDisposable
+
+
+class JoinWindow:
+    """Live elements of one side of a join, hashed by key. Every
+    element lives for the same window, so elements expire in arrival
+    order and a queue of expiry times is enough to evict them."""
+
+    __slots__ = ('entries', 'expiry', 'done')
+
+    def __init__(self) -> None:
+        self.entries: Dict[Hashable, Deque[Any]] = {}
+        self.expiry: Deque[Tuple[datetime, Hashable]] = deque()
+        self.done = False
+
+    def add(self, key: Hashable, value: Any, expires: datetime) -> None:
+        bucket = self.entries.get(key)
+        if bucket is None:
+            bucket = self.entries[key] = deque()
+        bucket.append(value)
+        self.expiry.append((expires, key))
+
+    def evict(self, now: datetime) -> None:
+        expiry = self.expiry
+        entries = self.entries
+        while expiry and expiry[0][0] <= now:
+            key = expiry.popleft()[1]
+            bucket = entries[key]
+            bucket.popleft()
+            if not bucket:
+                del entries[key]
+
+    def __len__(self) -> int:
+        return len(self.expiry)
+
+
+def _join_on(right: Observable,
+             left_key: Callable[[Any], Hashable],
+             right_key: Callable[[Any], Hashable],
+             window: typing.RelativeTime,
+             scheduler: Optional[typing.Scheduler] = None
+             ) -> Callable[[Observable], Observable]:
+    def join_on(source: Observable) -> Observable:
+        """Correlates the elements of two sequences with equal keys
+        that arrive within the window of each other.
+
+        Args:
+            source: Source observable.
+
+        Returns:
+            An observable sequence that contains tuples of left and
+            right elements with equal keys and overlapping windows.
+        """
+
+        def subscribe(observer, scheduler_=None):
+            _scheduler = scheduler or scheduler_ or timeout_scheduler
+            duration = _scheduler.to_timedelta(window)
+
+            lock = threading.RLock()
+            lefts = JoinWindow()
+            rights = JoinWindow()
+            group = CompositeDisposable()
+            timer = SerialDisposable()
+            timer_pending = False
+            group.add(timer)
+
+            def evict(now: datetime) -> None:
+                lefts.evict(now)
+                rights.evict(now)
+                if lefts.done and not lefts or rights.done and not rights:
+                    observer.on_completed()
+
+            def expire(_, __) -> None:
+                nonlocal timer_pending
+
+                with lock:
+                    now = _scheduler.now
+                    evict(now)
+
+                    if lefts or rights:
+                        first = min(side.expiry[0][0] for side in (lefts, rights) if side)
+                        timer.disposable = _scheduler.schedule_relative(first - now, expire)
+                    else:
+                        timer_pending = False
+
+            def on_next(value: Any, key_mapper: Callable[[Any], Hashable], own: JoinWindow, other: JoinWindow,
+                        is_left: bool) -> None:
+                nonlocal timer_pending
+
+                try:
+                    key = key_mapper(value)
+                except Exception as error:  # pylint: disable=broad-except
+                    on_error(error)
+                    return
+
+                with lock:
+                    now = _scheduler.now
+                    evict(now)
+                    own.add(key, value, now + duration)
+
+                    if not timer_pending:
+                        timer_pending = True
+                        timer.disposable = _scheduler.schedule_relative(duration, expire)
+
+                    for match in tuple(other.entries.get(key, ())):
+                        observer.on_next((value, match) if is_left else (match, value))
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    observer.on_error(error)
+
+            def on_completed(own: JoinWindow, other: JoinWindow) -> None:
+                with lock:
+                    own.done = True
+                    if other.done or not own:
+                        observer.on_completed()
+
+            group.add(source.subscribe_(lambda x: on_next(x, left_key, lefts, rights, True), on_error,
+                                        lambda: on_completed(lefts, rights), scheduler_))
+            group.add(right.subscribe_(lambda x: on_next(x, right_key, rights, lefts, False), on_error,
+                                       lambda: on_completed(rights, lefts), scheduler_))
+            return group
+        return Observable(subscribe)
+    return join_on
@@ -1,11 +1,10 @@
 from typing import Callable, Any
 
 from rx.internal.basic import identity
-from rx.internal.utils import infinite
 
-from rx import operators as ops
-from rx.core import Observable, pipe
-from rx.core.typing import Mapper, MapperIndexed, Observer, Disposable, Scheduler
+from rx.core import Observable
+from rx.core.observable.fusedobservable import fuse
+from rx.core.typing import Mapper, MapperIndexed
 
 
 # pylint: disable=redefined-builtin
@@ -31,17 +30,10 @@ def _map(mapper: Mapper = None) -> Callable[[Observable], Observable]:
             of the source.
         """
 
-        def subscribe(obv: Observer, scheduler: Scheduler = None) -> Disposable:
-            def on_next(value: Any) -> None:
-                try:
-                    result = _mapper(value)
-                except Exception as err:  # pylint: disable=broad-except
-                    obv.on_error(err)
-                else:
-                    obv.on_next(result)
-
-            return source.subscribe_(on_next, obv.on_error, obv.on_completed, scheduler)
-        return Observable(subscribe)
+        def stage(complete: Callable[[], None]) -> Mapper:
+            return _mapper
+
+        return fuse(source, stage)
     return map
 
 
@@ -51,7 +43,34 @@ def _map_indexed(mapper_indexed: MapperIndexed = None) -> Callable[[Observable],
 
     _mapper_indexed = mapper_indexed or _identity
 
-    return pipe(
-        ops.zip_with_iterable(infinite()),
-        ops.starmap(_mapper_indexed)
-    )
+    def map_indexed(source: Observable) -> Observable:
+        """Partially applied indexed map operator.
+
+        Project each element of an observable sequence into a new form
+        by incorporating the element's index.
+
+        Example:
+            >>> map_indexed(source)
+
+        Args:
+            source: The observable source to transform.
+
+        Returns:
+            Returns an observable sequence whose elements are the
+            result of invoking the transform function on each element
+            of the source.
+        """
+
+        def stage(complete: Callable[[], None]) -> Mapper:
+            index = 0
+
+            def step(value: Any) -> Any:
+                nonlocal index
+
+                result = _mapper_indexed(value, index)
+                index += 1
+                return result
+            return step
+
+        return fuse(source, stage)
+    return map_indexed
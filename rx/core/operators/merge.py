@@ -1,10 +1,12 @@
-from typing import Callable
+import threading
+from collections import deque
+from typing import Callable, Deque
 
 import rx
 from rx import from_future
 from rx.core import Observable
+from rx.core.observer import SerializedObserver
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
-from rx.internal.concurrency import synchronized
 from rx.internal.utils import is_future
 
 
@@ -31,43 +33,56 @@ def _merge(*sources, max_concurrent: int = None) -> Callable[[Observable], Obser
             return rx.merge(*sources_)
 
         def subscribe(observer, scheduler=None):
-            active_count = [0]
             group = CompositeDisposable()
-            is_stopped = [False]
-            queue = []
+            serializer = SerializedObserver(observer)
+            lock = threading.Lock()
+            queue: Deque[Observable] = deque()
+            active = 0
+            is_stopped = False
 
-            def subscribe(xs):
+            def subscribe_inner(xs):
                 subscription = SingleAssignmentDisposable()
                 group.add(subscription)
 
-                @synchronized(source.lock)
                 def on_completed():
+                    nonlocal active
+
                     group.remove(subscription)
-                    if queue:
-                        s = queue.pop(0)
-                        subscribe(s)
-                    else:
-                        active_count[0] -= 1
-                        if is_stopped[0] and active_count[0] == 0:
-                            observer.on_completed()
-
-                on_next = synchronized(source.lock)(observer.on_next)
-                on_error = synchronized(source.lock)(observer.on_error)
-                subscription.disposable = xs.subscribe_(on_next, on_error, on_completed, scheduler)
+                    with lock:
+                        if queue:
+                            next_source = queue.popleft()
+                        else:
+                            next_source = None
+                            active -= 1
+                            done = is_stopped and not active
+
+                    if next_source is not None:
+                        subscribe_inner(next_source)
+                    elif done:
+                        serializer.on_completed()
+
+                subscription.disposable = xs.subscribe_(serializer.on_next, serializer.on_error, on_completed, scheduler)
 
             def on_next(inner_source):
-                if active_count[0] < max_concurrent:
-                    active_count[0] += 1
-                    subscribe(inner_source)
-                else:
-                    queue.append(inner_source)
+                nonlocal active
+
+                with lock:
+                    if active >= max_concurrent:
+                        queue.append(inner_source)
+                        return
+                    active += 1
+                subscribe_inner(inner_source)
 
             def on_completed():
-                is_stopped[0] = True
-                if active_count[0] == 0:
-                    observer.on_completed()
+                nonlocal is_stopped
 
-            group.add(source.subscribe_(on_next, observer.on_error, on_completed, scheduler))
+                with lock:
+                    is_stopped = True
+                    done = not active
+                if done:
+                    serializer.on_completed()
+
+            group.add(source.subscribe_(on_next, serializer.on_error, on_completed, scheduler))
             return group
         return Observable(subscribe)
     return merge
@@ -89,33 +104,46 @@ def _merge_all() -> Callable[[Observable], Observable]:
         """
         def subscribe(observer, scheduler=None):
             group = CompositeDisposable()
-            is_stopped = [False]
             m = SingleAssignmentDisposable()
             group.add(m)
+            serializer = SerializedObserver(observer)
+            lock = threading.Lock()
+            active = 0
+            is_stopped = False
 
             def on_next(inner_source):
+                nonlocal active
+
                 inner_subscription = SingleAssignmentDisposable()
                 group.add(inner_subscription)
+                with lock:
+                    active += 1
 
                 inner_source = from_future(inner_source) if is_future(inner_source) else inner_source
 
-                @synchronized(source.lock)
                 def on_completed():
+                    nonlocal active
+
                     group.remove(inner_subscription)
-                    if is_stopped[0] and len(group) == 1:
-                        observer.on_completed()
+                    with lock:
+                        active -= 1
+                        done = is_stopped and not active
+                    if done:
+                        serializer.on_completed()
 
-                on_next = synchronized(source.lock)(observer.on_next)
-                on_error = synchronized(source.lock)(observer.on_error)
-                subscription = inner_source.subscribe_(on_next, on_error, on_completed, scheduler)
+                subscription = inner_source.subscribe_(serializer.on_next, serializer.on_error, on_completed, scheduler)
                 inner_subscription.disposable = subscription
 
             def on_completed():
-                is_stopped[0] = True
-                if len(group) == 1:
-                    observer.on_completed()
+                nonlocal is_stopped
+
+                with lock:
+                    is_stopped = True
+                    done = not active
+                if done:
+                    serializer.on_completed()
 
-            m.disposable = source.subscribe_(on_next, observer.on_error, on_completed, scheduler)
+            m.disposable = source.subscribe_(on_next, serializer.on_error, on_completed, scheduler)
             return group
 
         return Observable(subscribe)
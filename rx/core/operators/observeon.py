@@ -1,10 +1,16 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from rx.core import Observable
-from rx.core.observer import ObserveOnObserver
+from rx.core.observer import ObserveOnObserver, BufferCounters
 
 
-def _observe_on(scheduler) -> Callable[[Observable], Observable]:
+def _observe_on(scheduler,
+                batch_size: Optional[int] = None,
+                time_budget: Optional[float] = None,
+                max_buffer: Optional[int] = None,
+                overflow: str = 'block',
+                counters: Optional[BufferCounters] = None
+                ) -> Callable[[Observable], Observable]:
     def observe_on(source: Observable) -> Observable:
         """Wraps the source sequence in order to run its observer
         callbacks on the specified scheduler.
@@ -17,13 +23,13 @@ def _observe_on(scheduler) -> Callable[[Observable], Observable]:
         Args:
             source: Source observable.
 
-
         Returns:
             Returns the source sequence whose observations happen on
             the specified scheduler.
         """
         def subscribe(observer, _=None):
-            return source.subscribe(ObserveOnObserver(scheduler, observer))
+            return source.subscribe(ObserveOnObserver(scheduler, observer, batch_size, time_budget,
+                                                      max_buffer, overflow, counters))
 
         return Observable(subscribe)
     return observe_on
\ No newline at end of file
@@ -0,0 +1,182 @@
+import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, Disposable
+
+
+def map_chunk(mapper: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    """Runs the mapper over a chunk on a worker. Defined at module
+    level so that it can be pickled for process pools."""
+
+    return [mapper(value) for value in chunk]
+
+
+def _parallel_map(mapper: Callable[[Any], Any],
+                  executor: Optional[Executor] = None,
+                  max_workers: Optional[int] = None,
+                  ordered: bool = True,
+                  chunksize: int = 1
+                  ) -> Callable[[Observable], Observable]:
+    if chunksize < 1:
+        raise ValueError('chunksize must be at least 1.')
+
+    def parallel_map(source: Observable) -> Observable:
+        """Projects each element of the source on a pool of workers.
+
+        Elements are collected in chunks of chunksize elements and each
+        chunk is mapped by a single task. At most twice as many chunks
+        as there are workers are submitted but not yet emitted at any
+        time. When the window is full, the source is blocked until the
+        next chunk is emitted.
+
+        Args:
+            source: The source observable.
+
+        Returns:
+            An observable sequence with the projected elements, in
+            source order if ordered is set and in completion order
+            otherwise.
+        """
+
+        def subscribe(observer: typing.Observer, scheduler: typing.Scheduler = None) -> typing.Disposable:
+            pool = executor or ThreadPoolExecutor(max_workers)
+            workers = max_workers or getattr(pool, '_max_workers', None) or os.cpu_count() or 1
+            max_in_flight = 2 * workers
+            batched = getattr(observer, 'supports_batch', False)
+
+            condition = threading.Condition()
+            results: Dict[int, List[Any]] = {}
+            chunk: List[Any] = []
+            submitted = 0
+            emitted = 0
+            source_done = False
+            stopped = False
+            draining = False
+            error: Optional[Exception] = None
+
+            def shutdown() -> None:
+                if executor is None:
+                    pool.shutdown(wait=False)
+
+            def fail(ex: Exception) -> None:
+                nonlocal error, stopped
+                with condition:
+                    if stopped:
+                        return
+                    error = ex
+                    condition.notify_all()
+                drain()
+
+            def on_chunk_done(index: int, future: Future) -> None:
+                try:
+                    values = future.result()
+                except Exception as ex:  # pylint: disable=broad-except
+                    fail(ex)
+                    return
+
+                with condition:
+                    results[index] = values
+                drain()
+
+            def submit() -> None:
+                nonlocal chunk, submitted
+
+                with condition:
+                    while submitted - emitted >= max_in_flight and not stopped and error is None:
+                        condition.wait()
+                    if stopped or error is not None:
+                        return
+
+                    values, chunk = chunk, []
+                    index = submitted
+                    submitted += 1
+
+                try:
+                    future = pool.submit(map_chunk, mapper, values)
+                except Exception as ex:  # pylint: disable=broad-except
+                    fail(ex)
+                    return
+                future.add_done_callback(lambda future: on_chunk_done(index, future))
+
+            def drain() -> None:
+                """Emits completed chunks. Only one thread drains at a
+                time, the others leave their results to it."""
+
+                nonlocal draining, emitted, stopped
+
+                with condition:
+                    if draining or stopped:
+                        return
+                    draining = True
+
+                while True:
+                    with condition:
+                        if error is not None:
+                            stopped = True
+                            draining = False
+                            condition.notify_all()
+                            ready = error
+                        elif ordered:
+                            ready = []
+                            while emitted in results:
+                                ready.append(results.pop(emitted))
+                                emitted += 1
+                            condition.notify()
+                        else:
+                            ready = list(results.values())
+                            emitted += len(ready)
+                            results.clear()
+                            condition.notify()
+
+                        if not isinstance(ready, Exception) and not ready:
+                            if source_done and emitted == submitted:
+                                stopped = True
+                            draining = False
+                            if not stopped:
+                                return
+
+                    if isinstance(ready, Exception):
+                        shutdown()
+                        observer.on_error(ready)
+                        return
+
+                    if not ready:
+                        shutdown()
+                        observer.on_completed()
+                        return
+
+                    for values in ready:
+                        if batched:
+                            observer.on_next_batch(values)
+                        else:
+                            for value in values:
+                                observer.on_next(value)
+
+            def on_next(value: Any) -> None:
+                chunk.append(value)
+                if len(chunk) >= chunksize:
+                    submit()
+
+            def on_completed() -> None:
+                nonlocal source_done
+
+                if chunk:
+                    submit()
+                with condition:
+                    source_done = True
+                drain()
+
+            def dispose() -> None:
+                nonlocal stopped
+                with condition:
+                    stopped = True
+                    condition.notify_all()
+                shutdown()
+
+            subscription = source.subscribe_(on_next, fail, on_completed, scheduler)
+            return CompositeDisposable(subscription, Disposable(dispose))
+        return Observable(subscribe)
+    return parallel_map
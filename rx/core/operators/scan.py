@@ -1,8 +1,8 @@
 from typing import Any, Callable
 
-from rx import defer, operators as ops
 from rx.internal.utils import NotSet
 from rx.core import Observable
+from rx.core.observable.fusedobservable import fuse
 
 def _scan(accumulator: Callable[[Any, Any], Any], seed: Any = NotSet) -> Callable[[Observable], Observable]:
     has_seed = seed is not NotSet
@@ -23,20 +23,21 @@ def _scan(accumulator: Callable[[Any, Any], Any], seed: Any = NotSet) -> Callabl
             An observable sequence containing the accumulated values.
         """
 
-        def factory(scheduler):
-            nonlocal source
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
+            has_accumulation = False
+            accumulation = None
 
-            has_accumulation = [False]
-            accumulation = [None]
+            def step(value: Any) -> Any:
+                nonlocal has_accumulation, accumulation
 
-            def projection(x):
-                if has_accumulation[0]:
-                    accumulation[0] = accumulator(accumulation[0], x)
+                if has_accumulation:
+                    accumulation = accumulator(accumulation, value)
                 else:
-                    accumulation[0] = accumulator(seed, x) if has_seed else x
-                    has_accumulation[0] = True
+                    accumulation = accumulator(seed, value) if has_seed else value
+                    has_accumulation = True
 
-                return accumulation[0]
-            return source.pipe(ops.map(projection))
-        return defer(factory)
+                return accumulation
+            return step
+
+        return fuse(source, stage)
     return scan
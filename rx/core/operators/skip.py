@@ -1,6 +1,7 @@
-from typing import Callable
+from typing import Any, Callable
 
 from rx.core import Observable
+from rx.core.observable.fusedobservable import fuse, DROP
 from rx.internal import ArgumentOutOfRangeException
 
 
@@ -22,17 +23,18 @@ def _skip(count: int) -> Callable[[Observable], Observable]:
             after the specified index in the input sequence.
         """
 
-        def subscribe(observer, scheduler=None):
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
             remaining = count
 
-            def on_next(value):
+            def step(value: Any) -> Any:
                 nonlocal remaining
 
                 if remaining <= 0:
-                    observer.on_next(value)
-                else:
-                    remaining -= 1
+                    return value
 
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+                remaining -= 1
+                return DROP
+            return step
+
+        return fuse(source, stage)
     return skip
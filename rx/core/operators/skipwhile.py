@@ -1,7 +1,7 @@
-from typing import Callable
+from typing import Any, Callable
 
-from rx import operators as ops
-from rx.core import Observable, typing, pipe
+from rx.core import Observable, typing
+from rx.core.observable.fusedobservable import fuse, DROP
 
 
 def _skip_while(predicate: typing.Predicate) -> Callable[[Observable], Observable]:
@@ -22,30 +22,54 @@ def _skip_while(predicate: typing.Predicate) -> Callable[[Observable], Observabl
             input sequence starting at the first element in the linear
             series that does not pass the test specified by predicate.
         """
-        def subscribe(observer, scheduler=None):
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
             running = False
 
-            def on_next(value):
+            def step(value: Any) -> Any:
                 nonlocal running
 
                 if not running:
-                    try:
-                        running = not predicate(value)
-                    except Exception as exn:
-                        observer.on_error(exn)
-                        return
+                    running = not predicate(value)
 
-                if running:
-                    observer.on_next(value)
+                return value if running else DROP
+            return step
 
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, stage)
     return skip_while
 
 
 def _skip_while_indexed(predicate: typing.PredicateIndexed) -> Callable[[Observable], Observable]:
-    return pipe(
-        ops.map_indexed(lambda x, i: (x, i)),
-        ops.skip_while(lambda x: predicate(*x)),
-        ops.map(lambda x: x[0])
-    )
+    def skip_while_indexed(source: Observable) -> Observable:
+        """Bypasses elements in an observable sequence as long as a
+        specified condition is true and then returns the remaining
+        elements. The element's index is used in the logic of the
+        predicate function.
+
+        Example:
+            >>> skip_while_indexed(source)
+
+        Args:
+            source: The source observable to skip elements from.
+
+        Returns:
+            An observable sequence that contains the elements from the
+            input sequence starting at the first element in the linear
+            series that does not pass the test specified by predicate.
+        """
+
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
+            running = False
+            i = 0
+
+            def step(value: Any) -> Any:
+                nonlocal running, i
+
+                if not running:
+                    running = not predicate(value, i)
+                    i += 1
+
+                return value if running else DROP
+            return step
+
+        return fuse(source, stage)
+    return skip_while_indexed
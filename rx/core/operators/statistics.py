@@ -1,57 +1,298 @@
-from rx.core import ObservableBase, Observable
 import math
+from bisect import insort
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
+from rx import operators
+from rx.core import Observable
+from rx.internal import SequenceContainsNoElementsError
 
-def determine_median(sorted_list):
-    if len(sorted_list) == 0:
-        raise Exception("The input sequence was empty")
 
-    if len(sorted_list) % 2 == 1:
-        return sorted_list[int((len(sorted_list) + 1) / 2) - 1]
-    else:
-        median_1 = sorted_list[int((len(sorted_list) + 1) / 2) - 1]
-        median_2 = sorted_list[int((len(sorted_list) + 1) / 2)]
-        return float(median_1 + median_2) / 2.0
+class Statistics(NamedTuple):
+    count: int
+    mean: float
+    variance: float
+    stddev: float
+    min: Any
+    max: Any
+    quantiles: Dict[float, float]
 
 
-def median(source: ObservableBase) -> ObservableBase:
-    """
-    Calculates the statistical median on numerical emissions. The sequence must be finite.
-    """
-    return source.to_sorted_list().map(lambda l: determine_median(l))
+class RunningStats:
+    """Count, mean, variance, minimum and maximum of a stream of
+    numbers in constant memory. The variance is updated with Welford's
+    algorithm and is the sample variance."""
 
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
 
-def mode(source: ObservableBase) -> ObservableBase:
-    """
-    Returns the most frequently emitted value (or "values" if they have the same number of occurrences).
-    The sequence must be finite.
-    """
-    return source.group_by(lambda v: v) \
-        .flat_map(lambda grp: grp.count().map(lambda ct: (grp.key, ct))) \
-        .to_sorted_list(lambda t: t[1], reverse=True) \
-        .flat_map(lambda l: Observable.from_(l).take_while(lambda t: t[1] == l[0][1])) \
-        .map(lambda t: t[0])
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Any = None
+        self.max: Any = None
 
+    def push(self, value: Any) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
 
-def variance(source: ObservableBase) -> ObservableBase:
-    """
-    Returns the statistical variance of the numerical emissions.
-    The sequence must be finite.
-    """
-    squared_values = source.to_list() \
-        .flat_map(lambda l: Observable.from_(l).average().flat_map(lambda avg: Observable.from_(l).map(lambda i: i - avg))) \
-        .map(lambda i: i * i) \
-        .publish() \
-        .auto_connect(2)
+        if self.count == 1:
+            self.min = self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
 
-    return Observable.zip(squared_values.sum(), squared_values.count(), lambda sum, ct: sum / (ct - 1))
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
 
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
 
-def standard_deviation(source: ObservableBase) -> ObservableBase:
-    """
-    Returns the standard deviation of the numerical emissions:
-    The sequence must be finite.
-    """
-    return source.variance().map(lambda i: math.sqrt(i))
 
+class RollingStats:
+    """Count, mean, variance, minimum and maximum of the last size
+    numbers of a stream. Values leaving the window are removed from the
+    Welford state, the minimum and maximum are kept in monotonic
+    queues."""
 
+    __slots__ = ('size', 'values', 'count', 'mean', 'm2', 'mins', 'maxs', 'index')
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError('size must be at least 1.')
+
+        self.size = size
+        self.values: Deque[Any] = deque()
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.mins: Deque[Tuple[int, Any]] = deque()
+        self.maxs: Deque[Tuple[int, Any]] = deque()
+        self.index = 0
+
+    def push(self, value: Any) -> None:
+        values = self.values
+        if len(values) == self.size:
+            old = values.popleft()
+            self.count -= 1
+            if self.count:
+                delta = old - self.mean
+                self.mean -= delta / self.count
+                self.m2 -= delta * (old - self.mean)
+            else:
+                self.mean = self.m2 = 0.0
+
+        values.append(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        index = self.index
+        self.index += 1
+        start = index - self.size + 1
+
+        mins = self.mins
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((index, value))
+        while mins[0][0] < start:
+            mins.popleft()
+
+        maxs = self.maxs
+        while maxs and maxs[-1][1] <= value:
+            maxs.pop()
+        maxs.append((index, value))
+        while maxs[0][0] < start:
+            maxs.popleft()
+
+    @property
+    def min(self) -> Any:
+        return self.mins[0][1] if self.mins else None
+
+    @property
+    def max(self) -> Any:
+        return self.maxs[0][1] if self.maxs else None
+
+    @property
+    def variance(self) -> float:
+        return max(self.m2, 0.0) / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """Approximate quantile of a stream of numbers in constant memory,
+    using the P-square algorithm of Jain and Chlamtac. The estimate is
+    exact for the first five values."""
+
+    __slots__ = ('p', 'count', 'heights', 'positions', 'desired', 'increments')
+
+    def __init__(self, p: float) -> None:
+        if not 0 <= p <= 1:
+            raise ValueError('p must be between 0 and 1.')
+
+        self.p = p
+        self.count = 0
+        self.heights: List[float] = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def push(self, value: float) -> None:
+        self.count += 1
+        heights = self.heights
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= heights[k + 1]:
+                k += 1
+
+        positions = self.positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        desired = self.desired
+        for i, increment in enumerate(self.increments):
+            desired[i] += increment
+
+        for i in (1, 2, 3):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + d * (heights[i + d] - heights[i]) / (positions[i + d] - positions[i])
+                heights[i] = height
+                positions[i] += d
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q = self.heights
+        n = self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    @property
+    def value(self) -> Optional[float]:
+        heights = self.heights
+        if not heights:
+            return None
+        if self.count <= 5:
+            rank = self.p * (len(heights) - 1)
+            lower = int(rank)
+            upper = min(lower + 1, len(heights) - 1)
+            return heights[lower] + (heights[upper] - heights[lower]) * (rank - lower)
+        return heights[2]
+
+
+class StatisticsAccumulator:
+    """Single pass accumulator of all statistics of a stream."""
+
+    __slots__ = ('stats', 'estimators')
+
+    def __init__(self, quantiles: Sequence[float], window: Optional[int] = None) -> None:
+        self.stats = RollingStats(window) if window else RunningStats()
+        self.estimators = [P2Quantile(p) for p in quantiles]
+
+    @property
+    def count(self) -> int:
+        return self.stats.count
+
+    def push(self, value: Any) -> None:
+        self.stats.push(value)
+        for estimator in self.estimators:
+            estimator.push(value)
+
+    def snapshot(self) -> Statistics:
+        stats = self.stats
+        return Statistics(
+            count=stats.count,
+            mean=stats.mean,
+            variance=stats.variance,
+            stddev=stats.stddev,
+            min=stats.min,
+            max=stats.max,
+            quantiles={estimator.p: estimator.value for estimator in self.estimators})
+
+
+def _accumulate(factory: Callable[[], Any], push: Callable[[Any, Any], None], result: Callable[[Any], Any],
+                key_mapper: Optional[Callable[[Any], Any]], emit_each: bool) -> Callable[[Observable], Observable]:
+    def accumulate(source: Observable) -> Observable:
+        if key_mapper:
+            source = source.pipe(operators.map(key_mapper))
+
+        def subscribe(observer, scheduler=None):
+            state = factory()
+
+            def on_next(value: Any) -> None:
+                try:
+                    push(state, value)
+                    if emit_each:
+                        value = result(state)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                if emit_each:
+                    observer.on_next(value)
+
+            def on_completed() -> None:
+                if not emit_each:
+                    if not state.count:
+                        observer.on_error(SequenceContainsNoElementsError('The input sequence was empty'))
+                        return
+                    observer.on_next(result(state))
+                observer.on_completed()
+
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler)
+        return Observable(subscribe)
+    return accumulate
+
+
+def _statistics(quantiles: Sequence[float] = (), key_mapper=None) -> Callable[[Observable], Observable]:
+    return _accumulate(lambda: StatisticsAccumulator(quantiles), StatisticsAccumulator.push,
+                       StatisticsAccumulator.snapshot, key_mapper, False)
+
+
+def _running_statistics(quantiles: Sequence[float] = (), key_mapper=None) -> Callable[[Observable], Observable]:
+    return _accumulate(lambda: StatisticsAccumulator(quantiles), StatisticsAccumulator.push,
+                       StatisticsAccumulator.snapshot, key_mapper, True)
+
+
+def _rolling_statistics(window: int, key_mapper=None) -> Callable[[Observable], Observable]:
+    if window < 1:
+        raise ValueError('window must be at least 1.')
+
+    return _accumulate(lambda: StatisticsAccumulator((), window), StatisticsAccumulator.push,
+                       StatisticsAccumulator.snapshot, key_mapper, True)
+
+
+def _variance(key_mapper=None) -> Callable[[Observable], Observable]:
+    return _accumulate(RunningStats, RunningStats.push, lambda stats: stats.variance, key_mapper, False)
+
+
+def _standard_deviation(key_mapper=None) -> Callable[[Observable], Observable]:
+    return _accumulate(RunningStats, RunningStats.push, lambda stats: stats.stddev, key_mapper, False)
+
+
+def _quantile(p: float, key_mapper=None) -> Callable[[Observable], Observable]:
+    if not 0 <= p <= 1:
+        raise ValueError('p must be between 0 and 1.')
+
+    return _accumulate(lambda: P2Quantile(p), P2Quantile.push, lambda estimator: estimator.value, key_mapper, False)
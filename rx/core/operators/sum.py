@@ -1,4 +1,5 @@
-from typing import Callable
+import builtins
+from typing import Any, Callable, Sequence
 
 from rx import operators as ops
 from rx.core import Observable, pipe
@@ -12,4 +13,44 @@ def _sum(key_mapper: Mapper = None) -> Callable[[Observable], Observable]:
             ops.sum()
         )
 
-    return ops.reduce(seed=0, accumulator=lambda prev, curr: prev + curr)
+    # pylint: disable=redefined-builtin
+    def sum(source: Observable) -> Observable:
+        """Partially applied sum operator.
+
+        Computes the sum of the elements of the source. Chunks of
+        elements are summed in a single call.
+
+        Args:
+            source: The source observable to sum.
+
+        Returns:
+            An observable sequence containing a single element with the
+            sum of the values in the source sequence.
+        """
+
+        def subscribe(observer, scheduler=None):
+            total = 0
+
+            def on_next(value: Any) -> None:
+                nonlocal total
+
+                try:
+                    total += value
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+
+            def on_next_batch(values: Sequence[Any]) -> None:
+                nonlocal total
+
+                try:
+                    total = builtins.sum(values, total)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+
+            def on_completed() -> None:
+                observer.on_next(total)
+                observer.on_completed()
+
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch)
+        return Observable(subscribe)
+    return sum
@@ -1,7 +1,8 @@
-from typing import Callable
+from typing import Any, Callable
 
 from rx import empty
 from rx.core import Observable
+from rx.core.observable.fusedobservable import fuse, DROP
 from rx.internal import ArgumentOutOfRangeException
 
 
@@ -25,18 +26,20 @@ def _take(count: int) -> Callable[[Observable], Observable]:
         if not count:
             return empty()
 
-        def subscribe(observer, scheduler=None):
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
             remaining = count
 
-            def on_next(value):
+            def step(value: Any) -> Any:
                 nonlocal remaining
 
-                if remaining > 0:
-                    remaining -= 1
-                    observer.on_next(value)
-                    if not remaining:
-                        observer.on_completed()
+                if remaining <= 0:
+                    return DROP
 
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+                remaining -= 1
+                if not remaining:
+                    complete()
+                return value
+            return step
+
+        return fuse(source, stage)
     return take
@@ -1,6 +1,7 @@
 from typing import Any, Callable
 
 from rx.core import Observable
+from rx.core.observable.fusedobservable import fuse, DROP
 
 
 def _take_while(predicate: Callable[[Any], Any]) -> Callable[[Observable], Observable]:
@@ -21,29 +22,16 @@ def _take_while(predicate: Callable[[Any], Any]) -> Callable[[Observable], Obser
             test no longer passes.
         """
 
-        def subscribe(observer, scheduler=None):
-            running = True
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
+            def step(value: Any) -> Any:
+                if predicate(value):
+                    return value
 
-            def on_next(value):
-                nonlocal running
+                complete()
+                return DROP
+            return step
 
-                with source.lock:
-                    if not running:
-                        return
-
-                    try:
-                        running = predicate(value)
-                    except Exception as exn:
-                        observer.on_error(exn)
-                        return
-
-                if running:
-                    observer.on_next(value)
-                else:
-                    observer.on_completed()
-
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, stage)
     return take_while
 
 
@@ -65,30 +53,20 @@ def _take_while_indexed(predicate: Callable[[Any, int], Any]) -> Callable[[Obser
             test no longer passes.
         """
 
-        def subscribe(observer, scheduler=None):
-            running = True
+        def stage(complete: Callable[[], None]) -> Callable[[Any], Any]:
             i = 0
 
-            def on_next(value: Any) -> None:
-                nonlocal running, i
-
-                with source.lock:
-                    if not running:
-                        return
-
-                    try:
-                        running = predicate(value, i)
-                    except Exception as exn:
-                        observer.on_error(exn)
-                        return
-                    else:
-                        i += 1
+            def step(value: Any) -> Any:
+                nonlocal i
 
+                running = predicate(value, i)
+                i += 1
                 if running:
-                    observer.on_next(value)
-                else:
-                    observer.on_completed()
+                    return value
+
+                complete()
+                return DROP
+            return step
 
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, stage)
     return take_while_indexed
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Optional
+
+from rx.core import Observable
+from rx.core.observer.scheduledobserver import COMPLETED, OnErrorNotification
+
+DEFAULT_MAX_BUFFER = 1024
+
+
+def _to_async_iterable(max_buffer: Optional[int] = None) -> Callable[[Observable], AsyncIterator]:
+    max_buffer = max_buffer or DEFAULT_MAX_BUFFER
+
+    def to_async_iterable(source: Observable) -> AsyncIterator:
+        """Converts an observable sequence to an asynchronous iterator.
+
+        The source is subscribed when iteration starts and disposed
+        when iteration stops. Elements are buffered until the iterating
+        coroutine takes them. Producers running on other threads are
+        blocked while max_buffer elements are buffered. Producers
+        running on the thread of the event loop cannot be blocked, so
+        their elements are always buffered.
+
+        Example:
+            >>> async for value in source.pipe(ops.to_async_iterable()):
+            >>>     print(value)
+
+        Args:
+            source: Source observable.
+
+        Returns:
+            An asynchronous iterator yielding the elements of the
+            source sequence.
+        """
+
+        async def iterate():
+            loop = asyncio.get_running_loop()
+            loop_thread = threading.get_ident()
+            condition = threading.Condition()
+            queue: Deque[Any] = deque()
+            waiter: Optional[asyncio.Future] = None
+            closed = False
+
+            def wake(future: asyncio.Future) -> None:
+                if not future.done():
+                    future.set_result(None)
+
+            def push(item: Any) -> None:
+                nonlocal waiter
+
+                with condition:
+                    if threading.get_ident() != loop_thread:
+                        while len(queue) >= max_buffer and not closed:
+                            condition.wait()
+                    if closed:
+                        return
+
+                    queue.append(item)
+                    future, waiter = waiter, None
+
+                if future is not None:
+                    if threading.get_ident() == loop_thread:
+                        wake(future)
+                    else:
+                        loop.call_soon_threadsafe(wake, future)
+
+            def on_error(error: Exception) -> None:
+                push(OnErrorNotification(error))
+
+            def on_completed() -> None:
+                push(COMPLETED)
+
+            subscription = source.subscribe_(push, on_error, on_completed)
+            try:
+                while True:
+                    future = None
+                    with condition:
+                        if queue:
+                            item = queue.popleft()
+                            condition.notify()
+                        else:
+                            future = waiter = loop.create_future()
+
+                    if future is not None:
+                        await future
+                    elif item is COMPLETED:
+                        return
+                    elif item.__class__ is OnErrorNotification:
+                        raise item.error
+                    else:
+                        yield item
+            finally:
+                with condition:
+                    closed = True
+                    queue.clear()
+                    condition.notify_all()
+                subscription.dispose()
+
+        return iterate()
+    return to_async_iterable
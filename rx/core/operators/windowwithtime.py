@@ -1,5 +1,6 @@
-from typing import Callable, Union
+from collections import deque
 from datetime import timedelta
+from typing import Callable, Union
 
 from rx.core import Observable, typing
 from rx.concurrency import timeout_scheduler
@@ -26,7 +27,7 @@ def _window_with_time(timespan: typing.RelativeTime, timeshift: typing.RelativeT
             next_shift = [timeshift]
             next_span = [timespan]
             total_time = [timedelta(0)]
-            q = []
+            q = deque()
 
             group_disposable = CompositeDisposable(timer_d)
             ref_count_disposable = RefCountDisposable(group_disposable)
@@ -64,7 +65,7 @@ def _window_with_time(timespan: typing.RelativeTime, timeshift: typing.RelativeT
                         observer.on_next(add_ref(s, ref_count_disposable))
 
                     if is_span:
-                        s = q.pop(0)
+                        s = q.popleft()
                         s.on_completed()
 
                     create_timer()
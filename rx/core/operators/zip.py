@@ -1,10 +1,13 @@
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Optional
 
 import rx
 from rx.core import Observable
+from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
+
 
 # pylint: disable=redefined-builtin
-def _zip(*args: Observable) -> Callable[[Observable], Observable]:
+def _zip(*args: Observable, max_buffer: Optional[int] = None, overflow: str = 'error'
+         ) -> Callable[[Observable], Observable]:
     def zip(source: Observable) -> Observable:
         """Merges the specified observable sequences into one observable
         sequence by creating a tuple whenever all of the
@@ -21,9 +24,10 @@ def _zip(*args: Observable) -> Callable[[Observable], Observable]:
             An observable sequence containing the result of combining
             elements of the sources as a tuple.
         """
-        return rx.zip(source, *args)
+        return rx.zip(source, *args, max_buffer=max_buffer, overflow=overflow)
     return zip
 
+
 def _zip_with_iterable(seq: Iterable):
     def zip_with_iterable(source: Observable) -> Observable:
         """Merges the specified observable sequence and list into one
@@ -31,6 +35,11 @@ def _zip_with_iterable(seq: Iterable):
         the observable sequences have produced an element at a
         corresponding index.
 
+        The iterable is iterated anew for each subscription, pulling
+        one element per element of the source. Pulling stops as soon
+        as either side ends, and a generator is closed when the
+        subscription is disposed.
+
         Example
             >>> res = zip(source)
 
@@ -42,23 +51,32 @@ def _zip_with_iterable(seq: Iterable):
             elements of the sources as a tuple.
         """
 
-        first = source
-        second = iter(seq)
-
         def subscribe(observer, scheduler=None):
-            index = 0
+            iterator = iter(seq)
+            subscription = SingleAssignmentDisposable()
 
             def on_next(left):
-                nonlocal index
-
                 try:
-                    right = next(second)
+                    right = next(iterator)
                 except StopIteration:
+                    subscription.dispose()
                     observer.on_completed()
+                except Exception as ex:  # pylint: disable=broad-except
+                    subscription.dispose()
+                    observer.on_error(ex)
                 else:
-                    result = (left, right)
-                    observer.on_next(result)
+                    observer.on_next((left, right))
+
+            def close():
+                # Lets a generator run its finally blocks
+                close_ = getattr(iterator, 'close', None)
+                if close_:
+                    try:
+                        close_()
+                    except ValueError:  # Generator is still running
+                        pass
 
-            return first.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+            subscription.disposable = source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+            return CompositeDisposable(subscription, Disposable(close))
         return Observable(subscribe)
     return zip_with_iterable
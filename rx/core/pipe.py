@@ -8,7 +8,9 @@ def pipe(*operators: Callable[[Observable], Observable]) -> Callable[[Observable
 
     Composes zero or more operators into a functional composition. The
     operators are composed to left to right. A composition of zero
-    operators gives back the source.
+    operators gives back the source. Consecutive synchronous operators
+    such as map, filter, scan, take and skip are fused into a single
+    observer when composed.
 
     Examples:
         >>> pipe()(source) == source
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Generic, TypeVar, Callable, Any, Union, Optional
+from typing import Generic, TypeVar, Callable, Any, Union, Optional, Sequence
 from datetime import datetime, timedelta
 
 from . import abc
@@ -14,6 +14,7 @@ T2 = TypeVar('T2')
 Action = Callable[[], None]
 
 OnNext = Callable[[Any], None]
+OnNextBatch = Callable[[Sequence[Any]], None]
 OnError = Callable[[Exception], None]
 OnCompleted = Callable[[], None]
 
@@ -67,9 +68,15 @@ class Observer(Generic[T_in], abc.Observer):
 
     An Observer is the entity that receives all emissions of a subscribed
     Observable.
+
+    Observers that handle a whole chunk of elements in a single call
+    set `supports_batch` and override `on_next_batch`. Producers only
+    emit chunks to observers that support them.
     """
     __slots__ = ()
 
+    supports_batch = False
+
     @abstractmethod
     def on_next(self, value: T_in) -> None:
         """Notify the observer of a new element in the sequence.
@@ -79,6 +86,16 @@ class Observer(Generic[T_in], abc.Observer):
         """
         raise NotImplementedError
 
+    def on_next_batch(self, values: Sequence[T_in]) -> None:
+        """Notify the observer of a chunk of new elements in the
+        sequence.
+
+        Args:
+            values: The received elements, in order.
+        """
+        for value in values:
+            self.on_next(value)
+
     @abstractmethod
     def on_error(self, error: Exception) -> None:
         """Notify the observer that an exception has occurred.
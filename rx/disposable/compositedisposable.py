@@ -1,22 +1,65 @@
 from threading import RLock
+from typing import Dict, List, Optional
 
 from rx.core.typing import Disposable
 
 
 class CompositeDisposable(Disposable):
     """Represents a group of disposable resources that are disposed
-    together"""
+    together.
+
+    The group is indexed by identity, so adding, removing and looking
+    up a disposable take constant time regardless of the size of the
+    group. Disposables are disposed in the order they were added.
+    """
+
+    __slots__ = ('disposable', 'duplicates', 'count', 'is_disposed', 'lock')
 
     def __init__(self, *args):
         if args and isinstance(args[0], list):
-            self.disposable = args[0]
-        else:
-            self.disposable = list(args)
+            args = args[0]
+
+        self.disposable: Dict[int, Disposable] = {}
+        self.duplicates: Optional[Dict[int, int]] = None
+        self.count = 0
+        for item in args:
+            self._add(item)
 
         self.is_disposed = False
         self.lock = RLock()
         super(CompositeDisposable, self).__init__()
 
+    def _add(self, item: Disposable) -> None:
+        key = id(item)
+        if key in self.disposable:
+            # The same disposable added twice is disposed twice, as
+            # with a list. Extra occurrences are only counted.
+            duplicates = self.duplicates = self.duplicates or {}
+            duplicates[key] = duplicates.get(key, 0) + 1
+        else:
+            self.disposable[key] = item
+        self.count += 1
+
+    def _items(self) -> List[Disposable]:
+        """Returns the disposables of the group, including duplicates.
+        Must be called with the lock held."""
+
+        items = list(self.disposable.values())
+        if self.duplicates:
+            for key, extra in self.duplicates.items():
+                items.extend([self.disposable[key]] * extra)
+        return items
+
+    def _take(self) -> List[Disposable]:
+        """Empties the group and returns its disposables. Must be called
+        with the lock held."""
+
+        items = self._items()
+        self.disposable = {}
+        self.duplicates = None
+        self.count = 0
+        return items
+
     def add(self, item):
         """Adds a disposable to the CompositeDisposable or disposes the
         disposable if the CompositeDisposable is disposed
@@ -24,33 +67,36 @@ class CompositeDisposable(Disposable):
         Args:
             item: Disposable to add."""
 
-        should_dispose = False
         with self.lock:
-            if self.is_disposed:
-                should_dispose = True
-            else:
-                self.disposable.append(item)
+            if not self.is_disposed:
+                self._add(item)
+                return
 
-        if should_dispose:
-            item.dispose()
+        item.dispose()
 
     def remove(self, item):
         """Removes and disposes the first occurrence of a disposable
         from the CompositeDisposable."""
 
         if self.is_disposed:
-            return
+            return False
 
-        should_dispose = False
+        key = id(item)
         with self.lock:
-            if item in self.disposable:
-                self.disposable.remove(item)
-                should_dispose = True
-
-        if should_dispose:
-            item.dispose()
+            duplicates = self.duplicates
+            if duplicates and key in duplicates:
+                if duplicates[key] == 1:
+                    del duplicates[key]
+                else:
+                    duplicates[key] -= 1
+            elif key in self.disposable:
+                del self.disposable[key]
+            else:
+                return False
+            self.count -= 1
 
-        return should_dispose
+        item.dispose()
+        return True
 
     def dispose(self):
         """Disposes all disposable in the group and removes them from
@@ -60,9 +106,10 @@ class CompositeDisposable(Disposable):
             return
 
         with self.lock:
+            if self.is_disposed:
+                return
             self.is_disposed = True
-            current_disposable = self.disposable
-            self.disposable = []
+            current_disposable = self._take()
 
         for disp in current_disposable:
             disp.dispose()
@@ -73,8 +120,7 @@ class CompositeDisposable(Disposable):
         CompositeDisposable."""
 
         with self.lock:
-            current_disposable = self.disposable
-            self.disposable = []
+            current_disposable = self._take()
 
         for disposable in current_disposable:
             disposable.dispose()
@@ -89,14 +135,15 @@ class CompositeDisposable(Disposable):
         Returns:
             True if the disposable was found; otherwise, False"""
 
-        return item in self.disposable
+        return id(item) in self.disposable
 
     def to_list(self):
-        return self.disposable[:]
+        with self.lock:
+            return self._items()
 
     def __len__(self):
-        return len(self.disposable)
+        return self.count
 
     @property
     def length(self):
-        return len(self.disposable)
+        return self.count
@@ -7,6 +7,8 @@ from rx.core import typing
 class Disposable(typing.Disposable):
     """Main disposable class"""
 
+    __slots__ = ('is_disposed', 'action', 'lock')
+
     def __init__(self, action: typing.Action = None) -> None:
         """Creates a disposable object that invokes the specified
         action when disposed.
@@ -1,4 +1,6 @@
-from .priorityqueue import PriorityQueue
+from .priorityqueue import PriorityQueue, IndexedPriorityQueue
+from .bufferpool import BufferPool
 from .basic import noop, default_error, default_comparer
 from .exceptions import SequenceContainsNoElementsError, ArgumentOutOfRangeException, DisposedException
+from .exceptions import BufferOverflowException
 from . import concurrency
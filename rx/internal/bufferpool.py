@@ -0,0 +1,43 @@
+from collections import deque
+from typing import Any, Deque, List
+
+
+class BufferPool:
+    """Pool of list objects for the buffer operators.
+
+    A buffer handed downstream belongs to the consumer. Once the
+    consumer is done with it, e.g. after a bulk insert, it may release
+    the buffer so that the operator can fill it again instead of
+    allocating a new list. Buffers that are never released are simply
+    garbage collected.
+
+    Examples:
+        >>> pool = BufferPool()
+        >>> source.pipe(ops.buffer_with_count(500, pool=pool)).subscribe(
+        ...     lambda rows: (db.insert_many(rows), pool.release(rows)))
+    """
+
+    __slots__ = ('max_size', 'free')
+
+    def __init__(self, max_size: int = 16) -> None:
+        self.max_size = max_size
+        self.free: Deque[List[Any]] = deque()
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    def acquire(self) -> List[Any]:
+        """Returns an empty buffer, reusing a released one if any."""
+
+        try:
+            return self.free.pop()
+        except IndexError:
+            return []
+
+    def release(self, buffer: List[Any]) -> None:
+        """Returns a buffer to the pool. The buffer is cleared and must
+        not be used by the caller afterwards."""
+
+        buffer.clear()
+        if len(self.free) < self.max_size:
+            self.free.append(buffer)
@@ -34,3 +34,8 @@ class WouldBlockException(Exception):
 class InvalidOperationException(Exception):
     def __init__(self, msg=None):
         super(InvalidOperationException, self).__init__(msg or "Invalid operation")
+
+
+class BufferOverflowException(Exception):
+    def __init__(self, msg=None):
+        super(BufferOverflowException, self).__init__(msg or "Buffer overflow")
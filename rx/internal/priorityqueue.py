@@ -1,5 +1,5 @@
 import heapq
-from typing import List, Any
+from typing import Any, Dict, List
 from threading import RLock
 
 from rx.internal.exceptions import InvalidOperationException
@@ -59,3 +59,79 @@ class PriorityQueue:
                     return True
 
         return False
+
+
+class IndexedPriorityQueue:
+    """Priority queue for scheduling with O(log n) removal.
+
+    Every queued item has a heap entry that is indexed by the identity
+    of the item. Removing an item marks its entry as removed, and
+    removed entries are dropped when they reach the top of the heap.
+    Once more than half of the heap consists of removed entries, the
+    heap is compacted.
+
+    The queue does not lock. It is meant to be owned by a single thread
+    or used under the lock of its owner.
+    """
+
+    __slots__ = ('items', 'index', 'count', 'removed')
+
+    def __init__(self, capacity=None) -> None:
+        self.items: List[List[Any]] = []
+        self.index: Dict[int, List[Any]] = {}
+        self.count = 0  # Monotonic increasing for sort stability
+        self.removed = 0
+
+    def __len__(self):
+        """Returns length of queue"""
+
+        return len(self.items) - self.removed
+
+    def _prune(self) -> None:
+        items = self.items
+        while items and not items[0][2]:
+            heapq.heappop(items)
+            self.removed -= 1
+
+    def peek(self) -> Any:
+        """Returns first item in queue without removing it"""
+
+        self._prune()
+        try:
+            return self.items[0][0]
+        except IndexError:
+            raise InvalidOperationException("Queue is empty")
+
+    def dequeue(self) -> Any:
+        """Returns and removes item with lowest priority from queue"""
+
+        self._prune()
+        entry = heapq.heappop(self.items)
+        item = entry[0]
+        if self.index.get(id(item)) is entry:
+            del self.index[id(item)]
+        return item
+
+    def enqueue(self, item: Any) -> None:
+        """Adds item to queue"""
+
+        entry = [item, self.count, True]
+        self.count += 1
+        self.index[id(item)] = entry
+        heapq.heappush(self.items, entry)
+
+    def remove(self, item: Any) -> bool:
+        """Remove given item from queue"""
+
+        entry = self.index.pop(id(item), None)
+        if entry is None:
+            return False
+
+        entry[2] = False
+        self.removed += 1
+
+        if self.removed * 2 > len(self.items):
+            self.items = [entry for entry in self.items if entry[2]]
+            heapq.heapify(self.items)
+            self.removed = 0
+        return True
@@ -1,9 +1,10 @@
 # pylint: disable=too-many-lines,redefined-outer-name,redefined-builtin
 
 from asyncio import Future
-from typing import Callable, Union, Any, Iterable, List, cast
+from typing import AsyncIterator, Callable, Union, Any, Iterable, List, Optional, cast
 from datetime import timedelta, datetime
 
+from rx.internal import BufferPool
 from rx.internal.utils import NotSet
 from rx.core import Observable, ConnectableObservable, GroupedObservable, typing, pipe
 from rx.core.typing import Mapper, MapperIndexed, Predicate, PredicateIndexed
@@ -80,27 +81,32 @@ def average(key_mapper: Callable[[Any], Any] = None) -> Callable[[Observable], O
     return _average(key_mapper)
 
 
-def buffer(buffer_openings=None, buffer_closing_mapper=None) -> Callable[[Observable], Observable]:
+def buffer(buffer_openings=None, buffer_closing_mapper=None, pool: Optional[BufferPool] = None
+           ) -> Callable[[Observable], Observable]:
     """Projects each element of an observable sequence into zero or
     more buffers.
 
     Args:
         buffer_openings: Observable sequence whose elements denote the
-            creation of windows.
+            creation of buffers.
         buffer_closing_mapper: [optional] A function invoked to define
-            the closing of each produced window. If a closing mapper
+            the closing of each produced buffer. If a closing mapper
             function is specified for the first parameter, this
             parameter is ignored.
+        pool: [Optional] A rx.internal.BufferPool to take the buffers
+            from. Buffers released to the pool by the consumer are
+            filled again instead of allocating new lists.
 
     Returns:
-        A function that takes an observable source and retuerns an
-        observable sequence of windows.
+        A function that takes an observable source and returns an
+        observable sequence of buffers.
     """
     from rx.core.operators.buffer import _buffer
-    return _buffer(buffer_openings, buffer_closing_mapper)
+    return _buffer(buffer_openings, buffer_closing_mapper, pool)
 
 
-def buffer_with_count(count: int, skip: int = None) -> Callable[[Observable], Observable]:
+def buffer_with_count(count: int, skip: int = None, pool: Optional[BufferPool] = None
+                      ) -> Callable[[Observable], Observable]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on element count information.
 
@@ -113,17 +119,21 @@ def buffer_with_count(count: int, skip: int = None) -> Callable[[Observable], Ob
         skip: [Optional] Number of elements to skip between
             creation of consecutive buffers. If not provided, defaults to
             the count.
+        pool: [Optional] A rx.internal.BufferPool to take the buffers
+            from. Buffers released to the pool by the consumer are
+            filled again instead of allocating new lists.
 
     Returns:
         A function that takes an observable source and returns an
         observable sequence of buffers.
     """
     from rx.core.operators.buffer import _buffer_with_count
-    return _buffer_with_count(count, skip)
+    return _buffer_with_count(count, skip, pool)
 
 
 def buffer_with_time(timespan: typing.RelativeTime, timeshift: typing.RelativeTime = None,
-                     scheduler: typing.Scheduler = None) -> Callable[[Observable], Observable]:
+                     scheduler: typing.Scheduler = None, pool: Optional[BufferPool] = None
+                     ) -> Callable[[Observable], Observable]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on timing information.
 
@@ -141,16 +151,21 @@ def buffer_with_time(timespan: typing.RelativeTime, timeshift: typing.RelativeTi
             optional scheduler parameter. If not specified, the time shift
             corresponds to the timespan parameter, resulting in non-overlapping
             adjacent buffers.
+        scheduler: [Optional] Scheduler to run buffering timers on. If
+            not specified, the timeout scheduler is used.
+        pool: [Optional] A rx.internal.BufferPool to take the buffers
+            from.
 
     Returns:
         An operator function that takes an observable source and
         returns an observable sequence of buffers.
     """
     from rx.core.operators.bufferwithtime import _buffer_with_time
-    return _buffer_with_time(timespan, timeshift, scheduler)
+    return _buffer_with_time(timespan, timeshift, scheduler, pool)
 
 
-def buffer_with_time_or_count(timespan, count, scheduler=None) -> Callable[[Observable], Observable]:
+def buffer_with_time_or_count(timespan, count, scheduler=None, pool: Optional[BufferPool] = None
+                              ) -> Callable[[Observable], Observable]:
     """Projects each element of an observable sequence into a buffer
     that is completed when either it's full or a given amount of time
     has elapsed.
@@ -166,13 +181,15 @@ def buffer_with_time_or_count(timespan, count, scheduler=None) -> Callable[[Obse
         count: Maximum element count of a buffer.
         scheduler: [Optional] Scheduler to run bufferin timers on. If
             not specified, the timeout scheduler is used.
+        pool: [Optional] A rx.internal.BufferPool to take the buffers
+            from.
 
     Returns:
         An operator function that takes an observable source and
         returns an observable sequence of buffers.
     """
     from rx.core.operators.bufferwithtimeorcount import _buffer_with_time_or_count
-    return _buffer_with_time_or_count(timespan, count, scheduler)
+    return _buffer_with_time_or_count(timespan, count, scheduler, pool)
 
 
 def catch(second: Observable = None, handler: Callable[[Exception, Observable], Observable] = None
@@ -219,6 +236,38 @@ def combine_latest(*others: Observable) -> Callable[[Observable], Observable]:
     return _combine_latest(*others)
 
 
+def combine_latest_keyed() -> Callable[[Observable], Observable]:
+    """Combines the latest values of a dynamic set of keyed
+    observable sequences.
+
+    The source emits (key, observable) pairs and every inner
+    observable is subscribed as it arrives. Whenever an inner
+    observable produces an element, the latest value for its key is
+    updated and a read-only mapping from key to latest value is
+    emitted. The update takes constant time whatever the number of
+    keys, which suits wide fan-ins such as one stream per instrument.
+
+    A pair with a key that is already present replaces the previous
+    observable for that key, and a pair with None as observable
+    removes the key. A key keeps its latest value after its observable
+    completes. The resulting sequence completes when the source and
+    all inner observables have completed.
+
+    Examples:
+        >>> op = combine_latest_keyed()
+        >>> res = rx.of(('a', xs), ('b', ys)).pipe(combine_latest_keyed())
+
+    Returns:
+        An operator function that takes an observable sequence of
+        (key, observable) pairs and returns an observable sequence of
+        mappings from key to latest value. The mapping is the same
+        live view on every emission and is updated in place, copy it
+        with ``dict()`` to keep a snapshot.
+    """
+    from rx.core.operators.combinelatestkeyed import _combine_latest_keyed
+    return _combine_latest_keyed()
+
+
 def concat(*sources: Observable) -> Callable[[Observable], Observable]:
     """Concatenates all the observable sequences.
 
@@ -409,21 +458,46 @@ def delay(duetime: typing.RelativeTime, scheduler: typing.Scheduler = None) -> C
     return _delay(duetime, scheduler)
 
 
-def distinct(key_mapper=None, comparer=None) -> Callable[[Observable], Observable]:
+def distinct(key_mapper=None,
+             comparer=None,
+             max_size: Optional[int] = None,
+             ttl: Optional[typing.RelativeTime] = None,
+             false_positive_rate: Optional[float] = None,
+             scheduler: Optional[typing.Scheduler] = None
+             ) -> Callable[[Observable], Observable]:
     """Returns an observable sequence that contains only distinct
     elements according to the key_mapper and the comparer. Usage of
     this operator should be considered carefully due to the maintenance
     of an internal lookup structure which can grow large.
 
+    Without a comparer, keys are kept in a hash set. The lookup
+    structure can be bounded by max_size, which forgets the least
+    recently seen key, and by ttl, which forgets keys that have not
+    been seen for the given time on the scheduler clock. If
+    false_positive_rate is given, keys are tracked approximately in a
+    Bloom filter sized for max_size keys, and a new element is dropped
+    with at most that probability.
+
     Examples:
         >>> res = obs = xs.distinct()
         >>> obs = xs.distinct(lambda x: x.id)
         >>> obs = xs.distinct(lambda x: x.id, lambda a,b: a == b)
+        >>> obs = xs.distinct(lambda x: x.id, max_size=10000, ttl=60)
+        >>> obs = xs.distinct(lambda x: x.id, max_size=10**7, false_positive_rate=1e-6)
 
     Args:
         key_mapper: [Optional]  A function to compute the comparison
             key for each element.
         comparer: [Optional]  Used to compare items in the collection.
+            Cannot be combined with the bounded modes.
+        max_size: [Optional] Maximum number of keys remembered, or the
+            number of keys the filter is sized for in approximate
+            mode. Defaults to one million keys in approximate mode.
+        ttl: [Optional] Time after which a key that has not been seen
+            again is forgotten.
+        false_positive_rate: [Optional] Track keys in a Bloom filter
+            with this false positive rate.
+        scheduler: [Optional] Scheduler whose clock expires keys.
 
     Returns:
         An operator function that takes an observable source and
@@ -432,7 +506,7 @@ def distinct(key_mapper=None, comparer=None) -> Callable[[Observable], Observabl
         sequence.
     """
     from rx.core.operators.distinct import _distinct
-    return _distinct(key_mapper, comparer)
+    return _distinct(key_mapper, comparer, max_size, ttl, false_positive_rate, scheduler)
 
 
 def distinct_until_changed(key_mapper=None, comparer=None) -> Callable[[Observable], Observable]:
@@ -839,20 +913,35 @@ def flat_map_latest(mapper: Mapper) -> Callable[[Observable], Observable]:
     return _flat_map_latest(mapper)
 
 
-def group_by(key_mapper, element_mapper=None) -> Callable[[Observable], Observable]:
+def group_by(key_mapper,
+             element_mapper=None,
+             max_groups: Optional[int] = None,
+             idle_timeout: Optional[typing.RelativeTime] = None,
+             scheduler: Optional[typing.Scheduler] = None
+             ) -> Callable[[Observable], Observable]:
     """Groups the elements of an observable sequence according to a
     specified key mapper function and comparer and selects the
     resulting elements by using a specified function.
 
+    Groups can be bounded by max_groups, which completes the least
+    recently used group when a new group would exceed the limit, and
+    by idle_timeout, which completes groups that did not receive an
+    element for the given time. A completed group is reborn as a new
+    group when its key occurs again.
+
     Examples:
         >>> group_by(lambda x: x.id)
         >>> group_by(lambda x: x.id, lambda x: x.name)
-        >>> group_by(lambda x: x.id, lambda x: x.name, lambda x: str(x))
+        >>> group_by(lambda x: x.user, max_groups=10000, idle_timeout=300)
 
     Keyword arguments:
         key_mapper: A function to extract the key for each element.
         element_mapper: [Optional] A function to map each source
             element to an element in an observable group.
+        max_groups: [Optional] Maximum number of open groups.
+        idle_timeout: [Optional] Time after which a group without new
+            elements is completed.
+        scheduler: [Optional] Scheduler to run the idle timer on.
 
     Returns:
         An operator function that takes an observable source and
@@ -861,7 +950,7 @@ def group_by(key_mapper, element_mapper=None) -> Callable[[Observable], Observab
         share that same key value.
     """
     from rx.core.operators.groupby import _group_by
-    return _group_by(key_mapper, element_mapper)
+    return _group_by(key_mapper, element_mapper, max_groups, idle_timeout, scheduler)
 
 
 def group_by_until(key_mapper, element_mapper, duration_mapper) -> Callable[[Observable], Observable]:
@@ -966,6 +1055,41 @@ def join(right, left_duration_mapper, right_duration_mapper) -> Callable[[Observ
     return _join(right, left_duration_mapper, right_duration_mapper)
 
 
+def join_on(right: Observable, left_key: Callable[[Any], Any], right_key: Callable[[Any], Any],
+            window: typing.RelativeTime, scheduler: Optional[typing.Scheduler] = None
+            ) -> Callable[[Observable], Observable]:
+    """Correlates the elements of two sequences that have equal keys
+    and arrive within a time window of each other.
+
+    Unlike :func:`join`, which pairs every element with all live
+    elements of the other sequence, both sides are hashed by key, so
+    an element only costs the number of matches it produces. Every
+    element lives for the same window and all of them are expired by a
+    single timer.
+
+    Examples:
+        >>> op = join_on(fills, lambda o: o.order_id, lambda f: f.order_id, timedelta(seconds=5))
+
+    Args:
+        right: The right observable sequence to join elements for.
+        left_key: A function to extract the key of each element of the
+            left observable sequence.
+        right_key: A function to extract the key of each element of
+            the right observable sequence.
+        window: Time each element stays available for matching after
+            its arrival.
+        scheduler: [Optional] Scheduler to run the expiry timer on.
+
+    Return:
+        An operator function that takes an observable source and
+        returns an observable sequence of (left, right) tuples of
+        elements with equal keys that arrived less than the window
+        apart.
+    """
+    from rx.core.operators.joinon import _join_on
+    return _join_on(right, left_key, right_key, window, scheduler)
+
+
 def last(predicate: Predicate = None) -> Callable[[Observable], Observable]:
     """The last operator.
 
@@ -1117,6 +1241,27 @@ def max_by(key_mapper, comparer=None) -> Callable[[Observable], Observable]:
     return _max_by(key_mapper, comparer)
 
 
+def median(key_mapper: Mapper = None) -> Callable[[Observable], Observable]:
+    """Estimates the median of an observable sequence of numbers in
+    constant memory. See quantile.
+
+    Examples:
+        >>> op = median()
+        >>> op = median(lambda x: x.latency)
+
+    Args:
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the estimated median of the sequence of values.
+    """
+    from rx.core.operators.statistics import _quantile
+    return _quantile(0.5, key_mapper)
+
+
 def merge(*sources, max_concurrent: int = None) -> Callable[[Observable], Observable]:
     """Merges an observable sequence of observable sequences into an
     observable sequence, limiting the number of concurrent
@@ -1234,12 +1379,38 @@ def multicast(subject: typing.Subject = None, subject_factory: Callable[[], typi
     return _multicast(subject, subject_factory, mapper)
 
 
-def observe_on(scheduler) -> Callable[[Observable], Observable]:
+def observe_on(scheduler,
+               batch_size: Optional[int] = None,
+               time_budget: Optional[float] = None,
+               max_buffer: Optional[int] = None,
+               overflow: str = 'block',
+               counters=None
+               ) -> Callable[[Observable], Observable]:
     """Wraps the source sequence in order to run its observer callbacks
     on the specified scheduler.
 
+    Notifications are queued and forwarded in batches. Each scheduled
+    run forwards at most batch_size notifications, or as many as fit in
+    time_budget seconds, before it yields to other work on the
+    scheduler.
+
     Args:
         scheduler: Scheduler to notify observers on.
+        batch_size: [Optional] Maximum number of notifications
+            forwarded per scheduled run. Defaults to 128.
+        time_budget: [Optional] Maximum number of seconds spent
+            forwarding notifications per scheduled run.
+        max_buffer: [Optional] Maximum number of buffered elements.
+            The buffer is unbounded if not given.
+        overflow: [Optional] What to do with an element that does not
+            fit into a full buffer. One of 'block' to make the
+            producer wait, 'drop_newest', 'drop_oldest', 'latest_only'
+            to keep only the new element, or 'error' to terminate with
+            a BufferOverflowException. Defaults to 'block'. A blocked
+            producer must not run on the thread of the scheduler.
+        counters: [Optional] A rx.core.observer.BufferCounters instance
+            updated with the buffer depth, the high water mark, and the
+            number of dropped elements and blocked producers.
 
     This only invokes observer callbacks on a scheduler. In case the
     subscription and/or unsubscription actions have side-effects
@@ -1251,7 +1422,7 @@ def observe_on(scheduler) -> Callable[[Observable], Observable]:
         specified scheduler.
     """
     from rx.core.operators.observeon import _observe_on
-    return _observe_on(scheduler)
+    return _observe_on(scheduler, batch_size, time_budget, max_buffer, overflow, counters)
 
 def on_error_resume_next(second: Observable) -> Callable[[Observable], Observable]:
     """Continues an observable sequence that is terminated normally
@@ -1270,6 +1441,50 @@ def on_error_resume_next(second: Observable) -> Callable[[Observable], Observabl
     return _on_error_resume_next(second)
 
 
+def parallel_map(mapper: Mapper,
+                 executor=None,
+                 max_workers: Optional[int] = None,
+                 ordered: bool = True,
+                 chunksize: int = 1
+                 ) -> Callable[[Observable], Observable]:
+    """Projects each element of an observable sequence on a pool of
+    workers.
+
+    Elements are mapped in chunks of chunksize elements, one task per
+    chunk, which amortizes the pickling overhead of process pools. At
+    most twice as many chunks as there are workers are submitted but
+    not yet emitted; the source is blocked while the window is full.
+
+    Examples:
+        >>> op = parallel_map(parse)
+        >>> op = parallel_map(extract, ProcessPoolExecutor(), chunksize=100)
+        >>> op = parallel_map(fetch, max_workers=16, ordered=False)
+
+    Args:
+        mapper: A function to apply to each element. It must be
+            picklable when used with a process pool.
+        executor: [Optional] The concurrent.futures executor to run
+            the mapper on. Defaults to a thread pool owned by the
+            subscription, which is shut down when the sequence
+            terminates or the subscription is disposed.
+        max_workers: [Optional] Number of workers of the default thread
+            pool, or the number of workers of the given executor used
+            to size the window.
+        ordered: [Optional] Emit the projected elements in source
+            order. Otherwise they are emitted as their chunks complete.
+            Defaults to True.
+        chunksize: [Optional] Number of elements mapped by a single
+            task. Defaults to 1.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence whose elements are the result of
+        invoking the mapper on each element of the source.
+    """
+    from rx.core.operators.parallelmap import _parallel_map
+    return _parallel_map(mapper, executor, max_workers, ordered, chunksize)
+
+
 def pairwise() -> Callable[[Observable], Observable]:
     """The pairwise operator.
 
@@ -1434,6 +1649,29 @@ def publish_value(initial_value: Any, mapper: Mapper = None) -> Callable[[Observ
     return _publish_value(initial_value, mapper)
 
 
+def quantile(p: float, key_mapper: Mapper = None) -> Callable[[Observable], Observable]:
+    """Estimates a quantile of an observable sequence of numbers in
+    constant memory, using the P-square algorithm. The estimate is
+    exact for sequences of up to five elements.
+
+    Examples:
+        >>> op = quantile(0.99)
+        >>> op = quantile(0.99, lambda x: x.latency)
+
+    Args:
+        p: The quantile to estimate, between 0 and 1.
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the estimated quantile of the sequence of values.
+    """
+    from rx.core.operators.statistics import _quantile
+    return _quantile(p, key_mapper)
+
+
 def reduce(accumulator: Callable[[Any, Any], Any], seed: Any = NotSet) -> Callable[[Observable], Observable]:
     """The reduce operator.
 
@@ -1463,6 +1701,55 @@ def reduce(accumulator: Callable[[Any, Any], Any], seed: Any = NotSet) -> Callab
     return _reduce(accumulator, seed)
 
 
+def rolling_statistics(window: int, key_mapper: Mapper = None) -> Callable[[Observable], Observable]:
+    """Computes statistics over the last window elements of an
+    observable sequence of numbers and emits them for every element.
+
+    The count, mean, sample variance, standard deviation, minimum and
+    maximum of the window are updated in O(1) amortized time per
+    element.
+
+    Examples:
+        >>> op = rolling_statistics(100)
+        >>> op = rolling_statistics(100, lambda x: x.latency)
+
+    Args:
+        window: Number of most recent elements included.
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of Statistics named tuples, one
+        per source element. The quantiles of the tuples are empty.
+    """
+    from rx.core.operators.statistics import _rolling_statistics
+    return _rolling_statistics(window, key_mapper)
+
+
+def running_statistics(quantiles: Iterable[float] = (), key_mapper: Mapper = None
+                       ) -> Callable[[Observable], Observable]:
+    """Computes statistics of all elements of an observable sequence of
+    numbers so far and emits them for every element. See statistics.
+
+    Examples:
+        >>> op = running_statistics()
+        >>> op = running_statistics([0.5, 0.99])
+
+    Args:
+        quantiles: [Optional] Quantiles to estimate.
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of Statistics named tuples, one
+        per source element.
+    """
+    from rx.core.operators.statistics import _running_statistics
+    return _running_statistics(tuple(quantiles), key_mapper)
+
+
 def ref_count() -> Callable[[ConnectableObservable], Observable]:
     """Returns an observable sequence that stays connected to the
     source as long as there is at least one subscription to the
@@ -1996,6 +2283,60 @@ def start_with(*args: Any) -> Callable[[Observable], Observable]:
     return _start_with(*args)
 
 
+def standard_deviation(key_mapper: Mapper = None) -> Callable[[Observable], Observable]:
+    """Computes the sample standard deviation of an observable sequence
+    of numbers in constant memory. See variance.
+
+    Examples:
+        >>> op = standard_deviation()
+
+    Args:
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the standard deviation of the sequence of values.
+    """
+    from rx.core.operators.statistics import _standard_deviation
+    return _standard_deviation(key_mapper)
+
+
+def statistics(quantiles: Iterable[float] = (), key_mapper: Mapper = None) -> Callable[[Observable], Observable]:
+    """Computes statistics of an observable sequence of numbers in a
+    single pass and in constant memory.
+
+    The count, mean, sample variance (Welford), standard deviation,
+    minimum and maximum are exact. Quantiles are estimated with the
+    P-square algorithm. For windowed statistics, apply the operator to
+    each window:
+
+        >>> xs.pipe(
+        >>>     ops.window_with_time(1.0),
+        >>>     ops.flat_map(lambda w: w.pipe(ops.statistics([0.99]))))
+
+    Examples:
+        >>> op = statistics()
+        >>> op = statistics([0.5, 0.9, 0.99], lambda x: x.latency)
+
+    Args:
+        quantiles: [Optional] Quantiles to estimate, each between 0 and
+            1.
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single Statistics
+        named tuple with the fields count, mean, variance, stddev, min,
+        max, and quantiles, a dict mapping each requested quantile to
+        its estimate.
+    """
+    from rx.core.operators.statistics import _statistics
+    return _statistics(tuple(quantiles), key_mapper)
+
+
 def subscribe_on(scheduler: typing.Scheduler) -> Callable[[Observable], Observable]:
     """Subscribe on the specified scheduler.
 
@@ -2425,6 +2766,31 @@ def to_dict(key_mapper: Callable[[Any], Any], element_mapper: Callable[[Any], An
     return _to_dict(key_mapper, element_mapper)
 
 
+def to_async_iterable(max_buffer: Optional[int] = None) -> Callable[[Observable], AsyncIterator]:
+    """Converts an observable sequence to an asynchronous iterator.
+
+    The source is subscribed when iteration starts and disposed when
+    iteration stops. Producers running on other threads than the event
+    loop are blocked while max_buffer elements wait to be iterated.
+
+    Example:
+        >>> async for value in xs.pipe(ops.to_async_iterable(100)):
+        >>>     print(value)
+
+    Args:
+        max_buffer: [Optional] Maximum number of buffered elements
+            before producers on other threads are blocked. Defaults to
+            1024.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an asynchronous iterator yielding the elements of the
+        source.
+    """
+    from rx.core.operators.toasynciterable import _to_async_iterable
+    return _to_async_iterable(max_buffer)
+
+
 def to_future(future_ctor: Callable[[], Future] = None) -> Callable[[Observable], Future]:
     """Converts an existing observable sequence to a Future.
 
@@ -2482,6 +2848,28 @@ def to_set() -> Callable[[Observable], Observable]:
     return _to_set()
 
 
+def variance(key_mapper: Mapper = None) -> Callable[[Observable], Observable]:
+    """Computes the sample variance of an observable sequence of
+    numbers in a single pass with Welford's algorithm.
+
+    Examples:
+        >>> op = variance()
+        >>> op = variance(lambda x: x.value)
+
+    Args:
+        key_mapper: [Optional] A transform function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the variance of the sequence of values. A sequence with a
+        single element has a variance of 0.
+    """
+    from rx.core.operators.statistics import _variance
+    return _variance(key_mapper)
+
+
 def while_do(condition: Callable[[Any], bool]) -> Callable[[Observable], Observable]:
     """Repeats source as long as condition holds emulating a while
     loop.
@@ -2574,7 +2962,8 @@ def with_latest_from(*sources: Observable) -> Callable[[Observable], Observable]
     return _with_latest_from(*sources)
 
 
-def zip(*args: Observable) -> Callable[[Observable], Observable]:
+def zip(*args: Observable, max_buffer: Optional[int] = None, overflow: str = 'error'
+        ) -> Callable[[Observable], Observable]:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever all of the
     observable sequences have produced an element at a corresponding
@@ -2585,6 +2974,13 @@ def zip(*args: Observable) -> Callable[[Observable], Observable]:
 
     Args:
         args: Observable sources to zip.
+        max_buffer: [Optional] Maximum number of elements buffered per
+            source while waiting for the other sources. Unbounded if
+            not given.
+        overflow: [Optional] What to do with an element of a source
+            whose buffer is full. One of 'drop_newest', 'drop_oldest'
+            or 'error' to terminate with a BufferOverflowException.
+            Defaults to 'error'.
 
     Returns:
         An operator function that takes an observable source and
@@ -2592,7 +2988,7 @@ def zip(*args: Observable) -> Callable[[Observable], Observable]:
         combining elements of the sources as a tuple.
     """
     from rx.core.operators.zip import _zip
-    return _zip(*args)
+    return _zip(*args, max_buffer=max_buffer, overflow=overflow)
 
 
 def zip_with_iterable(second):
@@ -2605,7 +3001,9 @@ def zip_with_iterable(second):
         >>> res = zip([1,2,3])
 
     Args:
-        second: Iterable to zip with the source observable..
+        second: Iterable to zip with the source observable. It is
+            iterated anew for each subscription and pulled one element
+            at a time. Generators are closed on dispose.
 
     Returns:
         An operator function that takes and observable source and
@@ -6,6 +6,7 @@ from rx.core.typing import Observer
 from rx.internal import DisposedException
 
 from .innersubscription import InnerSubscription
+from .observerset import ObserverSet
 
 
 class AsyncSubject(Observable, Observer):
@@ -23,10 +24,16 @@ class AsyncSubject(Observable, Observer):
         self.is_stopped = False
         self.value = None
         self.has_value = False
-        self.observers = []
         self.exception = None
 
         self.lock = threading.RLock()
+        self.observer_set = ObserverSet(self.lock)
+
+    @property
+    def observers(self):
+        """Snapshot of the subscribed observers."""
+
+        return self.observer_set.get()
 
     def check_disposed(self):
         if self.is_disposed:
@@ -36,8 +43,9 @@ class AsyncSubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                self.observers.append(observer)
-                return InnerSubscription(self, observer)
+                subscription = InnerSubscription(self, observer)
+                self.observer_set.add(subscription, observer)
+                return subscription
 
             ex = self.exception
             hv = self.has_value
@@ -61,8 +69,7 @@ class AsyncSubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observer_set.clear()
 
                 self.is_stopped = True
                 value = self.value
@@ -83,8 +90,7 @@ class AsyncSubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observer_set.clear()
                 self.is_stopped = True
                 self.exception = error
 
@@ -102,6 +108,6 @@ class AsyncSubject(Observable, Observer):
     def dispose(self):
         with self.lock:
             self.is_disposed = True
-            self.observers = None
+            self.observer_set.clear()
             self.exception = None
             self.value = None
@@ -6,6 +6,7 @@ from rx.core.typing import Observer
 from rx.internal import DisposedException
 
 from .innersubscription import InnerSubscription
+from .observerset import ObserverSet
 
 
 class BehaviorSubject(Observable, Observer):
@@ -27,12 +28,18 @@ class BehaviorSubject(Observable, Observer):
         super(BehaviorSubject, self).__init__()
 
         self.value = value
-        self.observers = []
         self.is_disposed = False
         self.is_stopped = False
         self.exception = None
 
         self.lock = threading.RLock()
+        self.observer_set = ObserverSet(self.lock)
+
+    @property
+    def observers(self):
+        """Snapshot of the subscribed observers."""
+
+        return self.observer_set.get()
 
     def check_disposed(self):
         if self.is_disposed:
@@ -44,9 +51,10 @@ class BehaviorSubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                self.observers.append(observer)
+                subscription = InnerSubscription(self, observer)
+                self.observer_set.add(subscription, observer)
                 observer.on_next(self.value)
-                return InnerSubscription(self, observer)
+                return subscription
             ex = self.exception
 
         if ex:
@@ -63,8 +71,7 @@ class BehaviorSubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observer_set.clear()
                 self.is_stopped = True
 
         if os:
@@ -77,8 +84,7 @@ class BehaviorSubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observer_set.clear()
                 self.is_stopped = True
                 self.exception = error
 
@@ -92,7 +98,9 @@ class BehaviorSubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
+                # The value and the snapshot are taken together so that a
+                # concurrent subscriber never receives the value twice.
+                os = self.observer_set.get()
                 self.value = value
         if os:
             for o in os:
@@ -106,6 +114,6 @@ class BehaviorSubject(Observable, Observer):
         """
         with self.lock:
             self.is_disposed = True
-            self.observers = None
+            self.observer_set.clear()
             self.value = None
             self.exception = None
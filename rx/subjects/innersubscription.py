@@ -12,6 +12,5 @@ class InnerSubscription(typing.Disposable):
     def dispose(self) -> None:
         with self.lock:
             if not self.subject.is_disposed and self.observer:
-                if self.observer in self.subject.observers:
-                    self.subject.observers.remove(self.observer)
+                self.subject.observer_set.remove(self)
                 self.observer = None
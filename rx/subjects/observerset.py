@@ -0,0 +1,52 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from rx.core.typing import Observer
+
+
+class ObserverSet:
+    """Observers of a subject, keyed by their subscription.
+
+    Notifications read an immutable tuple snapshot of the observers
+    without taking the lock. Adding or removing an observer only
+    updates the index and drops the snapshot, which is rebuilt by the
+    next notification.
+    """
+
+    __slots__ = ('lock', 'index', 'snapshot')
+
+    def __init__(self, lock: threading.RLock) -> None:
+        self.lock = lock
+        self.index: Dict[Any, Observer] = {}
+        self.snapshot: Optional[Tuple[Observer, ...]] = ()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add(self, key: Any, observer: Observer) -> None:
+        with self.lock:
+            self.index[key] = observer
+            self.snapshot = None
+
+    def remove(self, key: Any) -> None:
+        with self.lock:
+            if self.index.pop(key, None) is not None:
+                self.snapshot = None
+
+    def get(self) -> Tuple[Observer, ...]:
+        snapshot = self.snapshot
+        if snapshot is None:
+            with self.lock:
+                snapshot = self.snapshot
+                if snapshot is None:
+                    snapshot = self.snapshot = tuple(self.index.values())
+        return snapshot
+
+    def clear(self) -> Tuple[Observer, ...]:
+        """Removes all observers and returns the removed ones."""
+
+        with self.lock:
+            snapshot = self.get()
+            self.index = {}
+            self.snapshot = ()
+        return snapshot
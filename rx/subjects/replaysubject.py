@@ -1,4 +1,6 @@
 import sys
+from bisect import bisect_left
+from collections import deque
 import threading
 from typing import Any, Optional, List
 from datetime import timedelta
@@ -9,6 +11,8 @@ from rx.internal import DisposedException
 from rx.concurrency import current_thread_scheduler
 from rx.core.observer.scheduledobserver import ScheduledObserver
 
+from .observerset import ObserverSet
+
 
 class RemovableDisposable:
     def __init__(self, subject, observer):
@@ -17,8 +21,67 @@ class RemovableDisposable:
 
     def dispose(self):
         self.observer.dispose()
-        if not self.subject.is_disposed and self.observer in self.subject.observers:
-            self.subject.observers.remove(self.observer)
+        if not self.subject.is_disposed:
+            self.subject.observer_set.remove(self)
+
+
+class ReplayBuffer:
+    """Values kept by a replay subject for late subscribers.
+
+    Without a window, values are kept in a deque bounded by the buffer
+    size and no timestamps are taken. With a window, values and their
+    timestamps are kept in parallel lists. Trimming advances a start
+    offset found by bisecting the timestamps, and the lists are
+    compacted once more than half of them is trimmed.
+    """
+
+    def __init__(self, buffer_size: Optional[int], window: Optional[timedelta]) -> None:
+        self.buffer_size = buffer_size
+        self.window = window
+        self.start = 0
+        self.times: List[Any] = []
+        self.values: Any = deque(maxlen=buffer_size) if window is None else []
+
+    def __len__(self) -> int:
+        return len(self.values) - self.start
+
+    def append(self, value: Any, now: Any) -> None:
+        self.values.append(value)
+        if self.window is not None:
+            self.times.append(now)
+            if self.buffer_size is not None and len(self.values) - self.start > self.buffer_size:
+                self.start = len(self.values) - self.buffer_size
+            self.trim(now)
+
+    def trim(self, now: Any) -> None:
+        if self.window is None:
+            return
+
+        try:
+            cutoff = now - self.window
+        except OverflowError:
+            return
+
+        times = self.times
+        start = self.start
+        if start < len(times) and times[start] < cutoff:
+            start = bisect_left(times, cutoff, start)
+
+        if start > 64 and start * 2 > len(times):
+            del times[:start]
+            del self.values[:start]
+            start = 0
+        self.start = start
+
+    def snapshot(self) -> List[Any]:
+        if self.window is None:
+            return list(self.values)
+        return self.values[self.start:]
+
+    def clear(self) -> None:
+        self.start = 0
+        self.times = []
+        self.values = deque(maxlen=self.buffer_size) if self.window is None else []
 
 
 class ReplaySubject(Observable, Observer):
@@ -41,17 +104,23 @@ class ReplaySubject(Observable, Observer):
         self.buffer_size = sys.maxsize if buffer_size is None else buffer_size
         self.scheduler = scheduler or current_thread_scheduler
         self.window = timedelta.max if window is None else self.scheduler.to_timedelta(window)
-        self.queue: List[Any] = []
-        self.observers: List[ScheduledObserver] = []
+        self.queue = ReplayBuffer(buffer_size, None if window is None else self.window)
         self.is_stopped = False
         self.is_disposed = False
         self.has_error = False
         self.error: Optional[Exception] = None
 
         self.lock = threading.RLock()
+        self.observer_set = ObserverSet(self.lock)
 
         super(ReplaySubject, self).__init__()
 
+    @property
+    def observers(self):
+        """Snapshot of the subscribed observers."""
+
+        return self.observer_set.get()
+
     def check_disposed(self):
         if self.is_disposed:
             raise DisposedException()
@@ -62,11 +131,10 @@ class ReplaySubject(Observable, Observer):
 
         with self.lock:
             self.check_disposed()
-            self._trim(self.scheduler.now)
-            self.observers.append(so)
+            self._trim()
+            self.observer_set.add(subscription, so)
 
-            for item in self.queue:
-                so.on_next(item['value'])
+            so.on_next_batch(self.queue.snapshot())
 
             if self.has_error:
                 so.on_error(self.error)
@@ -76,12 +144,9 @@ class ReplaySubject(Observable, Observer):
         so.ensure_active()
         return subscription
 
-    def _trim(self, now):
-        while len(self.queue) > self.buffer_size:
-            self.queue.pop(0)
-
-        while self.queue and (now - self.queue[0]['interval']) > self.window:
-            self.queue.pop(0)
+    def _trim(self):
+        if self.queue.window is not None:
+            self.queue.trim(self.scheduler.now)
 
     def on_next(self, value: Any) -> None:
         """Notifies all subscribed observers with the value."""
@@ -90,10 +155,9 @@ class ReplaySubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                now = self.scheduler.now
-                self.queue.append(dict(interval=now, value=value))
-                self._trim(now)
+                os = self.observer_set.get()
+                queue = self.queue
+                queue.append(value, None if queue.window is None else self.scheduler.now)
 
                 for observer in os:
                     observer.on_next(value)
@@ -108,13 +172,11 @@ class ReplaySubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observer_set.clear()
                 self.is_stopped = True
                 self.error = error
                 self.has_error = True
-                now = self.scheduler.now
-                self._trim(now)
+                self._trim()
 
                 for observer in os:
                     observer.on_error(error)
@@ -129,11 +191,9 @@ class ReplaySubject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observer_set.clear()
                 self.is_stopped = True
-                now = self.scheduler.now
-                self._trim(now)
+                self._trim()
                 for observer in os:
                     observer.on_completed()
         if os:
@@ -146,5 +206,5 @@ class ReplaySubject(Observable, Observer):
 
         with self.lock:
             self.is_disposed = True
-            self.observers = []
-            self.queue = []
+            self.observer_set.clear()
+            self.queue.clear()
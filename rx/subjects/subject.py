@@ -1,5 +1,5 @@
 import threading
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence, Tuple
 
 from rx.disposable import Disposable
 from rx.core.typing import Observer, Scheduler
@@ -8,23 +8,36 @@ from rx.internal import DisposedException
 
 from .anonymoussubject import AnonymousSubject
 from .innersubscription import InnerSubscription
+from .observerset import ObserverSet
 
 
 class Subject(Observable, Observer):
     """Represents an object that is both an observable sequence as well
     as an observer. Each notification is broadcasted to all subscribed
     observers.
+
+    Notifications iterate an immutable snapshot of the observers
+    without taking the lock. The snapshot is only replaced after
+    observers subscribe or unsubscribe.
     """
 
+    supports_batch = True
+
     def __init__(self) -> None:
         super().__init__()
 
         self.is_disposed = False
         self.is_stopped = False
-        self.observers: List[Observer] = []
         self.exception: Optional[Exception] = None
 
         self.lock = threading.RLock()
+        self.observer_set = ObserverSet(self.lock)
+
+    @property
+    def observers(self) -> Tuple[Observer, ...]:
+        """Snapshot of the subscribed observers."""
+
+        return self.observer_set.get()
 
     def check_disposed(self):
         if self.is_disposed:
@@ -34,8 +47,9 @@ class Subject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                self.observers.append(observer)
-                return InnerSubscription(self, observer)
+                subscription = InnerSubscription(self, observer)
+                self.observer_set.add(subscription, observer)
+                return subscription
 
             if self.exception:
                 observer.on_error(self.exception)
@@ -52,8 +66,7 @@ class Subject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                observers = self.observers[:]
-                self.observers = []
+                observers = self.observer_set.clear()
                 self.is_stopped = True
 
         if observers:
@@ -71,8 +84,7 @@ class Subject(Observable, Observer):
         with self.lock:
             self.check_disposed()
             if not self.is_stopped:
-                os = self.observers[:]
-                self.observers = []
+                os = self.observer_set.clear()
                 self.is_stopped = True
                 self.exception = error
 
@@ -86,22 +98,30 @@ class Subject(Observable, Observer):
         Args:
             value: The value to send to all subscribed observers.
         """
-        os = None
-        with self.lock:
-            self.check_disposed()
-            if not self.is_stopped:
-                os = self.observers[:]
 
-        if os:
-            for observer in os:
+        self.check_disposed()
+        if not self.is_stopped:
+            for observer in self.observer_set.get():
                 observer.on_next(value)
 
+    def on_next_batch(self, values: Sequence[Any]) -> None:
+        """Notifies all subscribed observers with a chunk of values.
+
+        Args:
+            values: The values to send to all subscribed observers.
+        """
+
+        self.check_disposed()
+        if not self.is_stopped:
+            for observer in self.observer_set.get():
+                observer.on_next_batch(values)
+
     def dispose(self) -> None:
         """Unsubscribe all observers and release resources."""
 
         with self.lock:
             self.is_disposed = True
-            self.observers = []
+            self.observer_set.clear()
 
     @classmethod
     def create(cls, observer, observable):
@@ -1,4 +1,5 @@
 import unittest
+import threading
 from datetime import datetime, timedelta
 
 from rx.concurrency import CurrentThreadScheduler
@@ -125,3 +126,74 @@ class TestCurrentThreadScheduler(unittest.TestCase):
         scheduler.ensure_trampoline(outer_action)
         assert ran1[0] == True
         assert ran2[0] == False
+
+    def test_currentthread_immediate_before_delayed(self):
+        scheduler = CurrentThreadScheduler()
+        ran = []
+
+        def outer_action(scheduler, state):
+            def action(scheduler, state):
+                ran.append(state)
+
+            scheduler.schedule_relative(timedelta(milliseconds=10), action, 3)
+            scheduler.schedule(action, 1)
+            scheduler.schedule_relative(timedelta(0), action, 2)
+
+        scheduler.schedule(outer_action)
+        assert ran == [1, 2, 3]
+
+    def test_currentthread_due_delayed_before_immediate(self):
+        scheduler = CurrentThreadScheduler()
+        stopped = []
+        spins = [0]
+
+        def outer_action(scheduler, state):
+            def stop(scheduler, state):
+                stopped.append(spins[0])
+
+            def spin(scheduler, state):
+                spins[0] += 1
+                if not stopped and spins[0] < 1000000:
+                    scheduler.schedule(spin)
+
+            scheduler.schedule_relative(timedelta(milliseconds=10), stop)
+            scheduler.schedule(spin)
+
+        scheduler.schedule(outer_action)
+        assert stopped
+        assert stopped[0] < 1000000
+
+    def test_currentthread_dispose_removes_delayed_item(self):
+        scheduler = CurrentThreadScheduler()
+        lengths = []
+
+        def outer_action(scheduler, state):
+            def action(scheduler, state):
+                pass
+
+            disposables = [scheduler.schedule_relative(timedelta(seconds=60), action) for _ in range(3)]
+            trampoline = scheduler._local.trampoline
+            lengths.append(len(trampoline.delayed))
+            for disposable in disposables:
+                disposable.dispose()
+            lengths.append(len(trampoline.delayed))
+
+        scheduler.schedule(outer_action)
+        assert lengths == [3, 0]
+
+    def test_currentthread_trampoline_is_thread_local(self):
+        scheduler = CurrentThreadScheduler()
+        required = []
+
+        def thread_action():
+            required.append(scheduler.schedule_required())
+
+        def action(scheduler, state):
+            required.append(scheduler.schedule_required())
+            thread = threading.Thread(target=thread_action)
+            thread.start()
+            thread.join()
+
+        scheduler.schedule(action)
+        assert required == [False, True]
+        assert scheduler.schedule_required()
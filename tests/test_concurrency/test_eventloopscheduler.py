@@ -69,6 +69,24 @@ class TestEventLoopScheduler(unittest.TestCase):
         diff = endtime[0]-starttime
         assert(diff > timedelta(milliseconds=180))
 
+    def test_event_loop_schedule_action_due_monotonic(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True, monotonic=True)
+        gate = threading.Semaphore(0)
+        starttime = datetime.utcnow()
+        endtime = []
+
+        def action(scheduler, state):
+            endtime.append(datetime.utcnow())
+            gate.release()
+
+        scheduler.schedule_relative(0.2, action)
+        scheduler.schedule_absolute(starttime + timedelta(milliseconds=100), action)
+
+        gate.acquire()
+        gate.acquire()
+        assert(endtime[0] - starttime > timedelta(milliseconds=80))
+        assert(endtime[1] - starttime > timedelta(milliseconds=180))
+
     def test_eventloop_schedule_action_periodic(self):
         scheduler = EventLoopScheduler()
         gate = threading.Semaphore(0)
@@ -88,3 +106,62 @@ class TestEventLoopScheduler(unittest.TestCase):
             assert counter[0] == 0
 
         gate.acquire()
+
+    def test_event_loop_reschedule_without_timer_threads(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True)
+        gate = threading.Semaphore(0)
+        result = []
+        threads = threading.active_count()
+
+        def action(scheduler, state):
+            result.append(state)
+            if state == 50:
+                gate.release()
+
+        for i in range(50, -1, -1):
+            scheduler.schedule_relative(0.001 * i + 0.05, action, i)
+
+        assert threading.active_count() <= threads + 1
+        gate.acquire()
+        assert result == list(range(51))
+
+    def test_event_loop_metrics(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True, metrics=True)
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            if state:
+                gate.release()
+
+        with scheduler.condition:
+            for i in range(9):
+                scheduler.schedule(action, i == 8)
+            assert scheduler.queue_length == 9
+
+        gate.acquire()
+        metrics = scheduler.metrics
+        assert metrics.wakeups == 1
+        assert metrics.items == 9
+        assert metrics.max_batch == 9
+        assert metrics.items_per_wakeup == 9
+        assert metrics.max_lag >= 0
+        assert EventLoopScheduler().metrics is None
+
+    def test_event_loop_dispose_wakes_loop(self):
+        scheduler = EventLoopScheduler()
+        scheduler.schedule_relative(10, lambda s, t: None)
+        thread = scheduler.thread
+
+        scheduler.dispose()
+        thread.join(1)
+        assert not thread.is_alive()
+
+    def test_event_loop_dispose_removes_delayed_item(self):
+        scheduler = EventLoopScheduler()
+        disposables = [scheduler.schedule_relative(60, lambda s, t: None) for _ in range(10)]
+        assert scheduler.queue_length == 10
+
+        for disposable in disposables[:7]:
+            disposable.dispose()
+        assert scheduler.queue_length == 3
+        scheduler.dispose()
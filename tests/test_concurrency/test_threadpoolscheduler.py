@@ -75,3 +75,34 @@ class TestThreadPoolScheduler(unittest.TestCase):
 
         time.sleep(0.1)
         assert(not len(set))
+
+    def test_schedule_action_statistics(self):
+        scheduler = ThreadPoolScheduler(max_workers=1)
+        gate = threading.Event()
+        started = threading.Event()
+        ran = []
+
+        def blocking(scheduler, state):
+            started.set()
+            gate.wait()
+
+        def action(scheduler, state):
+            ran.append(state)
+
+        scheduler.schedule(blocking)
+        started.wait()
+        scheduler.schedule(action, 1)
+        scheduler.schedule_relative(10, action, 2)
+
+        assert scheduler.active_workers == 1
+        assert scheduler.queue_depth == 1
+        assert scheduler.delayed_count == 1
+
+        gate.set()
+        scheduler.shutdown()
+        assert ran == [1]
+        assert scheduler.active_workers == 0
+        assert scheduler.queue_depth == 0
+
+        scheduler.schedule(action, 3)
+        assert scheduler.rejected_count == 1
@@ -1,7 +1,11 @@
+import os
+import subprocess
+import sys
 import unittest
 
 from datetime import datetime, timedelta
-from time import sleep
+from time import monotonic, sleep
+import threading
 from rx.concurrency import TimeoutScheduler
 
 
@@ -48,3 +52,54 @@ class TestTimeoutScheduler(unittest.TestCase):
 
         sleep(0.1)
         assert (not ran[0])
+
+    def test_timeout_schedule_many_shares_timer_thread(self):
+        scheduler = TimeoutScheduler(max_workers=2)
+        threads_before = threading.active_count()
+        ran = []
+
+        def action(scheduler, state):
+            ran.append(state)
+
+        disposables = [scheduler.schedule_relative(0.05, action, i) for i in range(200)]
+        for d in disposables[::2]:
+            d.dispose()
+
+        assert threading.active_count() - threads_before <= 1
+
+        sleep(0.3)
+        assert sorted(ran) == list(range(1, 200, 2))
+        assert threading.active_count() - threads_before <= 3
+        assert not scheduler.heap
+
+    def test_timeout_blocking_actions_do_not_delay_timers(self):
+        scheduler = TimeoutScheduler()
+        release = threading.Event()
+        fired = threading.Event()
+
+        def block(scheduler, state):
+            release.wait(5)
+
+        try:
+            for _ in range(40):
+                scheduler.schedule(block)
+            scheduler.schedule_relative(0.1, lambda scheduler, state: fired.set())
+
+            assert fired.wait(2)
+        finally:
+            release.set()
+
+    def test_timeout_running_action_does_not_block_exit(self):
+        script = "\n".join([
+            "import time",
+            "from rx.concurrency import timeout_scheduler",
+            "timeout_scheduler.schedule(lambda scheduler, state: time.sleep(5))",
+            "timeout_scheduler.schedule_relative(0.05, lambda scheduler, state: time.sleep(5))",
+            "time.sleep(0.2)",
+        ])
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ, PYTHONPATH=root)
+
+        start = monotonic()
+        subprocess.run([sys.executable, "-c", script], env=env, check=True, timeout=30)
+        assert monotonic() - start < 3
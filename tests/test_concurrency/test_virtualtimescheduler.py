@@ -59,3 +59,20 @@ class TestVirtualTimeScheduler(unittest.TestCase):
             assert(False)
         except Exception as e:
             self.assertEqual(str(e), ex)
+
+    def test_virtual_dispose_removes_item(self):
+        ran = []
+        scheduler = VirtualTimeScheduler()
+
+        def action(scheduler, state):
+            ran.append(state)
+
+        disposables = [scheduler.schedule_absolute(10.0, action, i) for i in range(4)]
+        assert len(scheduler.queue) == 4
+
+        disposables[1].dispose()
+        disposables[2].dispose()
+        assert len(scheduler.queue) == 2
+
+        scheduler.start()
+        assert ran == [0, 3]
@@ -1,4 +1,8 @@
+import threading
+
+import rx
 from rx.core import ObserverBase, AnonymousObserver
+from rx.core.observer import AutoDetachObserver, SerializedObserver
 from rx.core.notification import OnNext, OnError, OnCompleted, from_notifier
 from rx.internal.exceptions import CompletedException
 
@@ -295,5 +299,107 @@ def test_as_observer_forwards():
     obsc.as_observer().on_completed()
     assert(obsc.has_on_completed)
 
+def test_subscribe_hides_auto_detach_observer():
+    source = rx.never()
+    assert not isinstance(source.subscribe(), AutoDetachObserver)
+    assert isinstance(source.subscribe_(), AutoDetachObserver)
+
+
+def test_observable_lock_is_lazy():
+    source = rx.never()
+    assert source._lock is None
+    lock = source.lock
+    assert source.lock is lock
+
+
+def test_on_next_batch_stops_when_stopped():
+    obs = MyObserver()
+    obs.on_next_batch([1, 2, 3])
+    assert(obs.has_on_next == 3)
+
+    obs.dispose()
+    obs.on_next_batch([4])
+    assert(obs.has_on_next == 3)
+
+
+def test_serialized_observer_reentrant():
+    results = []
+    serialized = None
+
+    def on_next(value):
+        results.append(value)
+        if value == 1:
+            serialized.on_next(2)
+            results.append('after')
+
+    serialized = SerializedObserver(AnonymousObserver(on_next))
+    serialized.on_next(1)
+    serialized.on_next(3)
+    assert results == [1, 'after', 2, 3]
+
+
+def test_serialized_observer_terminal():
+    results = []
+    serialized = SerializedObserver(AnonymousObserver(results.append, results.append, lambda: results.append('C')))
+    serialized.on_next(1)
+    serialized.on_completed()
+    serialized.on_next(2)
+    serialized.on_error('ex')
+    assert results == [1, 'C']
+
+
+def test_serialized_observer_threads():
+    results = []
+    active = [0]
+    overlapped = [False]
+
+    def on_next(value):
+        active[0] += 1
+        if active[0] > 1:
+            overlapped[0] = True
+        results.append(value)
+        active[0] -= 1
+
+    serialized = SerializedObserver(AnonymousObserver(on_next))
+
+    def produce(offset):
+        for i in range(1000):
+            serialized.on_next(offset + i)
+
+    threads = [threading.Thread(target=produce, args=(i * 1000,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not overlapped[0]
+    assert sorted(results) == list(range(4000))
+    for i in range(4):
+        produced = [value for value in results if i * 1000 <= value < (i + 1) * 1000]
+        assert produced == list(range(i * 1000, (i + 1) * 1000))
+
+
+def test_serialized_observer_drains_after_exception():
+    results = []
+    serialized = None
+
+    def on_next(value):
+        results.append(value)
+        if value == 1:
+            thread = threading.Thread(target=serialized.on_next, args=(2,))
+            thread.start()
+            thread.join()
+            raise Exception('ex')
+
+    serialized = SerializedObserver(AnonymousObserver(on_next))
+    try:
+        serialized.on_next(1)
+    except Exception as ex:
+        results.append(str(ex))
+
+    assert results == [1, 2, 'ex']
+    assert not serialized.queue
+
+
 if __name__ == '__main__':
     test_to_notifier_forwards()
@@ -1,6 +1,6 @@
 import unittest
 
-from rx.internal import PriorityQueue
+from rx.internal import PriorityQueue, IndexedPriorityQueue
 from rx.internal.exceptions import InvalidOperationException
 
 
@@ -147,3 +147,58 @@ class TestPriorityQueue(unittest.TestCase):
         assert p.remove_at(0) == 41
 
         self.assertRaises(IndexError, p.remove_at, 0)
+
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    def test_indexedpriorityqueue_empty(self):
+        p = IndexedPriorityQueue()
+
+        assert len(p) == 0
+        self.assertRaises(InvalidOperationException, p.peek)
+        self.assertRaises(IndexError, p.dequeue)
+
+    def test_indexedpriorityqueue_enqueue_dequeue(self):
+        p = IndexedPriorityQueue()
+
+        p.enqueue(TestItem(42, "first"))
+        p.enqueue(TestItem(41))
+        p.enqueue(TestItem(42, "last"))
+        assert len(p) == 3
+
+        assert p.dequeue().label is None
+        assert p.dequeue().label == "first"
+        assert p.dequeue().label == "last"
+        assert len(p) == 0
+
+    def test_indexedpriorityqueue_remove_by_identity(self):
+        p = IndexedPriorityQueue()
+        first = TestItem(42, "first")
+        second = TestItem(42, "second")
+        low = TestItem(41)
+
+        assert p.remove(first) is False
+        p.enqueue(first)
+        p.enqueue(second)
+        p.enqueue(low)
+
+        assert p.remove(second) is True
+        assert p.remove(second) is False
+        assert len(p) == 2
+        assert p.peek() is low
+        assert p.remove(low) is True
+        assert p.peek() is first
+        assert p.dequeue() is first
+        assert len(p) == 0
+
+    def test_indexedpriorityqueue_compacts(self):
+        p = IndexedPriorityQueue()
+        items = [TestItem(i) for i in range(100)]
+        for item in items:
+            p.enqueue(item)
+
+        for item in items[:60]:
+            p.remove(item)
+
+        assert len(p) == 40
+        assert len(p.items) < 100
+        assert [p.dequeue().value for _ in range(40)] == list(range(60, 100))
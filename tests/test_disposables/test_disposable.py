@@ -288,3 +288,30 @@ def test_refcountdisposable_primarydisposesfirst():
     assert not d.is_disposed
     d2.dispose()
     assert d.is_disposed
+
+def test_groupdisposable_duplicates():
+    disposed = []
+    d1 = Disposable(lambda: disposed.append(1))
+
+    g = CompositeDisposable(d1, d1)
+    assert g.length == 2
+    assert g.remove(d1)
+    assert g.length == 1
+    assert g.contains(d1)
+    assert g.remove(d1)
+    assert not g.contains(d1)
+    assert not g.remove(d1)
+    assert g.length == 0
+
+def test_groupdisposable_dispose_order():
+    disposed = []
+    items = [Disposable(lambda i=i: disposed.append(i)) for i in range(100)]
+
+    g = CompositeDisposable(items)
+    for item in items[::2]:
+        g.remove(item)
+    del disposed[:]
+
+    g.dispose()
+    assert disposed == list(range(1, 100, 2))
+    assert g.length == 0
@@ -183,3 +183,33 @@ class TestBuffer(unittest.TestCase):
 
         assert ys.subscriptions == [
             subscribe(200, 400)]
+
+    def test_buffer_closing_mapper(self):
+        scheduler = TestScheduler()
+
+        xs = scheduler.create_hot_observable(
+            on_next(180, 2),
+            on_next(250, 3),
+            on_next(260, 4),
+            on_next(310, 5),
+            on_next(340, 6),
+            on_next(410, 7),
+            on_completed(450)
+        )
+
+        def closing_mapper():
+            return scheduler.create_cold_observable(on_next(100, True))
+
+        def create():
+            return xs.pipe(ops.buffer(closing_mapper))
+
+        res = scheduler.start(create=create)
+
+        assert [
+            on_next(300, lambda b: b == [3, 4]),
+            on_next(400, lambda b: b == [5, 6]),
+            on_next(450, lambda b: b == [7]),
+            on_completed(450)] == res.messages
+
+        assert xs.subscriptions == [
+            subscribe(200, 450)]
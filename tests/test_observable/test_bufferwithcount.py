@@ -1,6 +1,8 @@
 import unittest
 
+import rx
 from rx import operators as ops
+from rx.internal import BufferPool
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -156,3 +158,21 @@ class TestBufferWithCount(unittest.TestCase):
         assert(sequence_equal(results[0].value.value, [2, 3]) and results[0].time == 220)
         assert(sequence_equal(results[1].value.value, [5]) and results[1].time == 250)
         assert(results[2].value.kind == 'C' and results[2].time == 250)
+
+    def test_buffer_count_batches(self):
+        results = []
+
+        rx.range(0, 10).pipe(ops.buffer_with_count(4)).subscribe(results.append)
+        assert results == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    def test_buffer_count_pool(self):
+        pool = BufferPool()
+        seen = []
+
+        def on_next(buffer):
+            seen.append((id(buffer), list(buffer)))
+            pool.release(buffer)
+
+        rx.from_([1, 2, 3, 4, 5]).pipe(ops.buffer_with_count(2, pool=pool)).subscribe(on_next)
+        assert [values for _, values in seen] == [[1, 2], [3, 4], [5]]
+        assert len({ident for ident, _ in seen}) == 2
@@ -0,0 +1,90 @@
+import unittest
+
+from rx import operators as ops
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestCombineLatestKeyed(unittest.TestCase):
+
+    def test_combine_latest_keyed_basic(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(220, 1), on_next(240, 3), on_completed(250))
+        ys = scheduler.create_hot_observable(on_next(230, 2), on_next(260, 4), on_completed(270))
+        source = scheduler.create_hot_observable(on_next(210, ('a', xs)), on_next(215, ('b', ys)), on_completed(300))
+
+        def create():
+            return source.pipe(ops.combine_latest_keyed(), ops.map(dict))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, {'a': 1}),
+            on_next(230, {'a': 1, 'b': 2}),
+            on_next(240, {'a': 3, 'b': 2}),
+            on_next(260, {'a': 3, 'b': 4}),
+            on_completed(300)]
+        assert xs.subscriptions == [subscribe(210, 250)]
+        assert ys.subscriptions == [subscribe(215, 270)]
+
+    def test_combine_latest_keyed_replace_and_remove(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(220, 1), on_next(240, 2))
+        ys = scheduler.create_hot_observable(on_next(250, 3), on_next(270, 4))
+        source = scheduler.create_hot_observable(
+            on_next(210, ('a', xs)), on_next(230, ('a', ys)), on_next(260, ('a', None)), on_completed(280))
+
+        def create():
+            return source.pipe(ops.combine_latest_keyed(), ops.map(dict))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, {'a': 1}),
+            on_next(250, {'a': 3}),
+            on_next(260, {}),
+            on_completed(280)]
+        assert xs.subscriptions == [subscribe(210, 230)]
+        assert ys.subscriptions == [subscribe(230, 260)]
+
+    def test_combine_latest_keyed_waits_for_inners(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(230, 1), on_completed(300))
+        source = scheduler.create_hot_observable(on_next(210, ('a', xs)), on_completed(220))
+
+        def create():
+            return source.pipe(ops.combine_latest_keyed(), ops.map(dict))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(230, {'a': 1}), on_completed(300)]
+
+    def test_combine_latest_keyed_inner_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(220, 1), on_error(230, ex))
+        ys = scheduler.create_hot_observable(on_next(240, 2))
+        source = scheduler.create_hot_observable(on_next(210, ('a', xs)), on_next(215, ('b', ys)))
+
+        def create():
+            return source.pipe(ops.combine_latest_keyed(), ops.map(dict))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, {'a': 1}), on_error(230, ex)]
+        assert ys.subscriptions == [subscribe(215, 230)]
+
+    def test_combine_latest_keyed_read_only(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(220, 1))
+        source = scheduler.create_hot_observable(on_next(210, ('a', xs)))
+        mappings = []
+
+        source.pipe(ops.combine_latest_keyed()).subscribe(mappings.append, scheduler=scheduler)
+        scheduler.start()
+
+        with self.assertRaises(TypeError):
+            mappings[0]['a'] = 2
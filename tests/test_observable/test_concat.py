@@ -217,3 +217,12 @@ class TestConcat(unittest.TestCase):
         results = scheduler.start(create)
         assert results.messages == [on_next(210, 2), on_next(
             220, 3), on_next(230, 4), on_next(240, 5), on_completed(250)]
+
+    def test_concat_resubscribe(self):
+        source = rx.concat(rx.of(1, 2), rx.of(3))
+        first = []
+        second = []
+
+        source.subscribe(first.append)
+        source.subscribe(second.append)
+        assert first == second == [1, 2, 3]
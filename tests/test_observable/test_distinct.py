@@ -94,3 +94,49 @@ class TestDistinctUntilChanged(unittest.TestCase):
 
         assert results.messages == [on_next(280, 3), on_next(350, 1), on_error(380, ex)]
         assert xs.subscriptions == [subscribe(200, 380)]
+
+    def test_distinct_unhashable_keys(self):
+        results = []
+        rx.from_([[1], [2], [1], {'a': 1}, {'a': 1}]).pipe(
+            ops.distinct()
+        ).subscribe(results.append)
+
+        assert results == [[1], [2], {'a': 1}]
+
+    def test_distinct_max_size(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 1), on_next(240, 3),
+                                             on_next(250, 2), on_next(260, 1), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.distinct(max_size=2))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(210, 1), on_next(220, 2), on_next(240, 3), on_next(250, 2),
+                                    on_next(260, 1), on_completed(300)]
+
+    def test_distinct_ttl(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 1), on_next(240, 2), on_next(255, 1),
+                                             on_next(300, 1), on_completed(400))
+
+        def create():
+            return xs.pipe(ops.distinct(ttl=40))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(210, 1), on_next(240, 2), on_next(300, 1), on_completed(400)]
+
+    def test_distinct_bloom_filter(self):
+        results = []
+        rx.from_(list(range(5000)) * 2).pipe(
+            ops.distinct(max_size=5000, false_positive_rate=0.001)
+        ).subscribe(results.append)
+
+        assert 4950 < len(results) <= 5000
+        assert len(set(results)) == len(results)
+
+    def test_distinct_comparer_with_bounded_mode(self):
+        with self.assertRaises(ValueError):
+            ops.distinct(comparer=lambda a, b: a == b, max_size=10)
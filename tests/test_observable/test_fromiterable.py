@@ -1,6 +1,7 @@
 import unittest
 
 import rx
+from rx import operators as ops
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -61,3 +62,42 @@ class TestFromIterable(unittest.TestCase):
                 on_next(200, 1), on_next(200, 2), on_next(200, 3),
                 on_next(200, 1), on_next(200, 2), on_next(200, 3),
                 on_completed(200)]
+
+    def test_subscribe_to_iterable_batched(self):
+        batches = []
+        completed = []
+
+        class BatchObserver:
+            supports_batch = True
+
+            def on_next(self, value):
+                batches.append([value])
+
+            def on_next_batch(self, values):
+                batches.append(list(values))
+
+            def on_error(self, error):
+                raise error
+
+            def on_completed(self):
+                completed.append(True)
+
+        rx.from_(range(2500)).subscribe(BatchObserver())
+
+        assert [len(batch) for batch in batches] == [1024, 1024, 452]
+        assert sum(batches, []) == list(range(2500))
+        assert completed == [True]
+
+    def test_subscribe_to_generator_pulls_lazily(self):
+        pulled = []
+
+        def numbers():
+            for i in range(5000):
+                pulled.append(i)
+                yield i
+
+        result = []
+        rx.from_(numbers()).pipe(ops.take(3), ops.sum()).subscribe(result.append)
+
+        assert result == [3]
+        assert pulled == [0, 1, 2]
@@ -0,0 +1,115 @@
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.core.observable import FusedObservable
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestFused(unittest.TestCase):
+
+    def test_fused_pipe_single_observable(self):
+        source = rx.never()
+        result = source.pipe(
+            ops.map(lambda x: x),
+            ops.filter(lambda x: True),
+            ops.scan(lambda acc, x: acc + x),
+            ops.skip(1),
+            ops.take(2)
+        )
+
+        assert isinstance(result, FusedObservable)
+        assert result.source is source
+        assert len(result.stages) == 5
+
+    def test_fused_chained_pipes(self):
+        source = rx.never()
+        first = source.pipe(ops.map(lambda x: x))
+        second = first.pipe(ops.filter(lambda x: True))
+        third = first.pipe(ops.take(1))
+
+        assert second.source is source
+        assert third.source is source
+        assert len(first.stages) == 1
+        assert len(second.stages) == 2
+        assert len(third.stages) == 2
+
+    def test_fused_map_filter_scan(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1), on_next(210, 2), on_next(220, 3), on_next(230, 4),
+            on_next(240, 5), on_next(250, 6), on_completed(300))
+
+        def create():
+            return xs.pipe(
+                ops.map(lambda x: x * 10),
+                ops.filter(lambda x: x % 20 == 0),
+                ops.scan(lambda acc, x: acc + x, 0),
+                ops.map_indexed(lambda x, i: (x, i))
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, (20, 0)), on_next(230, (60, 1)), on_next(250, (120, 2)), on_completed(300)]
+        assert xs.subscriptions == [subscribe(200, 300)]
+
+    def test_fused_take_completes_after_downstream_drop(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+
+        def create():
+            return xs.pipe(
+                ops.take(2),
+                ops.filter(lambda x: x == 1)
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_completed(220)]
+        assert xs.subscriptions == [subscribe(200, 220)]
+
+    def test_fused_take_while_skip_while(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_next(240, 4),
+            on_next(250, 1), on_completed(300))
+
+        def create():
+            return xs.pipe(
+                ops.skip_while(lambda x: x < 2),
+                ops.take_while(lambda x: x < 4)
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, 2), on_next(230, 3), on_completed(240)]
+        assert xs.subscriptions == [subscribe(200, 240)]
+
+    def test_fused_stage_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+
+        def mapper(x):
+            if x == 2:
+                raise Exception(ex)
+            return x
+
+        def create():
+            return xs.pipe(
+                ops.filter(lambda x: x > 0),
+                ops.map(mapper),
+                ops.take(5)
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+        assert xs.subscriptions == [subscribe(200, 220)]
@@ -593,6 +593,52 @@ class TestGroupBy(unittest.TestCase):
             on_next(200, ["gamma"]),
             on_completed(200)]
 
+    def test_group_by_max_groups(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 'a1'), on_next(220, 'b1'), on_next(230, 'a2'), on_next(240, 'c1'),
+            on_next(250, 'b2'), on_completed(300))
+        events = []
+
+        def create():
+            def on_group(group):
+                group.subscribe_(lambda x: events.append((group.key, x)),
+                                 on_completed=lambda: events.append((group.key, 'done')))
+                return group.key
+
+            return xs.pipe(
+                ops.group_by(lambda x: x[0], lambda x: x[1], max_groups=2),
+                ops.map(on_group))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(210, 'a'), on_next(220, 'b'), on_next(240, 'c'),
+                                    on_next(250, 'b'), on_completed(300)]
+        assert events == [('a', '1'), ('b', '1'), ('a', '2'), ('b', 'done'), ('c', '1'),
+                          ('a', 'done'), ('b', '2'), ('c', 'done'), ('b', 'done')]
+
+    def test_group_by_idle_timeout(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 'a1'), on_next(220, 'b1'), on_next(240, 'a2'), on_next(300, 'b2'),
+            on_completed(400))
+        completed = []
+
+        def create():
+            def on_group(group):
+                group.subscribe_(on_completed=lambda: completed.append((group.key, scheduler.clock)))
+                return group.key
+
+            return xs.pipe(
+                ops.group_by(lambda x: x[0], lambda x: x[1], idle_timeout=50, scheduler=scheduler),
+                ops.map(on_group))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(210, 'a'), on_next(220, 'b'), on_next(300, 'b'),
+                                    on_completed(400)]
+        assert completed == [('b', 270), ('a', 290), ('b', 350)]
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from rx import operators as ops
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class RxException(Exception):
+    pass
+
+
+def key(x):
+    return x[0]
+
+
+class TestJoinOn(unittest.TestCase):
+
+    def test_join_on_matches_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, ('a', 1)), on_next(220, ('b', 2)), on_next(230, ('a', 3)), on_completed(400))
+        ys = scheduler.create_hot_observable(
+            on_next(215, ('a', 'x')), on_next(225, ('c', 'y')), on_next(235, ('b', 'z')), on_completed(400))
+
+        def create():
+            return xs.pipe(ops.join_on(ys, key, key, 50))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(215, (('a', 1), ('a', 'x'))),
+            on_next(230, (('a', 3), ('a', 'x'))),
+            on_next(235, (('b', 2), ('b', 'z'))),
+            on_completed(400)]
+        assert xs.subscriptions == [subscribe(200, 400)]
+        assert ys.subscriptions == [subscribe(200, 400)]
+
+    def test_join_on_window_expires(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ('a', 1)), on_next(250, ('a', 2)), on_completed(400))
+        ys = scheduler.create_hot_observable(
+            on_next(220, ('a', 'x')), on_next(235, ('a', 'y')), on_next(275, ('a', 'z')), on_completed(400))
+
+        def create():
+            return xs.pipe(ops.join_on(ys, key, key, 30))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, (('a', 1), ('a', 'x'))),
+            on_next(235, (('a', 1), ('a', 'y'))),
+            on_next(250, (('a', 2), ('a', 'y'))),
+            on_next(275, (('a', 2), ('a', 'z'))),
+            on_completed(400)]
+
+    def test_join_on_completes_when_window_empties(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ('a', 1)), on_completed(220))
+        ys = scheduler.create_hot_observable(on_next(230, ('a', 'x')), on_next(300, ('a', 'y')))
+
+        def create():
+            return xs.pipe(ops.join_on(ys, key, key, 50))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(230, (('a', 1), ('a', 'x'))), on_completed(260)]
+        assert ys.subscriptions == [subscribe(200, 260)]
+
+    def test_join_on_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ('a', 1)), on_error(220, ex))
+        ys = scheduler.create_hot_observable(on_next(215, ('a', 'x')))
+
+        def create():
+            return xs.pipe(ops.join_on(ys, key, key, 50))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(215, (('a', 1), ('a', 'x'))), on_error(220, ex)]
+
+    def test_join_on_key_mapper_throws(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, ('a', 1)))
+        ys = scheduler.create_hot_observable(on_next(215, ('a', 'x')))
+
+        def right_key(x):
+            raise RxException(ex)
+
+        def create():
+            return xs.pipe(ops.join_on(ys, key, right_key, 50))
+
+        results = scheduler.start(create)
+        assert len(results.messages) == 1
+        assert results.messages[0].time == 215
+        assert isinstance(results.messages[0].value.exception, RxException)
@@ -1,8 +1,10 @@
+import threading
 import unittest
 import pytest
 
 import rx
 from rx import operators as ops
+from rx.concurrency import ThreadPoolScheduler
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -492,3 +494,26 @@ class TestMerge(unittest.TestCase):
             on_next(350, 3),
             on_completed(360)]
         assert xs.subscriptions == [subscribe(200, 360)]
+
+    def test_merge_concurrent_inners_serialized(self):
+        for merge in (ops.merge_all(), ops.merge(max_concurrent=3)):
+            scheduler = ThreadPoolScheduler(4)
+            results = []
+            active = [0]
+            overlapped = [False]
+            done = threading.Event()
+
+            def on_next(value):
+                active[0] += 1
+                if active[0] > 1:
+                    overlapped[0] = True
+                results.append(value)
+                active[0] -= 1
+
+            sources = rx.from_([rx.range(i * 100, (i + 1) * 100, scheduler=scheduler) for i in range(8)])
+            sources.pipe(merge).subscribe(on_next, on_completed=done.set)
+
+            assert done.wait(5)
+            assert not overlapped[0]
+            assert sorted(results) == list(range(800))
+            scheduler.shutdown()
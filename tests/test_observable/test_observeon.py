@@ -1,7 +1,12 @@
+import threading
+import time
 import unittest
 
 import rx
 from rx import operators as ops
+from rx.concurrency import EventLoopScheduler
+from rx.core.observer import BufferCounters
+from rx.internal import BufferOverflowException
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -75,3 +80,100 @@ class TestObserveOn(unittest.TestCase):
 
         assert results.messages == []
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_observe_on_drains_in_batches(self):
+        scheduler = TestScheduler()
+        runs = []
+        schedule = scheduler.schedule
+
+        def counting_schedule(action, state=None):
+            runs.append(action)
+            return schedule(action, state)
+
+        scheduler.schedule = counting_schedule
+        results = []
+
+        rx.from_(range(1000)).pipe(
+            ops.observe_on(scheduler, batch_size=100)
+        ).subscribe(results.append)
+        scheduler.start()
+
+        assert results == list(range(1000))
+        assert len(runs) == 11
+
+    def test_observe_on_time_budget(self):
+        scheduler = TestScheduler()
+        runs = []
+        schedule = scheduler.schedule
+
+        def counting_schedule(action, state=None):
+            runs.append(action)
+            return schedule(action, state)
+
+        scheduler.schedule = counting_schedule
+        results = []
+
+        rx.from_(range(10)).pipe(
+            ops.observe_on(scheduler, time_budget=0)
+        ).subscribe(results.append)
+        scheduler.start()
+
+        assert results == list(range(10))
+        assert len(runs) == 12
+
+    def _bounded(self, overflow, counters=None):
+        scheduler = TestScheduler()
+        results = []
+        errors = []
+
+        rx.from_(range(10)).pipe(
+            ops.observe_on(scheduler, max_buffer=3, overflow=overflow, counters=counters)
+        ).subscribe(results.append, errors.append)
+        scheduler.start()
+        return results, errors
+
+    def test_observe_on_drop_newest(self):
+        counters = BufferCounters()
+        results, errors = self._bounded('drop_newest', counters)
+
+        assert results == [0, 1, 2]
+        assert counters.dropped == 7
+        assert counters.high_water == 3
+        assert counters.depth == 0
+
+    def test_observe_on_drop_oldest(self):
+        results, _ = self._bounded('drop_oldest')
+        assert results == [7, 8, 9]
+
+    def test_observe_on_latest_only(self):
+        counters = BufferCounters()
+        results, _ = self._bounded('latest_only', counters)
+
+        assert results == [9]
+        assert counters.dropped == 9
+
+    def test_observe_on_overflow_error(self):
+        results, errors = self._bounded('error')
+
+        assert results == [0, 1, 2]
+        assert isinstance(errors[0], BufferOverflowException)
+
+    def test_observe_on_block(self):
+        scheduler = EventLoopScheduler()
+        counters = BufferCounters()
+        results = []
+        done = threading.Event()
+
+        def on_next(x):
+            time.sleep(0.001)
+            results.append(x)
+
+        rx.from_(range(100)).pipe(
+            ops.observe_on(scheduler, max_buffer=5, counters=counters)
+        ).subscribe(on_next, on_completed=done.set)
+
+        assert done.wait(5)
+        assert results == list(range(100))
+        assert counters.high_water <= 5
+        assert counters.blocked > 0
+        scheduler.dispose()
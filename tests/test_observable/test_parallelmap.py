@@ -0,0 +1,90 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import rx
+from rx import operators as ops
+
+
+def square(x):
+    return x * x
+
+
+class TestParallelMap(unittest.TestCase):
+
+    def _run(self, source, op):
+        results = []
+        errors = []
+        done = threading.Event()
+
+        source.pipe(op).subscribe(results.append, lambda e: (errors.append(e), done.set()), done.set)
+        assert done.wait(10)
+        return results, errors
+
+    def test_parallel_map_ordered(self):
+        def slow(x):
+            time.sleep(0.001 * (x % 5))
+            return x * 2
+
+        results, errors = self._run(rx.from_(range(100)), ops.parallel_map(slow, max_workers=4))
+        assert results == [x * 2 for x in range(100)]
+        assert errors == []
+
+    def test_parallel_map_unordered(self):
+        def slow(x):
+            time.sleep(0.01 if x == 0 else 0)
+            return x
+
+        results, _ = self._run(rx.from_(range(20)), ops.parallel_map(slow, max_workers=4, ordered=False))
+        assert sorted(results) == list(range(20))
+        assert results[0] != 0
+
+    def test_parallel_map_chunks(self):
+        results, _ = self._run(rx.from_(range(10)), ops.parallel_map(lambda x: x + 1, chunksize=4))
+        assert results == list(range(1, 11))
+
+    def test_parallel_map_error(self):
+        ex = Exception('ex')
+
+        def mapper(x):
+            if x == 5:
+                raise ex
+            return x
+
+        results, errors = self._run(rx.from_(range(10)), ops.parallel_map(mapper, max_workers=2))
+        assert errors == [ex]
+        assert results == list(range(len(results)))
+
+    def test_parallel_map_bounded_window(self):
+        pending = []
+        gate = threading.Event()
+
+        def mapper(x):
+            gate.wait(5)
+            return x
+
+        def on_subscribe(observer, scheduler):
+            def run():
+                for i in range(50):
+                    pending.append(i)
+                    observer.on_next(i)
+                observer.on_completed()
+            threading.Thread(target=run, daemon=True).start()
+
+        results = []
+        done = threading.Event()
+        rx.create(on_subscribe).pipe(
+            ops.parallel_map(mapper, max_workers=2)
+        ).subscribe(results.append, on_completed=done.set)
+
+        time.sleep(0.1)
+        assert len(pending) <= 5
+        gate.set()
+        assert done.wait(5)
+        assert results == list(range(50))
+
+    def test_parallel_map_process_pool(self):
+        with ProcessPoolExecutor(2) as executor:
+            results, _ = self._run(rx.from_(range(50)), ops.parallel_map(square, executor, chunksize=10))
+        assert results == [x * x for x in range(50)]
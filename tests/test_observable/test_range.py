@@ -93,3 +93,24 @@ class TestRange(unittest.TestCase):
                                     on_next(200, 6),
                                     on_next(200, 8),
                                     on_completed(200)]
+
+    def test_range_batched_through_operators(self):
+        batches = []
+
+        def on_next_batch(values):
+            batches.append(list(values))
+
+        result = []
+        rx.range(0, 3000).pipe(
+            ops.map(lambda x: x * 2),
+            ops.filter(lambda x: x % 3 == 0),
+            ops.take(600)
+        ).subscribe_(result.append, None, None, None, on_next_batch)
+
+        assert result == []
+        assert sum(batches, []) == [x * 2 for x in range(0, 1800, 3)]
+        assert len(batches) == 2
+
+    def test_range_count_sum(self):
+        assert rx.range(0, 5000).pipe(ops.count()).run() == 5000
+        assert rx.range(0, 5000).pipe(ops.sum()).run() == sum(range(5000))
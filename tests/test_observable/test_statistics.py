@@ -0,0 +1,107 @@
+import random
+import statistics
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+
+
+class TestStatistics(unittest.TestCase):
+
+    def test_variance(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(150, 1), on_next(210, 2), on_next(220, 4), on_next(230, 9),
+                                             on_completed(250))
+        res = scheduler.start(create=lambda: xs.pipe(ops.variance())).messages
+
+        assert res == [on_next(250, 13.0), on_completed(250)]
+
+    def test_standard_deviation_key_mapper(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 'a'), on_next(220, 'bbb'), on_completed(250))
+        res = scheduler.start(create=lambda: xs.pipe(ops.standard_deviation(len))).messages
+
+        assert res == [on_next(250, statistics.stdev([1, 3])), on_completed(250)]
+
+    def test_variance_empty(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(150, 1), on_completed(250))
+        res = scheduler.start(create=lambda: xs.pipe(ops.variance())).messages
+
+        assert len(res) == 1
+        assert res[0].value.kind == 'E' and res[0].time == 250
+
+    def test_variance_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_error(220, ex))
+        res = scheduler.start(create=lambda: xs.pipe(ops.variance())).messages
+
+        assert res == [on_error(220, ex)]
+
+    def test_quantile(self):
+        random.seed(42)
+        data = [random.random() for _ in range(20000)]
+        result = []
+
+        rx.from_(data).pipe(ops.quantile(0.9)).subscribe(result.append)
+        assert abs(result[0] - 0.9) < 0.01
+
+    def test_median_small(self):
+        result = []
+        rx.from_([5, 1, 3]).pipe(ops.median()).subscribe(result.append)
+        assert result == [3]
+
+    def test_statistics(self):
+        data = [3, 1, 4, 1, 5, 9, 2, 6]
+        result = []
+
+        rx.from_(data).pipe(ops.statistics([0.5])).subscribe(result.append)
+        stats = result[0]
+        assert stats.count == 8
+        assert stats.mean == statistics.mean(data)
+        assert abs(stats.variance - statistics.variance(data)) < 1e-9
+        assert stats.min == 1 and stats.max == 9
+        assert 2 <= stats.quantiles[0.5] <= 5
+
+    def test_running_statistics(self):
+        result = []
+        rx.from_([1, 2, 3]).pipe(ops.running_statistics()).subscribe(result.append)
+
+        assert [s.count for s in result] == [1, 2, 3]
+        assert [s.mean for s in result] == [1, 1.5, 2]
+        assert [s.max for s in result] == [1, 2, 3]
+
+    def test_rolling_statistics(self):
+        data = [4, 8, 1, 7, 3, 9, 2]
+        result = []
+        rx.from_(data).pipe(ops.rolling_statistics(3)).subscribe(result.append)
+
+        assert len(result) == len(data)
+        for i, stats in enumerate(result):
+            window = data[max(0, i - 2):i + 1]
+            assert stats.count == len(window)
+            assert abs(stats.mean - statistics.mean(window)) < 1e-9
+            assert stats.min == min(window) and stats.max == max(window)
+            if len(window) > 1:
+                assert abs(stats.variance - statistics.variance(window)) < 1e-9
+
+    def test_windowed_statistics(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 3), on_next(260, 10),
+                                             on_completed(290))
+
+        def create():
+            return xs.pipe(
+                ops.window_with_count(2),
+                ops.flat_map(lambda w: w.pipe(ops.statistics())),
+                ops.map(lambda s: s.mean))
+
+        res = scheduler.start(create=create).messages
+        assert res == [on_next(220, 2.0), on_next(290, 10.0), on_completed(290)]
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.concurrency.mainloopscheduler import AsyncIOScheduler
+from rx.internal.exceptions import InvalidOperationException
+from rx.subjects import Subject
+
+
+class TestToAsyncIterable(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_async_for(self):
+        async def go():
+            return [x async for x in rx.from_(range(5))]
+
+        assert self.loop.run_until_complete(go()) == [0, 1, 2, 3, 4]
+
+    def test_async_for_error(self):
+        ex = Exception('ex')
+
+        async def go():
+            result = []
+            try:
+                async for x in rx.from_([1, 2]).pipe(ops.concat(rx.throw(ex))):
+                    result.append(x)
+            except Exception as err:
+                return result, err
+
+        assert self.loop.run_until_complete(go()) == ([1, 2], ex)
+
+    def test_async_for_break_disposes(self):
+        subject = Subject()
+
+        async def go():
+            async for x in subject:
+                if x == 2:
+                    break
+
+        async def produce():
+            for i in range(5):
+                await asyncio.sleep(0)
+                subject.on_next(i)
+
+        async def main():
+            await asyncio.gather(go(), produce())
+
+        self.loop.run_until_complete(main())
+        assert len(subject.observers) == 0
+
+    def test_async_for_blocks_other_threads(self):
+        produced = []
+        release = threading.Event()
+
+        def on_subscribe(observer, scheduler):
+            def run():
+                for i in range(10):
+                    produced.append(i)
+                    observer.on_next(i)
+                observer.on_completed()
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+
+        async def go():
+            result = []
+            iterator = rx.create(on_subscribe).pipe(ops.to_async_iterable(2)).__aiter__()
+            result.append(await iterator.__anext__())
+            await asyncio.sleep(0.1)
+            assert len(produced) <= 4
+            async for x in iterator:
+                result.append(x)
+            return result
+
+        assert self.loop.run_until_complete(go()) == list(range(10))
+
+
+class TestFromAsyncIterable(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_from_async_iterable(self):
+        async def agen():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+
+        result = []
+        done = self.loop.create_future()
+
+        rx.from_async_iterable(agen(), AsyncIOScheduler(self.loop)).subscribe(result.append, done.set_exception, lambda: done.set_result(True))
+        self.loop.run_until_complete(done)
+        assert result == [0, 1, 2]
+
+    def test_from_async_iterable_pulls_lazily(self):
+        pulled = []
+
+        async def agen():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        async def go():
+            source = rx.from_async_iterable(agen()).pipe(ops.take(3))
+            return [x async for x in source]
+
+        assert self.loop.run_until_complete(go()) == [0, 1, 2]
+        assert len(pulled) == 3
+
+    def test_from_async_iterable_error(self):
+        ex = Exception('ex')
+
+        async def agen():
+            yield 1
+            raise ex
+
+        result = []
+        done = self.loop.create_future()
+
+        rx.from_async_iterable(agen(), AsyncIOScheduler(self.loop)).subscribe(result.append, done.set_result)
+        assert self.loop.run_until_complete(done) is ex
+        assert result == [1]
+
+    def test_from_async_iterable_observer_throws(self):
+        ex = Exception('ex')
+        pulled = []
+        done = self.loop.create_future()
+
+        async def agen():
+            for i in range(3):
+                pulled.append(i)
+                yield i
+
+        class ThrowingObserver:
+            def on_next(self, value):
+                raise ex
+
+            def on_error(self, error):
+                done.set_result(error)
+
+            def on_completed(self):
+                done.set_result(None)
+
+        source = rx.from_async_iterable(agen(), AsyncIOScheduler(self.loop))
+        source._subscribe_core(ThrowingObserver())
+        assert self.loop.run_until_complete(asyncio.wait_for(done, 5)) is ex
+        assert pulled == [0]
+
+    def test_from_async_iterable_requires_loop(self):
+        async def agen():
+            yield 1
+
+        errors = []
+        rx.from_async_iterable(agen()).subscribe(on_error=errors.append)
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], InvalidOperationException)
@@ -2,6 +2,7 @@ import unittest
 
 import rx
 from rx import operators as ops
+from rx.internal import BufferOverflowException
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -485,3 +486,59 @@ class TestZip(unittest.TestCase):
         assert results.messages == [on_next(210, 7), on_next(220, 7),
                                     on_next(230, 7), on_next(240, 7)]
         assert n1.subscriptions == [subscribe(200, 1000)]
+
+    def test_zip_max_buffer_drop_oldest(self):
+        scheduler = TestScheduler()
+        e1 = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_next(240, 4), on_completed(300))
+        e2 = scheduler.create_hot_observable(
+            on_next(250, 'a'), on_next(260, 'b'), on_completed(310))
+
+        def create():
+            return e1.pipe(ops.zip(e2, max_buffer=2, overflow='drop_oldest'))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(250, (3, 'a')), on_next(260, (4, 'b')), on_completed(310)]
+
+    def test_zip_max_buffer_error(self):
+        scheduler = TestScheduler()
+        e1 = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+        e2 = scheduler.create_hot_observable(on_next(250, 'a'), on_completed(310))
+
+        def create():
+            return e1.pipe(ops.zip(e2, max_buffer=2))
+
+        results = scheduler.start(create)
+        assert len(results.messages) == 1
+        assert results.messages[0].time == 230
+        assert isinstance(results.messages[0].value.exception, BufferOverflowException)
+
+    def test_zip_with_iterable_stops_pulling(self):
+        pulled = []
+        closed = []
+
+        def numbers():
+            try:
+                for i in range(100):
+                    pulled.append(i)
+                    yield i
+            finally:
+                closed.append(True)
+
+        source = rx.of(1, 2, 3).pipe(ops.zip_with_iterable(numbers()))
+        results = []
+        source.subscribe(results.append)
+
+        assert results == [(1, 0), (2, 1), (3, 2)]
+        assert pulled == [0, 1, 2]
+        assert closed == [True]
+
+    def test_zip_with_iterable_resubscribe(self):
+        source = rx.of(1, 2).pipe(ops.zip_with_iterable([3, 4]))
+        first = []
+        second = []
+
+        source.subscribe(first.append)
+        source.subscribe(second.append)
+        assert first == second == [(1, 3), (2, 4)]
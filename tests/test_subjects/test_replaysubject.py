@@ -622,3 +622,32 @@ def test_replay_subject_dies_out():
     assert results4.messages == [
         on_completed(900)]
 
+
+
+def test_replay_subject_buffer_size_only():
+    subject = ReplaySubject(buffer_size=3)
+    for i in range(100000):
+        subject.on_next(i)
+
+    results = []
+    subject.subscribe(results.append)
+    assert results == [99997, 99998, 99999]
+    assert subject.queue.times == []
+
+
+def test_replay_subject_window_trims_with_compaction():
+    scheduler = TestScheduler()
+    subject = ReplaySubject(buffer_size=150, window=100, scheduler=scheduler)
+
+    def emit(scheduler_, state):
+        subject.on_next(state)
+
+    for i in range(1000):
+        scheduler.schedule_absolute(i, emit, i)
+    scheduler.advance_to(999)
+
+    results = []
+    subject.subscribe(results.append)
+    scheduler.advance_by(1)
+    assert results == list(range(899, 1000))
+    assert len(subject.queue.times) < 300
@@ -356,3 +356,30 @@ def test_subject_create():
 
     s.on_completed()
     assert(not done)
+
+
+def test_subject_observer_snapshot():
+    s = Subject()
+    results = []
+
+    def observer(x):
+        results.append(x)
+
+    d1 = s.subscribe_(observer)
+    s.subscribe_(observer)
+    assert len(s.observers) == 2
+
+    s.on_next(1)
+    snapshot = s.observers
+    s.on_next(2)
+    assert s.observers is snapshot
+
+    d1.dispose()
+    d1.dispose()
+    assert len(s.observers) == 1
+
+    s.on_next(3)
+    assert results == [1, 1, 2, 2, 3]
+
+    s.on_completed()
+    assert s.observers == ()